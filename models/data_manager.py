@@ -4,11 +4,14 @@
 import os
 import json
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
 from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtWidgets import QMessageBox
 from utils.file_utils import safe_read_file, safe_write_file
-from utils.json_utils import safe_json_load, safe_json_dump, validate_json_schema
+from utils.json_utils import safe_json_load, safe_json_dump, validate_json_schema, strip_private_keys
 from ui.icons import resource_path
+from utils.path_utils import is_subpath
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,19 @@ class DataManager(QObject):
         super().__init__()
         self.data_file = data_file
         self.data = {}
+        # 标记当前变更是否已由内部方法增量更新了统计信息
+        self._counts_synced = False
+        # 批量修改嵌套层数及期间是否有数据变化
+        self._batch_depth = 0
+        self._batch_changed = False
+        # 数据版本号，每次数据变化时递增（界面据此判断是否需要重绘）
+        self.generation = 0
+        # 各级目录数量缓存及其对应的 (数据版本号, 数据对象)
+        self._level_counts = []
+        self._level_counts_key = None
+        
+        # 外部直接修改数据后发出的信号需要重建统计信息（先于界面刷新执行）
+        self.data_changed.connect(self._on_data_changed)
     
     def load(self):
         """加载书签数据"""
@@ -42,6 +58,8 @@ class DataManager(QObject):
                     
                     if valid:
                         self.data = json_data
+                        self.generation += 1
+                        self.rebuild_counts()
                         logger.info(f"从 {self.data_file} 加载了数据")
                     else:
                         logger.error(f"JSON 格式验证失败: {validation_error}")
@@ -87,8 +105,8 @@ class DataManager(QObject):
             )
             return
         
-        # 使用安全 JSON 序列化
-        json_success, json_data, json_error = safe_json_dump(self.data)
+        # 使用安全 JSON 序列化（统计字段只在内存中维护，不写入文件）
+        json_success, json_data, json_error = safe_json_dump(strip_private_keys(self.data))
         
         if not json_success:
             logger.error(f"序列化数据失败: {json_error}")
@@ -167,7 +185,190 @@ class DataManager(QObject):
             }
         }
         logger.info("已加载默认数据")
-        self.data_changed.emit()
+        self.rebuild_counts()
+        self._notify_changed()
+    
+    def begin_batch(self):
+        """开始批量修改，期间的数据变化不会立即发出信号"""
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """结束批量修改，如期间数据有变化则只发出一次信号"""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_changed:
+            self._batch_changed = False
+            self._notify_changed()
+    
+    @contextmanager
+    def batch(self):
+        """批量修改上下文：结束时只发出一次信号，如有变化只保存一次"""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            changed = self._batch_changed
+            self.end_batch()
+            if changed and self._batch_depth == 0:
+                self.save()
+    
+    def _notify_changed(self):
+        """发出数据变化信号（统计信息已由调用方增量更新）"""
+        if self._batch_depth:
+            # 批量修改中，推迟到 end_batch 时统一发出
+            self._batch_changed = True
+            return
+        self._counts_synced = True
+        try:
+            self.data_changed.emit()
+        finally:
+            self._counts_synced = False
+    
+    def _on_data_changed(self):
+        """数据变化处理：递增数据版本号，外部直接修改数据时重建统计信息"""
+        self.generation += 1
+        if not self._counts_synced:
+            self.rebuild_counts()
+    
+    def rebuild_counts(self):
+        """
+        重建所有文件夹的统计信息
+        
+        每个文件夹字典上维护 _subdir_count（下一级子目录数量）和
+        _url_count（所有下级网址数量），供界面以 O(1) 读取。
+        """
+        # 迭代后序遍历：子文件夹先于父文件夹统计，避免深层目录递归过深
+        stack = [(item, False) for item in self.data.values() if item["type"] == "folder"]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            folder, children_done = pop()
+            children = folder["children"]
+            if not children_done:
+                push((folder, True))
+                for v in children.values():
+                    if v["type"] == "folder":
+                        push((v, False))
+                continue
+            subdir_count, url_count = 0, 0
+            for v in children.values():
+                t = v["type"]
+                if t == "url":
+                    url_count += 1
+                elif t == "folder":
+                    subdir_count += 1
+                    url_count += v["_url_count"]
+            folder["_subdir_count"] = subdir_count
+            folder["_url_count"] = url_count
+    
+    def get_folder_counts(self, folder):
+        """
+        获取文件夹的统计信息
+        
+        Args:
+            folder: 文件夹数据字典
+            
+        Returns:
+            (下一级子目录数量, 所有下级网址数量) 元组
+        """
+        if "_url_count" not in folder or "_subdir_count" not in folder:
+            # 尚未统计（如外部新建且未发出信号的文件夹），就地补算
+            subdir_count = 0
+            url_count = 0
+            for v in folder["children"].values():
+                if v["type"] == "url":
+                    url_count += 1
+                elif v["type"] == "folder":
+                    subdir_count += 1
+                    url_count += self.get_folder_counts(v)[1]
+            folder["_subdir_count"] = subdir_count
+            folder["_url_count"] = url_count
+        return folder["_subdir_count"], folder["_url_count"]
+
+    def get_level_counts(self):
+        """
+        获取各级目录数量，按数据版本号缓存，数据未变化时直接返回
+        
+        Returns:
+            列表，第 i 项为第 i+1 级目录的数量
+        """
+        key = (self.generation, id(self.data))
+        if self._level_counts_key != key:
+            level_counts = defaultdict(int)
+            # 统计到的最深一级（空文件夹的下一级也计入，数量为0）
+            max_depth = 0
+            stack = [(self.data, 0)]
+            pop = stack.pop
+            push = stack.append
+            while stack:
+                items, depth = pop()
+                if depth > max_depth:
+                    max_depth = depth
+                for v in items.values():
+                    if v["type"] == "folder":
+                        level_counts[depth] += 1
+                        if v.get("_subdir_count") == 0:
+                            # 已知没有子文件夹，无需遍历其中的网址
+                            if depth + 1 > max_depth:
+                                max_depth = depth + 1
+                        else:
+                            push((v["children"], depth + 1))
+            self._level_counts = [level_counts[depth] for depth in range(max_depth + 1)]
+            self._level_counts_key = key
+        return self._level_counts
+    
+    def get_total_url_count(self, items=None):
+        """
+        获取所有下级网址数量（利用文件夹上缓存的统计信息，只遍历一层）
+        
+        Args:
+            items: 子项字典，默认为根目录
+        """
+        if items is None:
+            items = self.data
+        count = 0
+        for v in items.values():
+            t = v["type"]
+            if t == "url":
+                count += 1
+            elif t == "folder":
+                count += self.get_folder_counts(v)[1]
+        return count
+
+    def _get_folder_chain(self, path):
+        """获取路径上的所有文件夹字典（从根到末端）"""
+        chain = []
+        current = self.data
+        for segment in path:
+            folder = current.get(segment)
+            if folder is None or folder["type"] != "folder":
+                return []
+            chain.append(folder)
+            current = folder["children"]
+        return chain
+    
+    def _adjust_counts(self, path, url_delta, subdir_delta=0):
+        """
+        沿路径增量更新统计信息
+        
+        Args:
+            path: 发生变化的父文件夹路径
+            url_delta: 网址数量变化量（作用于路径上的所有文件夹）
+            subdir_delta: 子目录数量变化量（只作用于直接父文件夹）
+        """
+        chain = self._get_folder_chain(path)
+        for folder in chain:
+            folder["_url_count"] = folder.get("_url_count", 0) + url_delta
+        if chain and subdir_delta:
+            parent = chain[-1]
+            parent["_subdir_count"] = parent.get("_subdir_count", 0) + subdir_delta
+    
+    def _item_url_count(self, item):
+        """获取项目包含的网址数量"""
+        if item["type"] == "url":
+            return 1
+        return self.get_folder_counts(item)[1]
     
     def get_item_at_path(self, path):
         """获取指定路径的项目"""
@@ -225,11 +426,14 @@ class DataManager(QObject):
         
         parent[name] = {
             "type": "folder",
-            "children": {}
+            "children": {},
+            "_subdir_count": 0,
+            "_url_count": 0
         }
+        self._adjust_counts(path, 0, 1)
         
         logger.info(f"已添加文件夹: {name} 到 {'/'.join(path)}")
-        self.data_changed.emit()
+        self._notify_changed()
         return True
     
     def add_url(self, path, name, url, icon=""):
@@ -252,9 +456,10 @@ class DataManager(QObject):
             "name": name,
             "icon": standardized_icon
         }
+        self._adjust_counts(path, 1)
         
         logger.info(f"已添加URL: {name} ({url}) 到 {'/'.join(path)}")
-        self.data_changed.emit()
+        self._notify_changed()
         return True
     
     def update_item(self, path, old_name, new_name, item_data):
@@ -293,7 +498,7 @@ class DataManager(QObject):
         parent[new_name] = item
         
         logger.info(f"已更新项目: {old_name} -> {new_name}")
-        self.data_changed.emit()
+        self._notify_changed()
         return True
     
     def delete_item(self, path, name):
@@ -307,10 +512,11 @@ class DataManager(QObject):
             logger.error(f"项目不存在: {name}")
             return False
         
-        del parent[name]
+        item = parent.pop(name)
+        self._adjust_counts(path, -self._item_url_count(item), -1 if item["type"] == "folder" else 0)
         
         logger.info(f"已删除项目: {name} 从 {'/'.join(path)}")
-        self.data_changed.emit()
+        self._notify_changed()
         return True
     
     def move_item(self, source_path, source_name, target_path):
@@ -341,23 +547,22 @@ class DataManager(QObject):
             full_source_path = source_path + [source_name]
             
             # 检查目标路径是否是源路径的子路径
-            if len(target_path) >= len(full_source_path):
-                is_subpath = True
-                for i in range(len(full_source_path)):
-                    if full_source_path[i] != target_path[i]:
-                        is_subpath = False
-                        break
-                
-                if is_subpath:
-                    logger.error("不能将文件夹移动到其子文件夹中")
-                    return False
+            if is_subpath(target_path, full_source_path):
+                logger.error("不能将文件夹移动到其子文件夹中")
+                return False
         
         # 移动项目
         item = source_parent.pop(source_name)
         target_parent[source_name] = item
         
+        # 源和目标路径上的统计信息分别减去、加上移动的子树
+        url_delta = self._item_url_count(item)
+        subdir_delta = 1 if item["type"] == "folder" else 0
+        self._adjust_counts(source_path, -url_delta, -subdir_delta)
+        self._adjust_counts(target_path, url_delta, subdir_delta)
+        
         logger.info(f"已移动项目: {source_name} 从 {'/'.join(source_path)} 到 {'/'.join(target_path)}")
-        self.data_changed.emit()
+        self._notify_changed()
         return True
     
     def search(self, query):
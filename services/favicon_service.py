@@ -4,12 +4,13 @@
 import os
 import re
 import logging
+import threading
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from PIL import Image
 from io import BytesIO
-from ui.icons import resource_path
+from ui.icons import resource_path, icon_provider
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,9 @@ class FaviconService:
         # 添加默认超时设置
         self.timeout = 10  # 默认超时10秒
         
+        # 图标可能由多个线程并发下载，写入缓存文件时加锁，避免同一域名的文件被同时写入
+        self._cache_write_lock = threading.Lock()
+        
         # 保存应用根目录，用于生成相对路径
         self.app_root = os.path.abspath(".")
         
@@ -110,13 +114,21 @@ class FaviconService:
         try:
             response = self.session.get(icon_url, stream=True, timeout=self.timeout)
             if response.status_code == 200:
-                # 保存到缓存
-                with open(cached_path, 'wb') as f:
-                    for chunk in response.iter_content(1024):
-                        f.write(chunk)
+                # 先在锁外读取响应内容，再加锁保存到缓存：
+                # 写入临时文件后原子替换，读取方不会看到写了一半的图标
+                content = response.content
+                with self._cache_write_lock:
+                    tmp_path = f"{cached_path}.tmp"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(content)
+                    os.replace(tmp_path, cached_path)
                 
                 logger.info(f"图标已保存到: {cached_path}")
-                return self._convert_to_relative_path(cached_path)
+                icon_path = self._convert_to_relative_path(cached_path)
+                # 图标文件已新建或被覆盖，移除旧的缓存图标和不存在记录
+                icon_provider.invalidate_icon(cached_path)
+                icon_provider.invalidate_icon(icon_path)
+                return icon_path
         except Exception as e:
             logger.error(f"下载图标失败: {e}")
         
@@ -9,6 +9,7 @@ import json
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 from PyQt5.QtCore import QObject, pyqtSignal
+from utils.json_utils import strip_private_keys
 
 logger = logging.getLogger(__name__)
 
@@ -726,9 +727,8 @@ class ImportExportService(QObject):
         try:
             self.export_progress.emit(0, "正在准备导出...")
             
-            # 复制数据以避免修改原数据
-            import copy
-            export_data = copy.deepcopy(self.data_manager.data)
+            # 复制数据以避免修改原数据（同时去除内存中的统计字段）
+            export_data = strip_private_keys(self.data_manager.data)
             
             self.export_progress.emit(50, "正在写入JSON文件...")
             
@@ -768,10 +768,9 @@ class ImportExportService(QObject):
                 self.export_progress.emit(100, f"导出失败: 找不到指定文件夹")
                 return 0
             
-            # 复制数据以避免修改原数据
-            import copy
+            # 复制数据以避免修改原数据（同时去除内存中的统计字段）
             folder_name = folder_path[-1]
-            export_data = {folder_name: copy.deepcopy(folder_data)}
+            export_data = {folder_name: strip_private_keys(folder_data)}
             
             self.export_progress.emit(50, "正在写入JSON文件...")
             
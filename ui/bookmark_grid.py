@@ -23,6 +23,7 @@ from PyQt5 import QtCore, QtGui
 from ui.dialogs import EditUrlDialog, EditFolderDialog
 from ui.icons import icon_provider
 from utils.url_utils import validate_url
+from utils.path_utils import is_subpath
 from utils.language_manager import language_manager
 
 # 设置日志级别为DEBUG
@@ -34,7 +35,7 @@ class BookmarkGridWidget(QScrollArea):
     
     # 定义信号
     navigate_to = pyqtSignal(list)
-    selection_changed = pyqtSignal()  # 新增：选中项变化信号
+    selection_changed = pyqtSignal(int, int)  # 选中项变化信号，参数为(网址数, 文件夹数)
     
     def __init__(self, data_manager, favicon_service):
         super().__init__()
@@ -267,6 +268,7 @@ class BookmarkGridWidget(QScrollArea):
         
         # 添加项目到网格
         self._item_widgets = []  # 记录所有item widget及其(name, type)
+        self._item_widgets_by_name = {}  # 名称到item widget的索引
         row, col = 0, 0
         folders = [(name, item) for name, item in current_items.items() if item["type"] == "folder"]
         if self.sort_mode == 'name':
@@ -276,6 +278,7 @@ class BookmarkGridWidget(QScrollArea):
         for name, item in folders:
             w = self._add_item_to_grid(name, item, row, col, max_cols)
             self._item_widgets.append((w, name, item["type"]))
+            self._item_widgets_by_name[name] = w
             col += 1
             if col >= max_cols:
                 col = 0
@@ -288,6 +291,7 @@ class BookmarkGridWidget(QScrollArea):
         for name, item in urls:
             w = self._add_item_to_grid(name, item, row, col, max_cols)
             self._item_widgets.append((w, name, item["type"]))
+            self._item_widgets_by_name[name] = w
             col += 1
             if col >= max_cols:
                 col = 0
@@ -383,7 +387,9 @@ class BookmarkGridWidget(QScrollArea):
             # 单选
             self.selected_items = [(name, typ)]
             self.last_selected_index = idx
-        self.selection_changed.emit()  # 新增：每次选中项变化时发射信号
+        # 每次选中项变化时发射信号，附带选中的网址/文件夹数量，接收方无需再遍历选中项
+        url_count = sum(1 for _, t in self.selected_items if t == "url")
+        self.selection_changed.emit(url_count, len(self.selected_items) - url_count)
         self.refresh()
 
     def _add_new_item_button(self, row, col, max_cols):
@@ -1192,16 +1198,10 @@ class BookmarkGridWidget(QScrollArea):
                     return
                 if source_type == "folder":
                     source_full_path = source_path + [source_name]
-                    if len(self.current_path) >= len(source_full_path):
-                        is_subpath = True
-                        for i in range(len(source_full_path)):
-                            if i >= len(self.current_path) or source_full_path[i] != self.current_path[i]:
-                                is_subpath = False
-                                break
-                        if is_subpath:
-                            QMessageBox.warning(self, "移动失败", "不能将文件夹移动到其子文件夹中")
-                            event.ignore()
-                            return
+                    if is_subpath(self.current_path, source_full_path):
+                        QMessageBox.warning(self, "移动失败", "不能将文件夹移动到其子文件夹中")
+                        event.ignore()
+                        return
                 success = self.data_manager.move_item(source_path, source_name, self.current_path)
                 if success:
                     logger.debug("移动成功")
@@ -1237,17 +1237,10 @@ class BookmarkGridWidget(QScrollArea):
                         # 检查目标路径是否是源路径的子路径
                         if data["item"]["type"] == "folder":
                             source_full_path = source_path + [source_name]
-                            if len(self.current_path) >= len(source_full_path):
-                                is_subpath = True
-                                for i in range(len(source_full_path)):
-                                    if i >= len(self.current_path) or source_full_path[i] != self.current_path[i]:
-                                        is_subpath = False
-                                        break
-                                
-                                if is_subpath:
-                                    QMessageBox.warning(self, "移动失败", "不能将文件夹移动到其子文件夹中")
-                                    event.ignore()
-                                    return
+                            if is_subpath(self.current_path, source_full_path):
+                                QMessageBox.warning(self, "移动失败", "不能将文件夹移动到其子文件夹中")
+                                event.ignore()
+                                return
                         
                         # 移动项目
                         success = self.data_manager.move_item(source_path, source_name, self.current_path)
@@ -1,17 +1,46 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import re
+import sys
 import logging
+import itertools
+from collections import deque
 from PyQt5.QtWidgets import (
     QTreeWidget, QTreeWidgetItem, QMenu, QAction, 
     QMessageBox, QInputDialog, QPushButton
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint
-from PyQt5.QtGui import QIcon, QDrag, QPixmap, QPainter, QColor, QCursor
+from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QEvent, QTimer
+from PyQt5.QtGui import QIcon, QDrag, QPixmap, QPainter, QColor, QCursor, QFont
 from ui.icons import icon_provider
+from utils.path_utils import is_subpath
 
 logger = logging.getLogger(__name__)
 
+# 书签数据字段名（驻留字符串，用于遍历时的字典查找）
+_TYPE = sys.intern("type")
+_URL = sys.intern("url")
+_FOLDER = sys.intern("folder")
+_CHILDREN = sys.intern("children")
+_ICON = sys.intern("icon")
+
+def _unique_copy_name(existing, source_name):
+    """在已有名称集合中为粘贴的项目生成不重复的名称"""
+    if source_name not in existing:
+        return source_name
+    # 一次扫描收集已占用的复制序号：无序号的“ - 复制”记为 1，
+    # 带序号的名称从 (2) 开始编号，“ (1)”或带前导零的序号不占用任何序号
+    base = f"{source_name} - 复制"
+    pattern = re.compile(rf"{re.escape(base)}(?: \(([2-9]|[1-9]\d+)\))?$")
+    taken = set()
+    for key in existing:
+        if key.startswith(base):
+            match = pattern.match(key)
+            if match:
+                taken.add(int(match.group(1)) if match.group(1) else 1)
+    i = next(i for i in itertools.count(1) if i not in taken)
+    return base if i == 1 else f"{base} ({i})"
+
 class FolderTreeWidget(QTreeWidget):
     """文件夹树视图"""
     
@@ -25,12 +54,30 @@ class FolderTreeWidget(QTreeWidget):
         self.data_manager = data_manager
         self.clipboard_data = None  # 用于保存复制的项目数据
         self.main_window = None  # 存储主窗口引用
+        self._populated_paths = set()  # 已创建子项的文件夹路径（子项在展开时延迟创建）
+        self._root_font = self._build_root_font()  # 放大后的树项目字体（缓存）
+        self._refresh_pending = False  # 是否已安排延迟刷新
+        self._current_root = None  # 当前单独显示的根目录
+        self._rendered_generation = None  # 上次显示根目录时的数据版本号
         
         self.init_ui()
         
         # 连接数据变化信号
         self.data_manager.data_changed.connect(self.refresh)
     
+    def _build_root_font(self):
+        """根据控件字体生成放大1.3倍的树项目字体"""
+        font = QFont(self.font())
+        font.setPointSizeF(font.pointSizeF() * 1.3)
+        return font
+    
+    def changeEvent(self, event):
+        """控件字体变化时重建缓存的字体并刷新"""
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._root_font = self._build_root_font()
+            self._schedule_refresh()
+    
     def init_ui(self):
         """初始化UI"""
         # 设置树控件属性
@@ -40,16 +87,37 @@ class FolderTreeWidget(QTreeWidget):
         self.setDropIndicatorShown(True)
         self.setDragDropMode(QTreeWidget.InternalMove)
         
+        # 设置列（名称 + 统计信息），只需设置一次
+        self.setColumnCount(2)
+        self.header().setSectionResizeMode(0, self.header().ResizeToContents)
+        self.header().setSectionResizeMode(1, self.header().Fixed)
+        self.setColumnWidth(1, 70)
+        self.header().setDefaultAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        
         # 设置上下文菜单
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
         
         # 连接项目点击信号
         self.itemClicked.connect(self._on_item_clicked)
+        # 展开时再创建子文件夹项目
+        self.itemExpanded.connect(self._populate_children)
         
         # 刷新显示
         self.refresh()
     
+    def _schedule_refresh(self):
+        """安排在事件循环空闲时刷新，同一轮事件中的多次请求只刷新一次"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh_once)
+    
+    def _do_refresh_once(self):
+        """执行已安排的刷新"""
+        self._refresh_pending = False
+        self.refresh()
+    
     def refresh(self):
         """刷新显示"""
         # 保存当前选中的路径
@@ -65,7 +133,7 @@ class FolderTreeWidget(QTreeWidget):
         # 清除所有项目
         self.clear()
         # 获取所有根目录名
-        root_names = [name for name, item in self.data_manager.data.items() if item["type"] == "folder"]
+        root_names = [name for name, item in self.data_manager.data.items() if item[_TYPE] == _FOLDER]
         # 渲染根目录按钮
         for name in root_names:
             btn = QPushButton(name)
@@ -83,30 +151,19 @@ class FolderTreeWidget(QTreeWidget):
     def _show_all_roots(self, select_path=None):
         """显示所有根目录下内容"""
         self.clear()
-        self.setColumnCount(2)
-        self.header().setSectionResizeMode(0, self.header().ResizeToContents)
-        self.header().setSectionResizeMode(1, self.header().Fixed)
-        self.setColumnWidth(1, 70)
-        self.header().setDefaultAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        self._populated_paths.clear()
+        self._current_root = None
         
-        # 遍历并显示所有根目录
+        # 遍历并显示所有根目录（创建完成后一次性添加到树中）
+        root_items = []
         for root_name, item in sorted(self.data_manager.data.items()):
-            if item["type"] != "folder":
+            if item[_TYPE] != _FOLDER:
                 continue
                 
-            tree_item = QTreeWidgetItem(self)
-            # 统计下一级子目录和所有下级网址卡片数量
-            children = item["children"]
-            subdir_count = sum(1 for v in children.values() if v["type"] == "folder")
-            def count_urls(d):
-                cnt = 0
-                for v in d.values():
-                    if v["type"] == "url":
-                        cnt += 1
-                    elif v["type"] == "folder":
-                        cnt += count_urls(v["children"])
-                return cnt
-            url_count = count_urls(children)
+            tree_item = QTreeWidgetItem()
+            root_items.append(tree_item)
+            # 统计下一级子目录和所有下级网址卡片数量（由数据管理器维护）
+            subdir_count, url_count = self.data_manager.get_folder_counts(item)
             # 格式化显示
             if subdir_count > 0:
                 stat_text = f"{subdir_count}类{url_count}个"
@@ -117,32 +174,29 @@ class FolderTreeWidget(QTreeWidget):
             tree_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
             tree_item.setIcon(0, icon_provider.get_icon("folder"))
             tree_item.setData(0, Qt.UserRole, {"path": [], "name": root_name, "item": item})
-            font = tree_item.font(0)
-            font.setPointSizeF(font.pointSizeF() * 1.3)
-            tree_item.setFont(0, font)
-            self._add_folder_items(tree_item, item["children"], [root_name], font)
+            tree_item.setFont(0, self._root_font)
+            self._add_folder_items(tree_item, item[_CHILDREN], [root_name], self._root_font)
+        self.addTopLevelItems(root_items)
         
         # 恢复选中状态
         if select_path:
             self.select_path(select_path)
     
     def _add_folder_items(self, parent_item, items, path, font=None):
-        """递归添加文件夹项目"""
+        """添加一级文件夹项目，更深层的子项在展开时再创建"""
+        self._populated_paths.add(tuple(path))
+        # 循环内用到的方法和常量先绑定到局部变量
+        get_folder_counts = self.data_manager.get_folder_counts
+        folder_icon = icon_provider.get_icon("folder")
+        stat_alignment = Qt.AlignRight | Qt.AlignVCenter
+        # 先创建无父项的项目，最后一次性添加，只触发一次插入通知
+        pending = []
         for name, item in items.items():
-            if item["type"] == "folder":
-                tree_item = QTreeWidgetItem(parent_item)
-                # 统计下一级子目录和所有下级网址卡片数量
-                children = item["children"]
-                subdir_count = sum(1 for v in children.values() if v["type"] == "folder")
-                def count_urls(d):
-                    cnt = 0
-                    for v in d.values():
-                        if v["type"] == "url":
-                            cnt += 1
-                        elif v["type"] == "folder":
-                            cnt += count_urls(v["children"])
-                    return cnt
-                url_count = count_urls(children)
+            if item[_TYPE] == _FOLDER:
+                tree_item = QTreeWidgetItem()
+                pending.append(tree_item)
+                # 统计下一级子目录和所有下级网址卡片数量（由数据管理器维护）
+                subdir_count, url_count = get_folder_counts(item)
                 # 格式化显示
                 if subdir_count > 0:
                     stat_text = f"{subdir_count}类{url_count}个"
@@ -150,14 +204,27 @@ class FolderTreeWidget(QTreeWidget):
                     stat_text = f"{url_count}个"
                 tree_item.setText(0, name)
                 tree_item.setText(1, stat_text)
-                tree_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-                tree_item.setIcon(0, icon_provider.get_icon("folder"))
+                tree_item.setTextAlignment(1, stat_alignment)
+                tree_item.setIcon(0, folder_icon)
                 tree_item.setData(0, Qt.UserRole, {"path": path, "name": name, "item": item})
                 # 设置字体
                 if font is not None:
                     tree_item.setFont(0, font)
-                # 递归添加子项目
-                self._add_folder_items(tree_item, item["children"], path + [name], font)
+                # 有子文件夹时先显示展开标记，子项目在展开时创建
+                if subdir_count > 0:
+                    tree_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        if pending:
+            parent_item.addChildren(pending)
+    
+    def _populate_children(self, tree_item):
+        """按需创建文件夹项目的子项（展开或查找路径时调用）"""
+        data = tree_item.data(0, Qt.UserRole)
+        if not data:
+            return
+        path = data["path"] + [data["name"]]
+        if tuple(path) in self._populated_paths:
+            return
+        self._add_folder_items(tree_item, data["item"][_CHILDREN], path, self._root_font)
     
     def _on_item_clicked(self, item, column):
         """处理项目点击事件"""
@@ -372,11 +439,15 @@ class FolderTreeWidget(QTreeWidget):
         # 查找匹配的项目
         item = self._find_item_by_path(path)
         if item:
-            # 展开所有父项目
-            parent = item
-            while parent:
-                parent.setExpanded(True)
-                parent = parent.parent()
+            # 展开所有父项目（暂停重绘，展开完成后只重新布局一次）
+            self.setUpdatesEnabled(False)
+            try:
+                parent = item
+                while parent:
+                    parent.setExpanded(True)
+                    parent = parent.parent()
+            finally:
+                self.setUpdatesEnabled(True)
             
             # 选择并滚动到该项目
             self.setCurrentItem(item)
@@ -409,6 +480,7 @@ class FolderTreeWidget(QTreeWidget):
         # 递归查找子路径
         for i in range(1, len(path)):
             found = False
+            self._populate_children(target_item)
             for j in range(target_item.childCount()):
                 child = target_item.child(j)
                 if child.text(0) == path[i]:
@@ -440,29 +512,22 @@ class FolderTreeWidget(QTreeWidget):
             if target_item:
                 # 只有文件夹可以作为拖放目标
                 data = target_item.data(0, Qt.UserRole)
-                if data and data["item"]["type"] == "folder":
+                if data and data["item"][_TYPE] == _FOLDER:
                     # 检查是否将文件夹拖动到自己或其子文件夹
                     source_item = self.currentItem()
                     if source_item:
                         source_data = source_item.data(0, Qt.UserRole)
                         if source_data:
                             # 只有当源是文件夹时才需要检查
-                            if source_data["item"]["type"] == "folder":
+                            if source_data["item"][_TYPE] == _FOLDER:
                                 # 检查目标是否是源的子文件夹
                                 source_path = source_data["path"] + [source_data["name"]]
                                 target_path = data["path"] + [data["name"]]
                                 
                                 # 检查目标路径是否是源路径的子路径
-                                if len(target_path) >= len(source_path):
-                                    is_subpath = True
-                                    for i in range(len(source_path)):
-                                        if i >= len(target_path) or source_path[i] != target_path[i]:
-                                            is_subpath = False
-                                            break
-                                    
-                                    if is_subpath:
-                                        event.ignore()
-                                        return
+                                if is_subpath(target_path, source_path):
+                                    event.ignore()
+                                    return
                     
                     event.acceptProposedAction()
                 else:
@@ -475,7 +540,7 @@ class FolderTreeWidget(QTreeWidget):
             target_item = self.itemAt(event.pos())
             if target_item:
                 data = target_item.data(0, Qt.UserRole)
-                if data and data["item"]["type"] == "folder":
+                if data and data["item"][_TYPE] == _FOLDER:
                         event.acceptProposedAction()
                 else:
                     event.ignore()
@@ -633,6 +698,14 @@ class FolderTreeWidget(QTreeWidget):
         # 调用父类的事件处理
         super().mousePressEvent(event)
 
+    def _show_success(self, title, message):
+        """显示操作成功提示，优先使用主窗口状态栏以免弹出模态对话框"""
+        status_bar = getattr(self.main_window, 'status_bar', None) if self.main_window else None
+        if status_bar:
+            status_bar.showMessage(message, 3000)
+        else:
+            QMessageBox.information(self, title, message)
+    
     def _add_root_folder(self):
         """添加根文件夹"""
         name, ok = QInputDialog.getText(self, "添加文件夹", "请输入文件夹名称:")
@@ -652,7 +725,7 @@ class FolderTreeWidget(QTreeWidget):
             "name": data["name"],
             "type": "folder"
         }
-        QMessageBox.information(self, "复制成功", f"已复制文件夹 {data['name']} 到剪贴板")
+        self._show_success("复制成功", f"已复制文件夹 {data['name']} 到剪贴板")
     
     def _paste_item(self, target_data):
         """将剪贴板中的项目粘贴到目标文件夹"""
@@ -663,19 +736,10 @@ class FolderTreeWidget(QTreeWidget):
         source_name = self.clipboard_data["name"]
         target_path = target_data["path"] + [target_data["name"]]
         
-        # 检查是否为粘贴到自己或子文件夹中
+        # 检查是否为粘贴到自己或子文件夹中（元组前缀比较）
         if self.clipboard_data["type"] == "folder":
-            source_full_path = source_path + [source_name]
-            is_subpath = False
-            
-            if len(target_path) >= len(source_full_path):
-                is_subpath = True
-                for i in range(len(source_full_path)):
-                    if source_full_path[i] != target_path[i]:
-                        is_subpath = False
-                        break
-            
-            if is_subpath:
+            source_full_path = tuple(source_path) + (source_name,)
+            if is_subpath(target_path, source_full_path):
                 QMessageBox.warning(self, "粘贴失败", "不能将文件夹粘贴到自己或其子文件夹中")
                 return
         
@@ -689,296 +753,25 @@ class FolderTreeWidget(QTreeWidget):
         
         # 检查目标是否已存在同名项目
         target_items = self.data_manager.get_item_at_path(target_path)
-        if source_name in target_items:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in target_items:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, target_path, new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                target_path,
-                new_name,
-                item["url"],
-                item.get("icon", "")
-            )
-        
-        if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到目标文件夹")
-        else:
-            QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
-    
-    def _paste_item_to_root(self):
-        """将剪贴板中的项目粘贴到根目录"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        
-        # 检查是否已经在根目录
-        if not source_path:
-            QMessageBox.warning(self, "粘贴失败", "项目已经在根目录")
-            return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查根目录是否已存在同名项目
-        if source_name in self.data_manager.data:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in self.data_manager.data:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, [], new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                [], new_name, item["url"], item.get("icon", "")
-            )
-        
-        if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到根目录")
-        else:
-            QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
-    
-    def _copy_folder_recursive(self, source_path, source_name, target_path, new_name):
-        """递归复制文件夹及其内容"""
-        # 创建目标文件夹
-        success = self.data_manager.add_folder(target_path, new_name)
-        if not success:
-            return False
-        
-        # 获取源文件夹的子项目
-        source_children_path = source_path + [source_name]
-        source_children = self.data_manager.get_item_at_path(source_children_path)
-        if not source_children:
-            return True  # 空文件夹复制成功
-        
-        # 复制子项目
-        target_children_path = target_path + [new_name]
-        for child_name, child_item in source_children.items():
-            if child_item["type"] == "folder":
-                # 递归复制子文件夹
-                self._copy_folder_recursive(source_children_path, child_name, target_children_path, child_name)
+        # 如果存在同名项目，添加复制标记
+        new_name = _unique_copy_name(target_items, source_name)
+        
+        # 根据类型执行不同的复制操作（批量修改，完成后只刷新和保存一次）
+        with self.data_manager.batch():
+            if item[_TYPE] == _FOLDER:
+                # 递归复制文件夹
+                success = self._copy_folder_recursive(source_path, source_name, target_path, new_name)
             else:  # url
                 # 复制URL
-                self.data_manager.add_url(
-                    target_children_path,
-                    child_name,
-                    child_item["url"],
-                    child_item.get("icon", "")
+                success = self.data_manager.add_url(
+                    target_path,
+                    new_name,
+                    item[_URL],
+                    item.get(_ICON, "")
                 )
         
-        return True
-
-    def set_root_bar(self, bar):
-        self.external_root_bar = bar
-        self.refresh()
-
-    def _create_root_shower(self, name):
-        """创建根目录显示器，避免lambda闭包问题
-        
-        Args:
-            name: 根目录名称
-            
-        Returns:
-            callable: 用于连接到按钮点击事件的函数
-        """
-        def shower(checked=False):
-            self._show_root(name)
-        return shower
-    
-    def _show_root(self, root_name, select_path=None):
-        """只显示指定根目录下内容"""
-        self.clear()
-        item = self.data_manager.data.get(root_name)
-        if not item or item["type"] != "folder":
-            return
-        tree_item = QTreeWidgetItem(self)
-        # 统计下一级子目录和所有下级网址卡片数量
-        children = item["children"]
-        subdir_count = sum(1 for v in children.values() if v["type"] == "folder")
-        def count_urls(d):
-            cnt = 0
-            for v in d.values():
-                if v["type"] == "url":
-                    cnt += 1
-                elif v["type"] == "folder":
-                    cnt += count_urls(v["children"])
-            return cnt
-        url_count = count_urls(children)
-        if subdir_count > 0:
-            stat_text = f"{subdir_count}类{url_count}个"
-        else:
-            stat_text = f"{url_count}个"
-        tree_item.setText(0, root_name)
-        tree_item.setText(1, stat_text)
-        tree_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-        tree_item.setIcon(0, icon_provider.get_icon("folder"))
-        tree_item.setData(0, Qt.UserRole, {"path": [], "name": root_name, "item": item})
-        font = tree_item.font(0)
-        font.setPointSizeF(font.pointSizeF() * 1.3)
-        tree_item.setFont(0, font)
-        self._add_folder_items(tree_item, item["children"], [root_name], font)
-        self.setColumnCount(2)
-        self.header().setSectionResizeMode(0, self.header().ResizeToContents)
-        self.header().setSectionResizeMode(1, self.header().Fixed)
-        self.setColumnWidth(1, 70)
-        self.header().setDefaultAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self._current_root = root_name
-        # 恢复选中状态
-        if select_path:
-            self.select_path(select_path)
-
-    def set_main_window(self, main_window):
-        """设置主窗口引用"""
-        self.main_window = main_window
-        
-    def set_locked_state(self, locked):
-        """设置锁定状态
-        
-        Args:
-            locked: 是否锁定
-        """
-        self.is_locked = locked
-        logger.debug(f"文件夹树锁定状态: {locked}")
-        
-        # 更新右键菜单策略
-        if locked:
-            # 锁定状态下禁用右键菜单
-            self.setContextMenuPolicy(Qt.NoContextMenu)
-        else:
-            # 解锁状态下恢复原有右键菜单
-            self.setContextMenuPolicy(Qt.CustomContextMenu)
-        
-        # 刷新视图
-        self.refresh()
-
-    def mousePressEvent(self, event):
-        """处理鼠标按下事件，允许点击空白区域取消选择"""
-        # 获取点击位置的项目
-        item = self.itemAt(event.pos())
-        
-        # 如果点击在空白区域，清除选择
-        if item is None:
-            self.clearSelection()
-            # 发送清除选择信号
-            self.selection_cleared.emit()
-            # 如果当前有选中的项目，发送路径变化信号，传递空路径
-            if self.currentItem():
-                self.setCurrentItem(None)
-                self.path_changed.emit([])  # 返回根目录
-        
-        # 调用父类的事件处理
-        super().mousePressEvent(event)
-
-    def _add_root_folder(self):
-        """添加根文件夹"""
-        name, ok = QInputDialog.getText(self, "添加文件夹", "请输入文件夹名称:")
-        if ok and name:
-            success = self.data_manager.add_folder([], name)
-            
-            if success:
-                self.data_manager.save()
-            else:
-                QMessageBox.warning(self, "添加失败", "无法添加文件夹，可能是名称已存在")
-
-    def _copy_folder(self, data):
-        """复制文件夹"""
-        # 保存复制的项目数据
-        self.clipboard_data = {
-            "path": data["path"],
-            "name": data["name"],
-            "type": "folder"
-        }
-        QMessageBox.information(self, "复制成功", f"已复制文件夹 {data['name']} 到剪贴板")
-    
-    def _paste_item(self, target_data):
-        """将剪贴板中的项目粘贴到目标文件夹"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        target_path = target_data["path"] + [target_data["name"]]
-        
-        # 检查是否为粘贴到自己或子文件夹中
-        if self.clipboard_data["type"] == "folder":
-            source_full_path = source_path + [source_name]
-            is_subpath = False
-            
-            if len(target_path) >= len(source_full_path):
-                is_subpath = True
-                for i in range(len(source_full_path)):
-                    if source_full_path[i] != target_path[i]:
-                        is_subpath = False
-                        break
-            
-            if is_subpath:
-                QMessageBox.warning(self, "粘贴失败", "不能将文件夹粘贴到自己或其子文件夹中")
-                return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查目标是否已存在同名项目
-        target_items = self.data_manager.get_item_at_path(target_path)
-        if source_name in target_items:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in target_items:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, target_path, new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                target_path,
-                new_name,
-                item["url"],
-                item.get("icon", "")
-            )
-        
         if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到目标文件夹")
+            self._show_success("粘贴成功", f"已粘贴项目 {source_name} 到目标文件夹")
         else:
             QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
     
@@ -1004,65 +797,66 @@ class FolderTreeWidget(QTreeWidget):
         item = source_item[source_name]
         
         # 检查根目录是否已存在同名项目
-        if source_name in self.data_manager.data:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in self.data_manager.data:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, [], new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                [], new_name, item["url"], item.get("icon", "")
-            )
+        # 如果存在同名项目，添加复制标记
+        new_name = _unique_copy_name(self.data_manager.data, source_name)
+        
+        # 根据类型执行不同的复制操作（批量修改，完成后只刷新和保存一次）
+        with self.data_manager.batch():
+            if item[_TYPE] == _FOLDER:
+                # 递归复制文件夹
+                success = self._copy_folder_recursive(source_path, source_name, [], new_name)
+            else:  # url
+                # 复制URL
+                success = self.data_manager.add_url(
+                    [], new_name, item[_URL], item.get(_ICON, "")
+                )
         
         if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到根目录")
+            self._show_success("粘贴成功", f"已粘贴项目 {source_name} 到根目录")
         else:
             QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
     
     def _copy_folder_recursive(self, source_path, source_name, target_path, new_name):
-        """递归复制文件夹及其内容"""
+        """复制文件夹及其内容
+        
+        使用显式栈迭代复制各级子文件夹，内部使用元组保存路径，
+        只在调用数据管理器时转换为列表
+        """
         # 创建目标文件夹
-        success = self.data_manager.add_folder(target_path, new_name)
+        success = self.data_manager.add_folder(list(target_path), new_name)
         if not success:
             return False
         
-        # 获取源文件夹的子项目
-        source_children_path = source_path + [source_name]
-        source_children = self.data_manager.get_item_at_path(source_children_path)
-        if not source_children:
-            return True  # 空文件夹复制成功
-        
-        # 复制子项目
-        target_children_path = target_path + [new_name]
-        for child_name, child_item in source_children.items():
-            if child_item["type"] == "folder":
-                # 递归复制子文件夹
-                self._copy_folder_recursive(source_children_path, child_name, target_children_path, child_name)
-            else:  # url
-                # 复制URL
-                self.data_manager.add_url(
-                    target_children_path,
-                    child_name,
-                    child_item["url"],
-                    child_item.get("icon", "")
-                )
+        stack = deque([(tuple(source_path) + (source_name,), tuple(target_path) + (new_name,))])
+        while stack:
+            source_children_path, target_children_path = stack.pop()
+            # 获取源文件夹的子项目
+            source_children = self.data_manager.get_item_at_path(source_children_path)
+            if not source_children:
+                continue  # 空文件夹
+            
+            # 复制子项目
+            target_children_list = list(target_children_path)
+            for child_name, child_item in source_children.items():
+                if child_item[_TYPE] == _FOLDER:
+                    # 创建子文件夹，其内容稍后复制
+                    if self.data_manager.add_folder(target_children_list, child_name):
+                        stack.append((source_children_path + (child_name,),
+                                      target_children_path + (child_name,)))
+                else:  # url
+                    # 复制URL
+                    self.data_manager.add_url(
+                        target_children_list,
+                        child_name,
+                        child_item[_URL],
+                        child_item.get(_ICON, "")
+                    )
         
         return True
 
     def set_root_bar(self, bar):
         self.external_root_bar = bar
-        self.refresh()
+        self._schedule_refresh()
 
     def _create_root_shower(self, name):
         """创建根目录显示器，避免lambda闭包问题
@@ -1079,23 +873,18 @@ class FolderTreeWidget(QTreeWidget):
     
     def _show_root(self, root_name, select_path=None):
         """只显示指定根目录下内容"""
+        # 同一根目录且数据未变化时无需重建
+        if (not select_path and root_name == self._current_root
+                and self._rendered_generation == self.data_manager.generation):
+            return
         self.clear()
+        self._populated_paths.clear()
         item = self.data_manager.data.get(root_name)
-        if not item or item["type"] != "folder":
+        if not item or item[_TYPE] != _FOLDER:
             return
         tree_item = QTreeWidgetItem(self)
-        # 统计下一级子目录和所有下级网址卡片数量
-        children = item["children"]
-        subdir_count = sum(1 for v in children.values() if v["type"] == "folder")
-        def count_urls(d):
-            cnt = 0
-            for v in d.values():
-                if v["type"] == "url":
-                    cnt += 1
-                elif v["type"] == "folder":
-                    cnt += count_urls(v["children"])
-            return cnt
-        url_count = count_urls(children)
+        # 统计下一级子目录和所有下级网址卡片数量（由数据管理器维护）
+        subdir_count, url_count = self.data_manager.get_folder_counts(item)
         if subdir_count > 0:
             stat_text = f"{subdir_count}类{url_count}个"
         else:
@@ -1105,16 +894,10 @@ class FolderTreeWidget(QTreeWidget):
         tree_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
         tree_item.setIcon(0, icon_provider.get_icon("folder"))
         tree_item.setData(0, Qt.UserRole, {"path": [], "name": root_name, "item": item})
-        font = tree_item.font(0)
-        font.setPointSizeF(font.pointSizeF() * 1.3)
-        tree_item.setFont(0, font)
-        self._add_folder_items(tree_item, item["children"], [root_name], font)
-        self.setColumnCount(2)
-        self.header().setSectionResizeMode(0, self.header().ResizeToContents)
-        self.header().setSectionResizeMode(1, self.header().Fixed)
-        self.setColumnWidth(1, 70)
-        self.header().setDefaultAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        tree_item.setFont(0, self._root_font)
+        self._add_folder_items(tree_item, item[_CHILDREN], [root_name], self._root_font)
         self._current_root = root_name
+        self._rendered_generation = self.data_manager.generation
         # 恢复选中状态
         if select_path:
             self.select_path(select_path)
@@ -1141,676 +924,4 @@ class FolderTreeWidget(QTreeWidget):
             self.setContextMenuPolicy(Qt.CustomContextMenu)
         
         # 刷新视图
-        self.refresh()
-
-    def mousePressEvent(self, event):
-        """处理鼠标按下事件，允许点击空白区域取消选择"""
-        # 获取点击位置的项目
-        item = self.itemAt(event.pos())
-        
-        # 如果点击在空白区域，清除选择
-        if item is None:
-            self.clearSelection()
-            # 发送清除选择信号
-            self.selection_cleared.emit()
-            # 如果当前有选中的项目，发送路径变化信号，传递空路径
-            if self.currentItem():
-                self.setCurrentItem(None)
-                self.path_changed.emit([])  # 返回根目录
-        
-        # 调用父类的事件处理
-        super().mousePressEvent(event)
-
-    def _add_root_folder(self):
-        """添加根文件夹"""
-        name, ok = QInputDialog.getText(self, "添加文件夹", "请输入文件夹名称:")
-        if ok and name:
-            success = self.data_manager.add_folder([], name)
-            
-            if success:
-                self.data_manager.save()
-            else:
-                QMessageBox.warning(self, "添加失败", "无法添加文件夹，可能是名称已存在")
-
-    def _copy_folder(self, data):
-        """复制文件夹"""
-        # 保存复制的项目数据
-        self.clipboard_data = {
-            "path": data["path"],
-            "name": data["name"],
-            "type": "folder"
-        }
-        QMessageBox.information(self, "复制成功", f"已复制文件夹 {data['name']} 到剪贴板")
-    
-    def _paste_item(self, target_data):
-        """将剪贴板中的项目粘贴到目标文件夹"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        target_path = target_data["path"] + [target_data["name"]]
-        
-        # 检查是否为粘贴到自己或子文件夹中
-        if self.clipboard_data["type"] == "folder":
-            source_full_path = source_path + [source_name]
-            is_subpath = False
-            
-            if len(target_path) >= len(source_full_path):
-                is_subpath = True
-                for i in range(len(source_full_path)):
-                    if source_full_path[i] != target_path[i]:
-                        is_subpath = False
-                        break
-            
-            if is_subpath:
-                QMessageBox.warning(self, "粘贴失败", "不能将文件夹粘贴到自己或其子文件夹中")
-                return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查目标是否已存在同名项目
-        target_items = self.data_manager.get_item_at_path(target_path)
-        if source_name in target_items:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in target_items:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, target_path, new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                target_path,
-                new_name,
-                item["url"],
-                item.get("icon", "")
-            )
-        
-        if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到目标文件夹")
-        else:
-            QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
-    
-    def _paste_item_to_root(self):
-        """将剪贴板中的项目粘贴到根目录"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        
-        # 检查是否已经在根目录
-        if not source_path:
-            QMessageBox.warning(self, "粘贴失败", "项目已经在根目录")
-            return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查根目录是否已存在同名项目
-        if source_name in self.data_manager.data:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in self.data_manager.data:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, [], new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                [], new_name, item["url"], item.get("icon", "")
-            )
-        
-        if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到根目录")
-        else:
-            QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
-    
-    def _copy_folder_recursive(self, source_path, source_name, target_path, new_name):
-        """递归复制文件夹及其内容"""
-        # 创建目标文件夹
-        success = self.data_manager.add_folder(target_path, new_name)
-        if not success:
-            return False
-        
-        # 获取源文件夹的子项目
-        source_children_path = source_path + [source_name]
-        source_children = self.data_manager.get_item_at_path(source_children_path)
-        if not source_children:
-            return True  # 空文件夹复制成功
-        
-        # 复制子项目
-        target_children_path = target_path + [new_name]
-        for child_name, child_item in source_children.items():
-            if child_item["type"] == "folder":
-                # 递归复制子文件夹
-                self._copy_folder_recursive(source_children_path, child_name, target_children_path, child_name)
-            else:  # url
-                # 复制URL
-                self.data_manager.add_url(
-                    target_children_path,
-                    child_name,
-                    child_item["url"],
-                    child_item.get("icon", "")
-                )
-        
-        return True
-
-    def set_root_bar(self, bar):
-        self.external_root_bar = bar
-        self.refresh()
-
-    def _create_root_shower(self, name):
-        """创建根目录显示器，避免lambda闭包问题
-        
-        Args:
-            name: 根目录名称
-            
-        Returns:
-            callable: 用于连接到按钮点击事件的函数
-        """
-        def shower(checked=False):
-            self._show_root(name)
-        return shower
-    
-    def _show_root(self, root_name, select_path=None):
-        """只显示指定根目录下内容"""
-        self.clear()
-        item = self.data_manager.data.get(root_name)
-        if not item or item["type"] != "folder":
-            return
-        tree_item = QTreeWidgetItem(self)
-        # 统计下一级子目录和所有下级网址卡片数量
-        children = item["children"]
-        subdir_count = sum(1 for v in children.values() if v["type"] == "folder")
-        def count_urls(d):
-            cnt = 0
-            for v in d.values():
-                if v["type"] == "url":
-                    cnt += 1
-                elif v["type"] == "folder":
-                    cnt += count_urls(v["children"])
-            return cnt
-        url_count = count_urls(children)
-        if subdir_count > 0:
-            stat_text = f"{subdir_count}类{url_count}个"
-        else:
-            stat_text = f"{url_count}个"
-        tree_item.setText(0, root_name)
-        tree_item.setText(1, stat_text)
-        tree_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-        tree_item.setIcon(0, icon_provider.get_icon("folder"))
-        tree_item.setData(0, Qt.UserRole, {"path": [], "name": root_name, "item": item})
-        font = tree_item.font(0)
-        font.setPointSizeF(font.pointSizeF() * 1.3)
-        tree_item.setFont(0, font)
-        self._add_folder_items(tree_item, item["children"], [root_name], font)
-        self.setColumnCount(2)
-        self.header().setSectionResizeMode(0, self.header().ResizeToContents)
-        self.header().setSectionResizeMode(1, self.header().Fixed)
-        self.setColumnWidth(1, 70)
-        self.header().setDefaultAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self._current_root = root_name
-        # 恢复选中状态
-        if select_path:
-            self.select_path(select_path)
-
-    def set_main_window(self, main_window):
-        """设置主窗口引用"""
-        self.main_window = main_window
-        
-    def set_locked_state(self, locked):
-        """设置锁定状态
-        
-        Args:
-            locked: 是否锁定
-        """
-        self.is_locked = locked
-        logger.debug(f"文件夹树锁定状态: {locked}")
-        
-        # 更新右键菜单策略
-        if locked:
-            # 锁定状态下禁用右键菜单
-            self.setContextMenuPolicy(Qt.NoContextMenu)
-        else:
-            # 解锁状态下恢复原有右键菜单
-            self.setContextMenuPolicy(Qt.CustomContextMenu)
-        
-        # 刷新视图
-        self.refresh()
-
-    def mousePressEvent(self, event):
-        """处理鼠标按下事件，允许点击空白区域取消选择"""
-        # 获取点击位置的项目
-        item = self.itemAt(event.pos())
-        
-        # 如果点击在空白区域，清除选择
-        if item is None:
-            self.clearSelection()
-            # 发送清除选择信号
-            self.selection_cleared.emit()
-            # 如果当前有选中的项目，发送路径变化信号，传递空路径
-            if self.currentItem():
-                self.setCurrentItem(None)
-                self.path_changed.emit([])  # 返回根目录
-        
-        # 调用父类的事件处理
-        super().mousePressEvent(event)
-
-    def _add_root_folder(self):
-        """添加根文件夹"""
-        name, ok = QInputDialog.getText(self, "添加文件夹", "请输入文件夹名称:")
-        if ok and name:
-            success = self.data_manager.add_folder([], name)
-            
-            if success:
-                self.data_manager.save()
-            else:
-                QMessageBox.warning(self, "添加失败", "无法添加文件夹，可能是名称已存在")
-
-    def _copy_folder(self, data):
-        """复制文件夹"""
-        # 保存复制的项目数据
-        self.clipboard_data = {
-            "path": data["path"],
-            "name": data["name"],
-            "type": "folder"
-        }
-        QMessageBox.information(self, "复制成功", f"已复制文件夹 {data['name']} 到剪贴板")
-    
-    def _paste_item(self, target_data):
-        """将剪贴板中的项目粘贴到目标文件夹"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        target_path = target_data["path"] + [target_data["name"]]
-        
-        # 检查是否为粘贴到自己或子文件夹中
-        if self.clipboard_data["type"] == "folder":
-            source_full_path = source_path + [source_name]
-            is_subpath = False
-            
-            if len(target_path) >= len(source_full_path):
-                is_subpath = True
-                for i in range(len(source_full_path)):
-                    if source_full_path[i] != target_path[i]:
-                        is_subpath = False
-                        break
-            
-            if is_subpath:
-                QMessageBox.warning(self, "粘贴失败", "不能将文件夹粘贴到自己或其子文件夹中")
-                return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查目标是否已存在同名项目
-        target_items = self.data_manager.get_item_at_path(target_path)
-        if source_name in target_items:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in target_items:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, target_path, new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                target_path,
-                new_name,
-                item["url"],
-                item.get("icon", "")
-            )
-        
-        if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到目标文件夹")
-        else:
-            QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
-    
-    def _paste_item_to_root(self):
-        """将剪贴板中的项目粘贴到根目录"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        
-        # 检查是否已经在根目录
-        if not source_path:
-            QMessageBox.warning(self, "粘贴失败", "项目已经在根目录")
-            return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查根目录是否已存在同名项目
-        if source_name in self.data_manager.data:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in self.data_manager.data:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, [], new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                [], new_name, item["url"], item.get("icon", "")
-            )
-        
-        if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到根目录")
-        else:
-            QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
-    
-    def _copy_folder_recursive(self, source_path, source_name, target_path, new_name):
-        """递归复制文件夹及其内容"""
-        # 创建目标文件夹
-        success = self.data_manager.add_folder(target_path, new_name)
-        if not success:
-            return False
-        
-        # 获取源文件夹的子项目
-        source_children_path = source_path + [source_name]
-        source_children = self.data_manager.get_item_at_path(source_children_path)
-        if not source_children:
-            return True  # 空文件夹复制成功
-        
-        # 复制子项目
-        target_children_path = target_path + [new_name]
-        for child_name, child_item in source_children.items():
-            if child_item["type"] == "folder":
-                # 递归复制子文件夹
-                self._copy_folder_recursive(source_children_path, child_name, target_children_path, child_name)
-            else:  # url
-                # 复制URL
-                self.data_manager.add_url(
-                    target_children_path,
-                    child_name,
-                    child_item["url"],
-                    child_item.get("icon", "")
-                )
-        
-        return True
-
-    def set_root_bar(self, bar):
-        self.external_root_bar = bar
-        self.refresh()
-
-    def _create_root_shower(self, name):
-        """创建根目录显示器，避免lambda闭包问题
-        
-        Args:
-            name: 根目录名称
-            
-        Returns:
-            callable: 用于连接到按钮点击事件的函数
-        """
-        def shower(checked=False):
-            self._show_root(name)
-        return shower
-    
-    def _show_root(self, root_name, select_path=None):
-        """只显示指定根目录下内容"""
-        self.clear()
-        item = self.data_manager.data.get(root_name)
-        if not item or item["type"] != "folder":
-            return
-        tree_item = QTreeWidgetItem(self)
-        # 统计下一级子目录和所有下级网址卡片数量
-        children = item["children"]
-        subdir_count = sum(1 for v in children.values() if v["type"] == "folder")
-        def count_urls(d):
-            cnt = 0
-            for v in d.values():
-                if v["type"] == "url":
-                    cnt += 1
-                elif v["type"] == "folder":
-                    cnt += count_urls(v["children"])
-            return cnt
-        url_count = count_urls(children)
-        if subdir_count > 0:
-            stat_text = f"{subdir_count}类{url_count}个"
-        else:
-            stat_text = f"{url_count}个"
-        tree_item.setText(0, root_name)
-        tree_item.setText(1, stat_text)
-        tree_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-        tree_item.setIcon(0, icon_provider.get_icon("folder"))
-        tree_item.setData(0, Qt.UserRole, {"path": [], "name": root_name, "item": item})
-        font = tree_item.font(0)
-        font.setPointSizeF(font.pointSizeF() * 1.3)
-        tree_item.setFont(0, font)
-        self._add_folder_items(tree_item, item["children"], [root_name], font)
-        self.setColumnCount(2)
-        self.header().setSectionResizeMode(0, self.header().ResizeToContents)
-        self.header().setSectionResizeMode(1, self.header().Fixed)
-        self.setColumnWidth(1, 70)
-        self.header().setDefaultAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self._current_root = root_name
-        # 恢复选中状态
-        if select_path:
-            self.select_path(select_path)
-
-    def set_main_window(self, main_window):
-        """设置主窗口引用"""
-        self.main_window = main_window
-        
-    def set_locked_state(self, locked):
-        """设置锁定状态
-        
-        Args:
-            locked: 是否锁定
-        """
-        self.is_locked = locked
-        logger.debug(f"文件夹树锁定状态: {locked}")
-        
-        # 更新右键菜单策略
-        if locked:
-            # 锁定状态下禁用右键菜单
-            self.setContextMenuPolicy(Qt.NoContextMenu)
-        else:
-            # 解锁状态下恢复原有右键菜单
-            self.setContextMenuPolicy(Qt.CustomContextMenu)
-        
-        # 刷新视图
-        self.refresh()
-
-    def mousePressEvent(self, event):
-        """处理鼠标按下事件，允许点击空白区域取消选择"""
-        # 获取点击位置的项目
-        item = self.itemAt(event.pos())
-        
-        # 如果点击在空白区域，清除选择
-        if item is None:
-            self.clearSelection()
-            # 发送清除选择信号
-            self.selection_cleared.emit()
-            # 如果当前有选中的项目，发送路径变化信号，传递空路径
-            if self.currentItem():
-                self.setCurrentItem(None)
-                self.path_changed.emit([])  # 返回根目录
-        
-        # 调用父类的事件处理
-        super().mousePressEvent(event)
-
-    def _add_root_folder(self):
-        """添加根文件夹"""
-        name, ok = QInputDialog.getText(self, "添加文件夹", "请输入文件夹名称:")
-        if ok and name:
-            success = self.data_manager.add_folder([], name)
-            
-            if success:
-                self.data_manager.save()
-            else:
-                QMessageBox.warning(self, "添加失败", "无法添加文件夹，可能是名称已存在")
-
-    def _copy_folder(self, data):
-        """复制文件夹"""
-        # 保存复制的项目数据
-        self.clipboard_data = {
-            "path": data["path"],
-            "name": data["name"],
-            "type": "folder"
-        }
-        QMessageBox.information(self, "复制成功", f"已复制文件夹 {data['name']} 到剪贴板")
-    
-    def _paste_item(self, target_data):
-        """将剪贴板中的项目粘贴到目标文件夹"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        target_path = target_data["path"] + [target_data["name"]]
-        
-        # 检查是否为粘贴到自己或子文件夹中
-        if self.clipboard_data["type"] == "folder":
-            source_full_path = source_path + [source_name]
-            is_subpath = False
-            
-            if len(target_path) >= len(source_full_path):
-                is_subpath = True
-                for i in range(len(source_full_path)):
-                    if source_full_path[i] != target_path[i]:
-                        is_subpath = False
-                        break
-            
-            if is_subpath:
-                QMessageBox.warning(self, "粘贴失败", "不能将文件夹粘贴到自己或其子文件夹中")
-                return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查目标是否已存在同名项目
-        target_items = self.data_manager.get_item_at_path(target_path)
-        if source_name in target_items:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in target_items:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, target_path, new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                target_path,
-                new_name,
-                item["url"],
-                item.get("icon", "")
-            )
-        
-        if success:
-            self.data_manager.save()
-            QMessageBox.information(self, "粘贴成功", f"已粘贴项目 {source_name} 到目标文件夹")
-        else:
-            QMessageBox.warning(self, "粘贴失败", "无法粘贴项目")
-    
-    def _paste_item_to_root(self):
-        """将剪贴板中的项目粘贴到根目录"""
-        if not self.clipboard_data:
-            return
-        
-        source_path = self.clipboard_data["path"]
-        source_name = self.clipboard_data["name"]
-        
-        # 检查是否已经在根目录
-        if not source_path:
-            QMessageBox.warning(self, "粘贴失败", "项目已经在根目录")
-            return
-        
-        # 复制项目
-        source_item = self.data_manager.get_item_at_path(source_path)
-        if not source_item or source_name not in source_item:
-            QMessageBox.warning(self, "粘贴失败", "源项目不存在")
-            return
-        
-        item = source_item[source_name]
-        
-        # 检查根目录是否已存在同名项目
-        if source_name in self.data_manager.data:
-            # 如果存在同名项目，添加复制标记
-            i = 1
-            new_name = f"{source_name} - 复制"
-            while new_name in self.data_manager.data:
-                i += 1
-                new_name = f"{source_name} - 复制 ({i})"
-        else:
-            new_name = source_name
-        
-        # 根据类型执行不同的复制操作
-        if item["type"] == "folder":
-            # 递归复制文件夹
-            success = self._copy_folder_recursive(source_path, source_name, [], new_name)
-        else:  # url
-            # 复制URL
-            success = self.data_manager.add_url(
-                [], new_name, item["url"], item["icon"])
\ No newline at end of file
+        self._schedule_refresh()
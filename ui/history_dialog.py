@@ -2,32 +2,215 @@
 
 import logging
 import os
+import functools
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QListWidget, QListWidgetItem, QAbstractItemView, QPushButton, QWidget, QSizePolicy,
-    QMessageBox, QMenu, QAction, QCheckBox
+    QMessageBox, QMenu, QAction, QCheckBox, QStyledItemDelegate, QStyleOptionViewItem,
+    QStyle, QApplication, QToolTip
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtCore import Qt, QSize, QRect, QEvent, QThreadPool, QRunnable
+from PyQt5.QtGui import QIcon, QFont, QColor, QFontMetrics
 from ui.icons import icon_provider
 from utils.language_manager import language_manager
 
 logger = logging.getLogger(__name__)
 
+# 列表项显示文本（名称, 位置, 时间）的数据角色
+DISPLAY_ROLE = Qt.UserRole + 1
+
+def _format_history_time(timestamp):
+    """将历史记录的ISO时间戳格式化为显示文本"""
+    if not timestamp:
+        return '未知时间'
+    # 常见的 YYYY-MM-DDTHH:MM:SS[.ffffff] 格式直接切片，无需解析
+    if (isinstance(timestamp, str) and len(timestamp) >= 19 and timestamp[10] in 'T '
+            and timestamp[4] == '-' and timestamp[7] == '-'
+            and timestamp[13] == ':' and timestamp[16] == ':'):
+        return timestamp[:10] + ' ' + timestamp[11:19]
+    try:
+        return datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+    except (ValueError, TypeError) as e:
+        logger.warning(f"时间格式解析失败: {e}")
+        return timestamp
+
+def _format_history_location(record):
+    """将历史记录的路径格式化为位置信息文本"""
+    # 加载时已生成拼接好的路径键
+    path_key = record.get('_path_key')
+    if path_key is not None:
+        return path_key or '根目录'
+    path = record.get('path', [])
+    # 兼容性处理：旧格式的路径为字符串
+    if isinstance(path, str):
+        path = path.split('/') if path else []
+    # 显示完整的路径层次结构
+    # 不移除最后一个元素，因为在历史记录中，路径的最后一个元素通常是目录名而不是文件名
+    return '/'.join(path) if path else '根目录'
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_history_path(path_key, is_url):
+    """将历史记录的路径转换为文件夹路径元组
+    
+    Args:
+        path_key: 路径元组，或旧格式的路径字符串
+        is_url: 记录是否为网址（其路径最后一个元素为项目名称）
+    """
+    # 兼容性处理：如果路径是字符串格式，转换为列表格式
+    if isinstance(path_key, str):
+        if path_key == '/' or path_key == '':
+            return ()
+        # 移除开头的斜杠并按斜杠分割
+        path = tuple(path_key.lstrip('/').split('/')) if path_key.strip() else ()
+    elif isinstance(path_key, tuple):
+        path = path_key
+    else:
+        return ()
+    
+    # 如果最后一个元素是项目名称，则去掉最后一个元素
+    if path and is_url:
+        path = path[:-1] if len(path) > 1 else ()
+    return path
+
+class UrlOpenWorker(QRunnable):
+    """在后台线程中依次打开网址"""
+    
+    def __init__(self, urls):
+        super().__init__()
+        self.urls = urls
+    
+    def run(self):
+        import webbrowser
+        for url in self.urls:
+            try:
+                webbrowser.open(url)
+            except Exception as e:
+                logger.error(f"打开URL失败: {url}, 错误: {e}")
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """历史记录列表项绘制代理
+    
+    直接绘制图标和名称、位置、时间三列（按4:3:3比例），
+    不再为每一行创建控件。
+    """
+    
+    ROW_HEIGHT = 52
+    FIXED_HINT = QSize(0, ROW_HEIGHT)
+    MARGIN = 8
+    SPACING = 12
+    NAME_COLOR = QColor("#000")
+    LOCATION_COLOR = QColor("#0066cc")
+    TIME_COLOR = QColor("#666")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        base_font = parent.font() if parent else QApplication.font()
+        # 名称：粗体 10pt 黑色；位置：9pt 蓝色；时间：9pt 灰色
+        self._name_font = QFont(base_font)
+        self._name_font.setPointSize(10)
+        self._name_font.setBold(True)
+        self._small_font = QFont(base_font)
+        self._small_font.setPointSize(9)
+        self._name_metrics = QFontMetrics(self._name_font)
+        self._small_metrics = QFontMetrics(self._small_font)
+    
+    def paint(self, painter, option, index):
+        """绘制列表项"""
+        # 由样式绘制背景和选中状态，图标和文字自行绘制
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        icon = QIcon(opt.icon)
+        opt.text = ""
+        opt.icon = QIcon()
+        opt.features &= ~QStyleOptionViewItem.HasDecoration
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        
+        rect = option.rect
+        icon_size = option.decorationSize
+        left = rect.left() + self.MARGIN
+        if not icon.isNull():
+            icon_rect = QRect(left, rect.top() + (rect.height() - icon_size.height()) // 2,
+                              icon_size.width(), icon_size.height())
+            icon.paint(painter, icon_rect)
+        left += icon_size.width() + self.SPACING
+        
+        display = index.data(DISPLAY_ROLE)
+        if not display:
+            return
+        name, location, time_text = display
+        
+        # 按4:3:3比例分配三列宽度
+        available = rect.right() - self.MARGIN - left - 2 * self.SPACING
+        if available <= 0:
+            return
+        name_width = available * 4 // 10
+        location_width = available * 3 // 10
+        time_width = available - name_width - location_width
+        
+        painter.save()
+        columns = (
+            (name, name_width, self._name_font, self._name_metrics, self.NAME_COLOR),
+            (location, location_width, self._small_font, self._small_metrics, self.LOCATION_COLOR),
+            (time_text, time_width, self._small_font, self._small_metrics, self.TIME_COLOR),
+        )
+        for text, width, font, metrics, color in columns:
+            painter.setFont(font)
+            painter.setPen(color)
+            text_rect = QRect(left, rect.top(), width, rect.height())
+            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             metrics.elidedText(text, Qt.ElideRight, width))
+            left += width + self.SPACING
+        painter.restore()
+    
+    def helpEvent(self, event, view, option, index):
+        """鼠标悬停时显示完整的提示文本"""
+        if event.type() == QEvent.ToolTip:
+            record = index.data(Qt.UserRole)
+            display = index.data(DISPLAY_ROLE)
+            if record and display:
+                name, location, time_text = display
+                QToolTip.showText(
+                    event.globalPos(),
+                    f"名称: {name}\n网址: {record.get('url', '')}\n位置: {location}\n时间: {time_text}",
+                    view
+                )
+                return True
+        return super().helpEvent(event, view, option, index)
+    
+    def sizeHint(self, option, index):
+        """固定行高（宽度由列表拉伸）"""
+        return self.FIXED_HINT
+
 class HistoryDialog(QDialog):
     """历史记录对话框"""
     
+    # 列标题样式
+    HEADER_STYLE = "font-weight: bold; color: #333; font-size: 10pt; border-bottom: 2px solid #ddd; padding-bottom: 3px;"
+    
     def __init__(self, parent, history_data, data_manager, history_manager):
         super().__init__(parent)
+        self._main_window = self._find_main_window()  # 主窗口引用（只查找一次）
         self.history_data = history_data
         self.data_manager = data_manager
         self.history_manager = history_manager
-        self.selected_items = []  # 存储多选的项目
+        self._selected_count = 0  # 选中的项目数量
+        self._total = 0  # 列表项总数（填充或删除后更新）
         self.deletion_performed = False  # 标记是否执行了删除操作
         
         self.init_ui()
     
+    def _find_main_window(self):
+        """向上查找持有盲盒管理器的主窗口，找不到时返回父窗口"""
+        current_parent = self.parent()
+        while current_parent:
+            if hasattr(current_parent, 'blind_box_manager'):
+                return current_parent
+            current_parent = current_parent.parent()
+        return self.parent()
+    
     def init_ui(self):
         """初始化UI"""
         self.setWindowTitle("历史记录")
@@ -53,20 +236,15 @@ class HistoryDialog(QDialog):
         header_layout.setSpacing(12)
         
         # 创建列标题
-        name_header = QLabel("网址名称")
-        name_header.setStyleSheet("font-weight: bold; color: #333; font-size: 10pt; border-bottom: 2px solid #ddd; padding-bottom: 3px;")
-        name_header.setMinimumWidth(300)
-        name_header.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        
-        location_header = QLabel("位置信息")
-        location_header.setStyleSheet("font-weight: bold; color: #333; font-size: 10pt; border-bottom: 2px solid #ddd; padding-bottom: 3px;")
-        location_header.setMinimumWidth(200)
-        location_header.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        
-        time_header = QLabel("访问时间")
-        time_header.setStyleSheet("font-weight: bold; color: #333; font-size: 10pt; border-bottom: 2px solid #ddd; padding-bottom: 3px;")
-        time_header.setMinimumWidth(150)
-        time_header.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        header_policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        headers = []
+        for title, min_width in (("网址名称", 300), ("位置信息", 200), ("访问时间", 150)):
+            header = QLabel(title)
+            header.setStyleSheet(self.HEADER_STYLE)
+            header.setMinimumWidth(min_width)
+            header.setSizePolicy(header_policy)
+            headers.append(header)
+        name_header, location_header, time_header = headers
         
         # 添加标题到布局，按4:3:3比例
         header_layout.addWidget(name_header, 4)
@@ -97,6 +275,9 @@ class HistoryDialog(QDialog):
         """)
         # 设置垂直滚动条始终显示，避免选择时宽度变化
         self.history_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        # 使用绘制代理显示各列，避免每行创建控件
+        self.history_list.setItemDelegate(HistoryItemDelegate(self.history_list))
+        self.history_list.setUniformItemSizes(True)
         layout.addWidget(self.history_list)
         
         # 添加历史记录项
@@ -131,7 +312,7 @@ class HistoryDialog(QDialog):
         button_layout.addWidget(clear_all_btn)
         
         # 检查锁定状态
-        main_win = self.parent()
+        main_win = self._main_window
         if main_win and hasattr(main_win, 'is_locked') and main_win.is_locked:
             delete_btn.setEnabled(False)
             delete_btn.setToolTip("当前处于锁定状态，无法删除历史记录")
@@ -163,111 +344,48 @@ class HistoryDialog(QDialog):
     
     def _populate_list(self):
         """填充历史记录列表"""
+        # 批量填充期间暂停重绘和信号，完成后统一刷新一次
+        self.history_list.setUpdatesEnabled(False)
+        self.history_list.blockSignals(True)
+        try:
+            self._fill_list_items()
+        finally:
+            self.history_list.blockSignals(False)
+            self.history_list.setUpdatesEnabled(True)
+        self._total = self.history_list.count()
+    
+    def _fill_list_items(self):
+        """创建历史记录列表项"""
         # 清空列表
         self.history_list.clear()
         
+        # 先批量生成显示用的时间和位置文本
+        records = self.history_data
+        times = [_format_history_time(record.get('timestamp', '')) for record in records]
+        locations = [_format_history_location(record) for record in records]
+        # 相同图标只查找一次，各行共享同一个QIcon
+        icon_cache = {}
+        
         # 添加历史记录项
-        for record in self.history_data:
+        for record, time_str, location_str in zip(records, times, locations):
             # 创建列表项
             item = QListWidgetItem()
             
             # 设置图标
-            if "icon" in record and record.get("icon"):
-                item.setIcon(icon_provider.get_icon(record["icon"]))
-            else:
-                item.setIcon(icon_provider.get_icon("globe"))
+            icon_key = record.get("icon") or "globe"
+            icon = icon_cache.get(icon_key)
+            if icon is None:
+                icon = icon_cache[icon_key] = icon_provider.get_icon(icon_key)
+            item.setIcon(icon)
             
             # 存储完整数据到UserRole
             item.setData(Qt.UserRole, record)
             
-            # 使用自定义布局显示
-            widget = QWidget()
-            item_layout = QHBoxLayout(widget)
-            # 增加内边距
-            item_layout.setContentsMargins(8, 10, 8, 10)
-            item_layout.setSpacing(12)  # 控件之间的间距
-            
-            # 格式化时间
-            timestamp = record.get('timestamp', '')
-            if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    time_str = dt.strftime('%Y-%m-%d %H:%M:%S')
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"时间格式解析失败: {e}")
-                    time_str = timestamp
-            else:
-                time_str = '未知时间'
-            
-            # 格式化位置信息
-            path = record.get('path', [])
-            # 兼容性处理：确保路径为列表格式
-            if isinstance(path, str):
-                if path:
-                    path = path.split('/')
-                else:
-                    path = []
-            
-            # 生成位置信息字符串
-            if path and len(path) > 0:
-                # 显示完整的路径层次结构
-                # 不移除最后一个元素，因为在历史记录中，路径的最后一个元素通常是目录名而不是文件名
-                location_str = '/'.join(path) if path else '根目录'
-            else:
-                location_str = '根目录'
-            
-            # 完整的提示文本
-            tooltip_text = f"名称: {record['name']}\n网址: {record['url']}\n位置: {location_str}\n时间: {time_str}"
-            
-            # 创建名称标签（40%宽度）
-            name_label = QLabel(record['name'])
-            name_label.setStyleSheet("font-weight: bold; color: #000; font-size: 10pt;")
-            name_label.setMinimumWidth(300)
-            name_label.setMaximumWidth(450)
-            name_label.setTextFormat(Qt.PlainText)
-            name_label.setWordWrap(False)
-            name_label.setText(record['name'])
-            name_label.setToolTip(record['name'])
-            name_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            
-            # 创建位置信息标签（30%宽度）
-            location_label = QLabel(location_str)
-            location_label.setStyleSheet("color: #0066cc; font-size: 9pt;")
-            location_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            location_label.setMinimumWidth(200)
-            location_label.setMaximumWidth(350)
-            location_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            location_label.setTextFormat(Qt.PlainText)
-            location_label.setWordWrap(False)
-            location_label.setText(location_str)
-            location_label.setToolTip(f"位置: {location_str}")
-            
-            # 创建时间标签（30%宽度）
-            time_label = QLabel(time_str)
-            time_label.setStyleSheet("color: #666; font-size: 9pt;")
-            time_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            time_label.setMinimumWidth(150)
-            time_label.setMaximumWidth(200)
-            time_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            time_label.setTextFormat(Qt.PlainText)
-            time_label.setWordWrap(False)
-            time_label.setText(time_str)
-            time_label.setToolTip(f"访问时间: {time_str}")
-            
-            # 为整个item设置工具提示
-            widget.setToolTip(tooltip_text)
-            
-            # 添加布局，按4:3:3比例分配
-            item_layout.addWidget(name_label, 4)  # 40%
-            item_layout.addWidget(location_label, 3)  # 30%
-            item_layout.addWidget(time_label, 3)  # 30%
-            
-            # 设置列表项高度
-            item.setSizeHint(QSize(widget.sizeHint().width(), 52))
+            # 名称、位置、时间三列由绘制代理按4:3:3比例绘制（提示文本也由代理生成）
+            item.setData(DISPLAY_ROLE, (record['name'], location_str, time_str))
             
             # 添加项目到列表
             self.history_list.addItem(item)
-            self.history_list.setItemWidget(item, widget)
     
     def _setup_shortcuts(self):
         """设置快捷键"""
@@ -276,19 +394,18 @@ class HistoryDialog(QDialog):
     
     def _update_selection_status(self):
         """更新选择状态"""
-        # 获取选中的项目
-        selected_items = self.history_list.selectedItems()
-        self.selected_items = selected_items
+        # 通过选择模型获取选中数量，不创建列表项对象
+        self._selected_count = len(self.history_list.selectionModel().selectedIndexes())
         
         # 更新全选按钮文本
-        if len(selected_items) == self.history_list.count() and self.history_list.count() > 0:
+        if self._total > 0 and self._selected_count == self._total:
             self.select_all_btn.setText("清除选择")
         else:
             self.select_all_btn.setText("全选")
     
     def _toggle_select_all(self):
         """切换全选/清除选择"""
-        if len(self.selected_items) == self.history_list.count() and self.history_list.count() > 0:
+        if self._total > 0 and self._selected_count == self._total:
             # 清除选择
             self.history_list.clearSelection()
         else:
@@ -324,7 +441,7 @@ class HistoryDialog(QDialog):
         delete_action.triggered.connect(self._delete_selected_items)
         
         # 检查锁定状态
-        main_win = self.parent()
+        main_win = self._main_window
         if not main_win:
             delete_action.setEnabled(False)
             delete_action.setToolTip("无法获取主窗口实例")
@@ -342,36 +459,28 @@ class HistoryDialog(QDialog):
         if not selected_items:
             return
         
-        import webbrowser
-        import time
         history_urls = []  # 用于收集需要添加到历史记录的URL
         
         for item in selected_items:
             history_data = item.data(Qt.UserRole)
             if history_data and history_data.get('url'):
-                try:
-                    webbrowser.open(history_data['url'])
-                    time.sleep(0.3)  # 避免浏览器进程冲突
-                    
-                    # 收集历史记录信息
-                    url = history_data['url']
-                    name = history_data.get('name', '未知网站')
-                    path = history_data.get('path', [])
-                    history_urls.append((url, name, path))
-                except Exception as e:
-                    logger.error(f"打开URL失败: {history_data['url']}, 错误: {e}")
+                # 收集历史记录信息
+                url = history_data['url']
+                name = history_data.get('name', '未知网站')
+                path = history_data.get('path', [])
+                history_urls.append((url, name, path))
+        
+        # 在线程池中依次打开网址，不阻塞界面
+        if history_urls:
+            QThreadPool.globalInstance().start(
+                UrlOpenWorker([url for url, _, _ in history_urls])
+            )
         
         # 添加到历史记录
         if history_urls:
             try:
                 # 获取主窗口实例
-                main_window = None
-                current_parent = self.parent()
-                while current_parent:
-                    if hasattr(current_parent, 'blind_box_manager'):
-                        main_window = current_parent
-                        break
-                    current_parent = current_parent.parent()
+                main_window = self._main_window
                 
                 if main_window and hasattr(main_window, 'blind_box_manager'):
                     main_window.blind_box_manager._add_to_history(history_urls)
@@ -394,7 +503,7 @@ class HistoryDialog(QDialog):
             return
             
         # 获取主窗口
-        main_win = self.parent()
+        main_win = self._main_window
         if not main_win:
             from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(self, "定位失败", "无法获取主窗口实例")
@@ -407,23 +516,8 @@ class HistoryDialog(QDialog):
             
         # 处理路径（兼容旧格式和新格式）
         path = history_data['path']
-        
-        # 兼容性处理：如果路径是字符串格式，转换为列表格式
-        if isinstance(path, str):
-            if path == '/' or path == '':
-                path = []
-            else:
-                # 移除开头的斜杠并按斜杠分割
-                path = path.lstrip('/').split('/') if path.strip() else []
-        
-        # 确保路径是列表格式
-        if not isinstance(path, list):
-            path = []
-            
-        # 如果路径是列表且最后一个元素是项目名称，则去掉最后一个元素
-        if isinstance(path, list) and len(path) > 0:
-            if history_data.get('type') == 'url':
-                path = path[:-1] if len(path) > 1 else []
+        path_key = tuple(path) if isinstance(path, list) else path
+        path = list(_normalize_history_path(path_key, history_data.get('type') == 'url'))
         
         name = history_data.get('name', '')
         
@@ -446,21 +540,20 @@ class HistoryDialog(QDialog):
                 main_win.bookmark_grid.refresh()
                 
                 # 滚动到目标项目
-                for w, n, t in getattr(main_win.bookmark_grid, '_item_widgets', []):
-                    if n == name:
-                        # 确保滚动到可见区域
-                        if hasattr(main_win.bookmark_grid, 'ensureWidgetVisible'):
-                            main_win.bookmark_grid.ensureWidgetVisible(w)
-                        else:
-                            # 尝试用scrollArea滚动
-                            try:
-                                grid = main_win.bookmark_grid
-                                area = grid.viewport().parent()
-                                rect = w.geometry()
-                                area.ensureVisible(rect.x(), rect.y(), rect.width(), rect.height())
-                            except Exception:
-                                pass
-                        break
+                w = getattr(main_win.bookmark_grid, '_item_widgets_by_name', {}).get(name)
+                if w is not None:
+                    # 确保滚动到可见区域
+                    if hasattr(main_win.bookmark_grid, 'ensureWidgetVisible'):
+                        main_win.bookmark_grid.ensureWidgetVisible(w)
+                    else:
+                        # 尝试用scrollArea滚动
+                        try:
+                            grid = main_win.bookmark_grid
+                            area = grid.viewport().parent()
+                            rect = w.geometry()
+                            area.ensureVisible(rect.x(), rect.y(), rect.width(), rect.height())
+                        except Exception:
+                            pass
             
             # 使主界面获得焦点
             main_win.activateWindow()
@@ -485,7 +578,7 @@ class HistoryDialog(QDialog):
             return
             
         # 检查锁定状态
-        main_win = self.parent()
+        main_win = self._main_window
         if not main_win:
             QMessageBox.warning(self, "删除失败", "无法获取主窗口实例")
             return
@@ -504,14 +597,26 @@ class HistoryDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            # 删除选中的历史记录
-            for item in selected_items:
-                history_data = item.data(Qt.UserRole)
-                if history_data:
-                    self.history_manager.remove_history_item(history_data)
+            # 删除选中的历史记录（批量删除，只保存一次）
+            records = [r for r in (item.data(Qt.UserRole) for item in selected_items) if r]
+            removed = self.history_manager.remove_history_items(records)
+            if removed != len(records):
+                # 删除失败或只删除了一部分，按实际的历史记录重建列表
+                self._refresh_list()
+                if not removed:
+                    QMessageBox.warning(self, "删除失败", "删除历史记录失败，请查看日志")
+                return
+
+            # 只移除被删除的列表项，不重建整个列表
+            rows = sorted((self.history_list.row(item) for item in selected_items), reverse=True)
+            for row in rows:
+                self.history_list.takeItem(row)
+            self._total = self.history_list.count()
+            self.history_data = self.history_manager.get_history()
             
-            # 刷新列表
-            self._refresh_list()
+            # 更新结果标签和按钮状态
+            self.result_label.setText(f"共有 {len(self.history_data)} 条历史记录")
+            self._update_selection_status()
     
     def _open_selected_item(self, item):
         """打开选中的单个项目"""
@@ -528,13 +633,7 @@ class HistoryDialog(QDialog):
                 history_urls = [(url, name, path)]
                 
                 # 获取主窗口实例
-                main_window = None
-                current_parent = self.parent()
-                while current_parent:
-                    if hasattr(current_parent, 'blind_box_manager'):
-                        main_window = current_parent
-                        break
-                    current_parent = current_parent.parent()
+                main_window = self._main_window
                 
                 if main_window and hasattr(main_window, 'blind_box_manager'):
                     main_window.blind_box_manager._add_to_history(history_urls)
@@ -545,7 +644,7 @@ class HistoryDialog(QDialog):
     def _clear_all_history(self):
         """清空所有历史记录"""
         # 检查锁定状态
-        main_win = self.parent()
+        main_win = self._main_window
         if not main_win:
             QMessageBox.warning(self, "清空失败", "无法获取主窗口实例")
             return
@@ -4,37 +4,93 @@
 import os
 import sys
 import logging
-from PyQt5.QtGui import QIcon, QPixmap
+import functools
+import types
+from threading import RLock, Event
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
 from PyQt5.QtCore import QSize
 
 logger = logging.getLogger(__name__)
 
+# 资源根目录在进程启动时确定：PyInstaller打包后为_MEIPASS，否则为当前工作目录
+_BASE = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+@functools.lru_cache(maxsize=256)
 def resource_path(relative_path):
     """获取资源文件的绝对路径，兼容开发环境和PyInstaller打包后环境"""
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.join(os.path.abspath("."), relative_path)
+    return os.path.join(_BASE, relative_path)
+
+# 32x32 透明空图标（带半透明灰色边框）的PNG数据，与 _create_empty_icon 绘制结果一致
+_EMPTY_ICON_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000020000000200806000000737a7a'
+    'f4000000354944415478daedd7310100300cc3b076c80b2fb006238f8c40af37'
+    'c94db32620c9bd290700000000000000000000000000b0ed3dffa3210b9d0a43'
+    '40680000000049454e44ae426082'
+)
+
+# PIL模块，首次生成图标时加载
+_pil = None
+
+def _get_pil():
+    """加载并返回PIL相关模块，整个进程只加载一次"""
+    global _pil
+    if _pil is None:
+        from PIL import Image, ImageDraw, ImageFont
+        _pil = types.SimpleNamespace(Image=Image, ImageDraw=ImageDraw, ImageFont=ImageFont)
+    return _pil
+
+# 生成图标时的PNG保存参数：图标很小，使用最低压缩级别以减少编码时间
+_PNG_SAVE_OPTIONS = {"format": "PNG", "compress_level": 1, "optimize": False}
 
 class IconManager:
     """图标管理器"""
     
-    def __init__(self, resources_path="resources"):
+    # 共享的空图标，首次使用时创建（需在QApplication创建之后）
+    _EMPTY_ICON = None
+    
+    # 占位图标使用的字体缓存，键为 (字体文件, 字号)
+    _font_cache = {}
+    
+    # 字符边界框缓存，键为 (字体文件, 字号, 字符)
+    _glyph_metrics = {}
+    
+    def __init__(self, resources_path="resources", create_missing=True):
         """
         初始化图标管理器
         
         Args:
             resources_path: 资源文件夹路径
+            create_missing: 默认图标不存在时是否创建空图标文件
         """
         self.resources_path = resources_path
+        self.create_missing = create_missing
         self.icons_path = os.path.join(resources_path, "icons")
         self.icon_cache = {}
         
+        # 缓存锁及正在加载的图标，保证同一图标只被一个线程加载
+        self._cache_lock = RLock()
+        self._inflight = {}
+        
+        # 已确认不存在的文件路径，避免重复检查
+        self._missing = set()
+        
+        # 启动时图标目录中已有的文件名
+        self._present_icons = set()
+        
+        # 彩色图标路径缓存，键为 (图标名称, 颜色, 大小)
+        self._colored_cache = {}
+        
+        # 最终备用图标（folder/url），每种只创建一次
+        self._fallback_icons = {}
+        
         # 确保图标目录存在
-        if not os.path.exists(self.icons_path):
-            os.makedirs(self.icons_path)
+        os.makedirs(self.icons_path, exist_ok=True)
         
         # 初始化默认图标
         self._init_default_icons()
+        
+        # 预先加载默认图标，避免首次绘制时集中读取文件
+        self._preload_default_icons()
     
     def _init_default_icons(self):
         """初始化默认图标"""
@@ -63,13 +119,39 @@ class IconManager:
             "editurl": "resources/icons/editurl.png"
         }
         
+        # 默认图标的完整路径，避免每次查找时重复拼接
+        self._default_icon_paths = {
+            name: os.path.join(self.icons_path, icon_file)
+            for name, icon_file in self.default_icons.items()
+        }
+        
+        # 一次读取图标目录中的文件名，代替逐个检查文件是否存在
+        try:
+            self._present_icons = {entry.name for entry in os.scandir(self.icons_path) if entry.is_file()}
+        except OSError:
+            self._present_icons = set()
+        
+        if not self.create_missing:
+            return
+        
         # 检查默认图标是否存在，如果不存在则创建一个空图标
         for icon_name, icon_file in self.default_icons.items():
-            icon_path = os.path.join(self.icons_path, icon_file)
-            if not os.path.exists(icon_path):
+            icon_path = self._default_icon_paths[icon_name]
+            if os.path.dirname(icon_file):
+                # 带子目录的文件名不在目录列表中，单独检查
+                exists = os.path.isfile(icon_path)
+            else:
+                exists = icon_file in self._present_icons
+            if not exists:
                 logger.warning(f"默认图标不存在: {icon_path}")
                 self._create_empty_icon(icon_path)
     
+    def _preload_default_icons(self):
+        """为所有存在的默认图标创建QIcon并放入缓存"""
+        for icon_name, icon_path in self._default_icon_paths.items():
+            if self._path_exists(icon_path):
+                self.icon_cache[icon_name] = QIcon(icon_path)
+    
     def _create_empty_icon(self, icon_path, size=32):
         """
         创建空图标
@@ -79,21 +161,66 @@ class IconManager:
             size: 图标大小
         """
         try:
-            from PIL import Image, ImageDraw
+            # 默认大小直接写入预先生成的PNG数据，无需加载PIL
+            if size == 32:
+                with open(icon_path, 'wb') as f:
+                    f.write(_EMPTY_ICON_PNG)
+                self.invalidate_missing(icon_path)
+                logger.info(f"已创建空图标: {icon_path}")
+                return
+            
+            pil = _get_pil()
             
             # 创建透明图像
-            img = Image.new('RGBA', (size, size), color=(0, 0, 0, 0))
+            img = pil.Image.new('RGBA', (size, size), color=(0, 0, 0, 0))
             
             # 绘制简单边框
-            draw = ImageDraw.Draw(img)
+            draw = pil.ImageDraw.Draw(img)
             draw.rectangle([0, 0, size-1, size-1], outline=(200, 200, 200, 128))
             
             # 保存图像
-            img.save(icon_path)
+            img.save(icon_path, **_PNG_SAVE_OPTIONS)
+            self.invalidate_missing(icon_path)
             logger.info(f"已创建空图标: {icon_path}")
         except Exception as e:
             logger.error(f"创建空图标失败: {e}")
     
+    def _path_exists(self, path):
+        """检查文件是否存在，已确认不存在的路径直接返回False"""
+        if path in self._missing:
+            return False
+        # 启动时已在图标目录中的文件无需再检查
+        directory, name = os.path.split(path)
+        if name in self._present_icons and directory == self.icons_path:
+            return True
+        if not os.path.isfile(path):
+            self._missing.add(path)
+            return False
+        return True
+    
+    def invalidate_missing(self, path=None):
+        """
+        清除不存在路径的记录
+        
+        Args:
+            path: 要清除的路径，为None时清除全部
+        """
+        if path is None:
+            self._missing.clear()
+        else:
+            self._missing.discard(path)
+    
+    def invalidate_icon(self, path):
+        """
+        移除指定路径的缓存图标和不存在记录（图标文件被覆盖或新建后调用）
+        
+        Args:
+            path: 图标路径
+        """
+        with self._cache_lock:
+            self.icon_cache.pop(path, None)
+        self._missing.discard(path)
+    
     def get_icon(self, icon_name, fallback=None):
         """
         获取图标
@@ -105,42 +232,93 @@ class IconManager:
         Returns:
             QIcon对象
         """
-        # 检查缓存
-        if icon_name in self.icon_cache:
-            return self.icon_cache[icon_name]
+        while True:
+            with self._cache_lock:
+                # 检查缓存
+                icon = self.icon_cache.get(icon_name)
+                if icon is not None:
+                    return icon
+                
+                event = self._inflight.get(icon_name)
+                if event is None:
+                    event = Event()
+                    self._inflight[icon_name] = event
+                    break
+            
+            # 其他线程正在加载同一图标，等待完成后重新检查缓存
+            event.wait()
+        
+        try:
+            icon = self._load_icon(icon_name, fallback)
+            
+            # 缓存图标
+            with self._cache_lock:
+                self.icon_cache[icon_name] = icon
+        finally:
+            with self._cache_lock:
+                del self._inflight[icon_name]
+            event.set()
+        
+        return icon
+    
+    def _load_icon(self, icon_name, fallback=None):
+        """
+        从文件加载图标，失败时依次使用备用图标和默认图标
         
+        Args:
+            icon_name: 图标名称或路径
+            fallback: 备用图标名称
+            
+        Returns:
+            QIcon对象
+        """
         icon = None
         
         # 如果是默认图标名称
         if icon_name in self.default_icons:
-            icon_path = os.path.join(self.icons_path, self.default_icons[icon_name])
-            if os.path.exists(icon_path):
+            icon_path = self._default_icon_paths[icon_name]
+            if self._path_exists(icon_path):
                 icon = QIcon(icon_path)
         
         # 如果是文件路径
-        elif os.path.exists(icon_name):
+        elif self._path_exists(icon_name):
             icon = QIcon(icon_name)
         
         # 如果图标加载失败，使用备用图标
         if icon is None or icon.isNull():
             if fallback and fallback in self.default_icons:
-                icon_path = os.path.join(self.icons_path, self.default_icons[fallback])
-                if os.path.exists(icon_path):
+                icon_path = self._default_icon_paths[fallback]
+                if self._path_exists(icon_path):
                     icon = QIcon(icon_path)
             
             # 如果备用图标也失败，使用默认图标
             if icon is None or icon.isNull():
                 default_icon = "url" if "favicon" in icon_name.lower() else "folder"
-                icon_path = os.path.join(self.icons_path, self.default_icons[default_icon])
-                if os.path.exists(icon_path):
-                    icon = QIcon(icon_path)
-                else:
-                    # 最后的备用方案：创建一个空图标
-                    icon = QIcon()
+                icon = self._get_fallback_icon(default_icon)
         
-        # 缓存图标
-        self.icon_cache[icon_name] = icon
+        return icon
+    
+    def _get_fallback_icon(self, default_icon):
+        """
+        获取共享的最终备用图标
         
+        Args:
+            default_icon: 默认图标名称（"url" 或 "folder"）
+            
+        Returns:
+            QIcon对象，图标文件不存在时返回共享的空图标
+        """
+        icon = self._fallback_icons.get(default_icon)
+        if icon is None:
+            icon_path = self._default_icon_paths[default_icon]
+            if self._path_exists(icon_path):
+                icon = QIcon(icon_path)
+            else:
+                # 最后的备用方案：使用空图标
+                if IconManager._EMPTY_ICON is None:
+                    IconManager._EMPTY_ICON = QIcon()
+                icon = IconManager._EMPTY_ICON
+            self._fallback_icons[default_icon] = icon
         return icon
     
     def get_pixmap(self, icon_name, size=32, fallback=None):
@@ -156,11 +334,22 @@ class IconManager:
             QPixmap对象
         """
         icon = self.get_icon(icon_name, fallback)
-        return icon.pixmap(QSize(size, size))
+        
+        # 使用Qt共享的像素图缓存（有容量上限，按LRU淘汰）；
+        # 以QIcon的cacheKey为键，图标重新生成后旧的像素图自然失效
+        key = f"icon:{icon.cacheKey()}:{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = icon.pixmap(QSize(size, size))
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
     
     def clear_cache(self):
         """清除图标缓存"""
-        self.icon_cache.clear()
+        with self._cache_lock:
+            self.icon_cache.clear()
+            self._colored_cache.clear()
+            self._fallback_icons.clear()
         logger.info("图标缓存已清除")
     
     def create_colored_icon(self, icon_name, color, size=32):
@@ -175,52 +364,59 @@ class IconManager:
         Returns:
             彩色图标路径
         """
+        key = (icon_name, tuple(color), size)
+        hit = self._colored_cache.get(key)
+        if hit is not None and hit not in self._missing:
+            return hit
+        
         try:
-            from PIL import Image, ImageOps
+            pil = _get_pil()
             
             # 获取原始图标路径
             if icon_name in self.default_icons:
-                icon_path = os.path.join(self.icons_path, self.default_icons[icon_name])
+                icon_path = self._default_icon_paths[icon_name]
             else:
                 icon_path = icon_name
             
-            if not os.path.exists(icon_path):
+            if not self._path_exists(icon_path):
                 logger.error(f"图标不存在: {icon_path}")
                 return None
             
             # 生成彩色图标的文件名
             r, g, b = color
-            colored_icon_name = f"{os.path.splitext(os.path.basename(icon_path))[0]}_{r}_{g}_{b}.png"
-            colored_icon_path = os.path.join(self.icons_path, colored_icon_name)
+            stem = os.path.splitext(os.path.basename(icon_path))[0]
+            colored_icon_path = os.path.join(self.icons_path, f"{stem}_{r}_{g}_{b}.png")
             
             # 如果彩色图标已存在，直接返回
-            if os.path.exists(colored_icon_path):
+            if self._path_exists(colored_icon_path):
+                self._colored_cache[key] = colored_icon_path
                 return colored_icon_path
             
             # 打开原始图标
-            img = Image.open(icon_path).convert("RGBA")
+            img = pil.Image.open(icon_path).convert("RGBA")
             
-            # 调整大小
+            # 调整大小：大幅缩小时先按整数倍快速缩减，再做LANCZOS重采样
             if img.width != size or img.height != size:
-                img = img.resize((size, size), Image.LANCZOS)
-            
-            # 创建彩色版本
-            r, g, b = color
-            colored_img = ImageOps.colorize(
-                ImageOps.grayscale(img), 
-                (0, 0, 0), 
-                (r, g, b)
-            ).convert("RGBA")
-            
-            # 保留原始透明度
-            colored_img.putalpha(img.getchannel("A"))
+                img = img.resize((size, size), pil.Image.LANCZOS, reducing_gap=3.0)
+            
+            # 创建彩色版本：灰度值按颜色分量缩放（等同于从黑色到目标色的colorize），
+            # 各通道用查找表一次生成，并直接合并原始透明度通道
+            gray = img.convert("L")
+            colored_img = pil.Image.merge("RGBA", (
+                gray.point([i * r // 255 for i in range(256)]),
+                gray.point([i * g // 255 for i in range(256)]),
+                gray.point([i * b // 255 for i in range(256)]),
+                img.getchannel("A"),
+            ))
             
             # 保存彩色图标
-            colored_img.save(colored_icon_path)
+            colored_img.save(colored_icon_path, **_PNG_SAVE_OPTIONS)
+            self.invalidate_missing(colored_icon_path)
+            self._colored_cache[key] = colored_icon_path
             
             # 清除缓存中的旧图标
-            if colored_icon_path in self.icon_cache:
-                del self.icon_cache[colored_icon_path]
+            with self._cache_lock:
+                self.icon_cache.pop(colored_icon_path, None)
             
             return colored_icon_path
         
@@ -244,8 +440,8 @@ class IconManager:
         # 如果系统主题没有该图标，使用默认图标
         if icon.isNull():
             if name in self.default_icons:
-                icon_path = os.path.join(self.icons_path, self.default_icons[name])
-                if os.path.exists(icon_path):
+                icon_path = self._default_icon_paths[name]
+                if self._path_exists(icon_path):
                     icon = QIcon(icon_path)
             else:
                 # 映射常见的系统图标名称到默认图标
@@ -263,12 +459,49 @@ class IconManager:
                 }
                 
                 if name in icon_map and icon_map[name] in self.default_icons:
-                    icon_path = os.path.join(self.icons_path, self.default_icons[icon_map[name]])
-                    if os.path.exists(icon_path):
+                    icon_path = self._default_icon_paths[icon_map[name]]
+                    if self._path_exists(icon_path):
                         icon = QIcon(icon_path)
         
         return icon
     
+    @classmethod
+    def _get_font(cls, family, font_size):
+        """
+        获取字体，优先使用系统字体，失败时使用PIL默认字体
+        
+        Args:
+            family: 字体文件名
+            font_size: 字号
+            
+        Returns:
+            字体对象，都加载失败时返回 None
+        """
+        key = (family, font_size)
+        if key in cls._font_cache:
+            return cls._font_cache[key]
+        
+        pil = _get_pil()
+        try:
+            font = pil.ImageFont.truetype(family, font_size)
+        except Exception:
+            try:
+                font = pil.ImageFont.load_default()
+            except Exception:
+                font = None
+        cls._font_cache[key] = font
+        return font
+    
+    @classmethod
+    def _get_glyph_bbox(cls, font, family, font_size, letter):
+        """获取字符的边界框 (left, top, right, bottom)"""
+        key = (family, font_size, letter)
+        bbox = cls._glyph_metrics.get(key)
+        if bbox is None:
+            bbox = font.getbbox(letter)
+            cls._glyph_metrics[key] = bbox
+        return bbox
+    
     def generate_favicon_placeholder(self, domain, size=32):
         """
         为域名生成占位图标
@@ -281,20 +514,19 @@ class IconManager:
             占位图标路径
         """
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            pil = _get_pil()
             import hashlib
             
             # 生成文件名
-            hash_obj = hashlib.md5(domain.encode())
-            filename = f"favicon_placeholder_{hash_obj.hexdigest()[:8]}.png"
+            hash_bytes = hashlib.blake2s(domain.encode('utf-8'), digest_size=8).digest()
+            filename = f"favicon_placeholder_{hash_bytes.hex()}.png"
             icon_path = os.path.join(self.icons_path, filename)
             
             # 如果已存在，直接返回
-            if os.path.exists(icon_path):
+            if self._path_exists(icon_path):
                 return icon_path
             
             # 从域名生成颜色
-            hash_bytes = hash_obj.digest()
             hue = hash_bytes[0] / 255.0
             saturation = 0.5 + hash_bytes[1] / 512.0
             value = 0.7 + hash_bytes[2] / 512.0
@@ -305,36 +537,32 @@ class IconManager:
             background_color = (int(r * 255), int(g * 255), int(b * 255))
             
             # 创建图像
-            img = Image.new('RGBA', (size, size), background_color)
-            draw = ImageDraw.Draw(img)
+            img = pil.Image.new('RGBA', (size, size), background_color)
+            draw = pil.ImageDraw.Draw(img)
             
             # 获取域名首字母
             letter = domain[0].upper() if domain else "?"
             
-            # 尝试加载字体
-            try:
-                # 尝试使用系统字体
-                font_size = int(size * 0.6)
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except Exception:
-                try:
-                    # 尝试使用PIL默认字体
-                    font = ImageFont.load_default()
-                except Exception:
-                    # 如果字体加载失败，使用简单绘制
-                    draw.rectangle([size//3, size//3, 2*size//3, 2*size//3], fill=(255, 255, 255))
-                    img.save(icon_path)
-                    return icon_path
-            
-            # 计算文本大小和位置
-            text_width, text_height = draw.textsize(letter, font=font)
-            position = ((size - text_width) // 2, (size - text_height) // 2)
+            # 加载字体（已缓存）
+            font_size = int(size * 0.6)
+            font = self._get_font("arial.ttf", font_size)
+            if font is None:
+                # 如果字体加载失败，使用简单绘制
+                draw.rectangle([size//3, size//3, 2*size//3, 2*size//3], fill=(255, 255, 255))
+                img.save(icon_path, **_PNG_SAVE_OPTIONS)
+                self.invalidate_missing(icon_path)
+                return icon_path
+            
+            # 计算文本大小和位置（按边界框居中）
+            left, top, right, bottom = self._get_glyph_bbox(font, "arial.ttf", font_size, letter)
+            position = ((size - (right - left)) // 2 - left, (size - (bottom - top)) // 2 - top)
             
             # 绘制文本
             draw.text(position, letter, fill=(255, 255, 255), font=font)
             
             # 保存图像
-            img.save(icon_path)
+            img.save(icon_path, **_PNG_SAVE_OPTIONS)
+            self.invalidate_missing(icon_path)
             
             return icon_path
         
@@ -364,6 +592,61 @@ class IconProvider:
         "app_icon": "resources/icons/app_icon.png"
     }
     
+    # 图标名称或路径对应的绝对路径，已知名称导入时解析，其余在首次找到后记录
+    _resolved = {name: resource_path(path) for name, path in ICON_MAP.items()}
+    
+    # 共享的图标管理器，提供统一的图标缓存和不存在路径记录（首次使用时创建）
+    _manager = None
+    
+    @classmethod
+    def _get_manager(cls):
+        """获取共享的图标管理器"""
+        if cls._manager is None:
+            cls._manager = IconManager(resource_path("resources"), create_missing=False)
+        return cls._manager
+    
+    @classmethod
+    def _exists(cls, path):
+        """检查文件是否存在，已确认不存在的路径直接返回False"""
+        return cls._get_manager()._path_exists(path)
+    
+    @classmethod
+    def invalidate_missing(cls, path=None):
+        """
+        清除不存在路径的记录（如图标文件刚被下载或生成）
+        
+        Args:
+            path: 要清除的路径（与 get_icon 相同，可为相对路径），为None时清除全部
+        """
+        manager = cls._get_manager()
+        if path is None:
+            manager.invalidate_missing()
+            return
+        for candidate in cls._candidates(path):
+            manager.invalidate_missing(candidate)
+    
+    @classmethod
+    def invalidate_icon(cls, path):
+        """
+        移除图标文件对应的缓存图标和不存在记录，下次获取时重新从文件加载
+        
+        Args:
+            path: 图标路径（与 get_icon 相同，可为相对路径）
+        """
+        manager = cls._get_manager()
+        for candidate in cls._candidates(path):
+            manager.invalidate_icon(candidate)
+    
+    @staticmethod
+    def _candidates(icon_name):
+        """
+        图标路径依次尝试的候选文件路径：相对路径先按资源目录解析，再按当前目录查找；
+        绝对路径经resource_path拼接后仍是自身，只需检查一次
+        """
+        if os.path.isabs(icon_name):
+            return (icon_name,)
+        return (resource_path(icon_name), icon_name)
+    
     @classmethod
     def get_icon(cls, icon_name):
         """
@@ -375,37 +658,38 @@ class IconProvider:
         Returns:
             QIcon 对象
         """
+        manager = cls._get_manager()
+        
+        icon_path = cls._resolved.get(icon_name)
+        if icon_path is None:
+            icon_path = cls._resolve_path(icon_name)
+            if icon_path is None:
+                # 找不到时使用默认图标
+                return manager.get_icon(cls._resolved["globe"], "url")
+            cls._resolved[icon_name] = icon_path
+        
+        # 按绝对路径缓存，同一文件只创建一个QIcon
+        return manager.get_icon(icon_path, "url")
+    
+    @classmethod
+    def _resolve_path(cls, icon_name):
+        """
+        将图标名称或路径解析为实际文件路径
+        
+        Returns:
+            文件路径，找不到时返回 None
+        """
         # 如果是已知图标名称，使用映射的路径
-        if icon_name in cls.ICON_MAP:
-            icon_path = resource_path(cls.ICON_MAP[icon_name])
-            return QIcon(icon_path)
-        
-        # 如果是相对路径
-        if icon_name.startswith("resources/") or not os.path.isabs(icon_name):
-            # 尝试使用相对路径查找
-            rel_path = resource_path(icon_name)
-            if os.path.exists(rel_path):
-                return QIcon(rel_path)
-            
-            # 如果找不到，尝试从当前目录查找
-            if os.path.exists(icon_name):
-                return QIcon(icon_name)
-            
-            # 如果都找不到，使用默认图标
-            logger.warning(f"找不到图标: {icon_name}，使用默认图标")
-            return QIcon(resource_path("resources/icons/globe.png"))
-        
-        # 如果是完整路径或其他情况
-        if os.path.exists(icon_name):
-            return QIcon(icon_name)
-        else:
-            # 如果绝对路径不存在，尝试作为相对路径解析
-            rel_path = resource_path(icon_name)
-            if os.path.exists(rel_path):
-                return QIcon(rel_path)
-            
-            logger.warning(f"图标文件不存在: {icon_name}，使用默认图标")
-            return QIcon(resource_path("resources/icons/globe.png"))
+        resolved = cls._resolved.get(icon_name)
+        if resolved is not None:
+            return resolved
+        
+        for path in cls._candidates(icon_name):
+            if cls._exists(path):
+                return path
+        
+        logger.warning(f"找不到图标: {icon_name}，使用默认图标")
+        return None
 
 # 创建全局图标提供器实例以便导入使用
 icon_provider = IconProvider()
\ No newline at end of file
@@ -3,16 +3,19 @@
 
 import os
 import logging
-import copy
 import datetime
-import shutil
+import functools
+import json
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QSplitter, 
     QToolBar, QAction, QFileDialog, QInputDialog, 
-    QMessageBox, QProgressDialog, QLineEdit, QToolButton, QMenu, QStatusBar, QPushButton, QDialog, QRadioButton, QDialogButtonBox, QLabel, QScrollArea
+    QMessageBox, QProgressDialog, QLineEdit, QToolButton, QMenu, QStatusBar, QPushButton, QDialog, QRadioButton, QDialogButtonBox, QLabel, QScrollArea, QComboBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QRunnable, QThreadPool, QEventLoop
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
 from PyQt5 import QtCore
 
 from ui.folder_tree import FolderTreeWidget
@@ -24,21 +27,379 @@ from ui.icons import icon_provider
 from ui.icons import resource_path
 from utils.language_manager import language_manager
 from utils.blind_box_manager import BlindBoxManager
+from utils.file_utils import is_safe_path, fast_copy_file
+from utils.path_utils import is_subpath
 
 logger = logging.getLogger(__name__)
 
+# 导入书签文件的大小上限（MB）
+MAX_IMPORT_SIZE_MB = 3
+
+# 默认网址图标文件名，书签使用该图标时视为缺失图标
+DEFAULT_ICON_NAME = "globe.png"
+
+# 主窗口使用的图标文件路径，导入时解析一次
+ICON_PATHS = {
+    name: resource_path(f"resources/icons/{name}")
+    for name in (
+        "cut.ico", "setup.ico", "lock.ico", "info.ico", "undo.ico", "sort.ico", "open.ico",
+        "editurl.png", "manghe.png", "globe.png", "open.png", "search.png",
+    )
+}
+
+# 主窗口固定样式表，定义为模块常量，每次构建窗口时复用同一字符串
+_SEPARATOR_QSS = "background-color: #CCCCCC;"
+
+_MAGIC_BOX_QSS = """
+QLabel {
+    color: #8B0040;
+    font-size: 18px;
+    font-weight: bold;
+    font-family: "方正古隶简体", "华文隶书", "华文琥珀", "SimSun", serif;
+    background: transparent;
+    margin: 5px;
+    line-height: 1.2;
+}
+"""
+
+_BLIND_BOX_QSS = """
+QPushButton {
+    border-radius: 45px;
+    background-color: #f0ad4e;
+    border: 2px solid #ec971f;
+}
+QPushButton:hover {
+    background-color: #ec971f;
+    border: 2px solid #d58512;
+}
+QPushButton:pressed {
+    background-color: #d58512;
+    border: 2px solid #b8741f;
+}
+"""
+
+_RANDOM_URLS_QSS = """
+QScrollArea {
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    background-color: #f9f9f9;
+}
+"""
+
+# 关于对话框的内容
+# _ABOUT_HTML = """<div style="font-size: 10pt;"><b>URL Navigator</b><br>作者：Yifree(开发者昵称)<br>版本：V0.5<br>时间：20250603<br><br>
+_ABOUT_HTML = """<div style="font-size: 10pt;"><b>名称：URL Navigator（中文名称：飞歌网址导航）</b><h3><pre>作者：Yifree(开发者昵称)               版本：V0.60             时间：20250611</pre></h3>
+    （一）URL Navigator（飞歌网址导航） 是一款功能丰富的网址导航与书签管理工具，支持书签的添加、编辑、剪切、复制、粘贴、删除、回退、移动、导入、导出、排序、锁定、图标更新、分组管理、智能搜索、语种切换、开魔盒、历史查询、自动备份等功能，帮助用户高效管理和访问保存的网址。<br>
+    （二）💖特色功能："开魔盒"功能可随机浏览收藏的书签中的网站。用户先选择目录范围（不选择时为全部），再输入想打开的网址数量，软件会在选定的范围内随机打开指定数量的网址供浏览，每次浏览的网址图标会显示在“开魔盒”按钮下方，再次开魔盒时刷新。此功能方便保存大量书签的朋友查看自己保存的网站历史。<br>    
+    （三）用户可自行设置网址的书签数据、图标文件、历史记录数据、日志文件的文件夹或名称，也可以设置数据自动备份文件夹（书签数据一般在C:\\Users\\用户名\\.url_navigator\\目录下，名称为bookmarks.json，用户可使用设置功能进行更改）。系统有每日自动备份功能，位置可在设置中更改。<br>
+    （四）可导入chrome等浏览器导出的规范HTML格式书签文件（尽量只有一个层级，在一个目录下，否则速度慢且容易出错），也可以使用本软件导出或备份的json格式书签文件（将书签备份文件名称改为bookmarks.json）直接覆盖掉原来的json文件，速度更快）；用户的书签数据可全部或部分导出为json格式和HTML格式。可搜索网址和查看历史记录，在结果中再打开或定位网址位置。<br>
+    （五）可批量全部或部分更新图标（速度较慢），可将网址卡片按照名称和添加时间排序。为防止误操作，可使用'锁定'功能暂时禁用部分功能，再次点击时解锁。<br>
+    （六）软件有语种选择功能，提供部分语言主要操作界面翻译，满足不同语种使用人员的基本使用。<br>
+    （七）本软件为个人开发，产权属于开发者本人（本页所示作者名称为昵称，权利人为昵称对应的实际开发者）。作者许可您一项个人的、可撤销的、不可转让的、非独占地和非商业的合法使用本产品的权利，您不享有本产品的所有权。作者基于本协议对您的授权仅为授权您个人以非商业的目的对于本产品进行使用，任何超出个人使用目的的使用行为都必须另行获得作者本人具体的、单独的、书面的授权，协议未明示授权的其他一切权利仍由我方保留，您在行使该等权利前须另行获得我方的书面许可，同时我方如未行使前述任何权利，并不构成对该权利的放弃。严禁任何单位和个人未经授权将软件（或将项目改头换面）用于营利或非法用途，否则将追究法律责任。<br>
+    （八）本软件为个人开发，开发者不承担任何责任，请用户自行承担使用风险。<br>
+      💖🌹感谢您的使用！欢迎提出宝贵意见！😊 <br>
+      本项目地址：<a href="https://github.com/yihufree/URL-Navigator">https://github.com/yihufree/URL-Navigator</a> <br> </div>"""
+
+class ThrottledProgress:
+    """
+    进度对话框的节流包装
+    
+    只有进度跨过 1%、距上次更新超过 MIN_INTERVAL 秒或到达最大值时才更新对话框，
+    标签文本未变化时不重复设置，避免频繁重新计算布局和重绘
+    """
+    
+    MIN_INTERVAL = 0.1
+    
+    def __init__(self, dialog):
+        self.dialog = dialog
+        self._last_time = 0.0
+        self._last_percent = -1
+        self._last_text = None
+    
+    def update(self, value, text):
+        """按节流规则更新进度值和标签文本"""
+        maximum = self.dialog.maximum()
+        percent = value * 100 // maximum if maximum > 0 else 0
+        now = time.perf_counter()
+        if (value < maximum and percent == self._last_percent
+                and now - self._last_time < self.MIN_INTERVAL):
+            return
+        self._last_time = now
+        self._last_percent = percent
+        self.dialog.setValue(value)
+        if text != self._last_text:
+            self._last_text = text
+            self.dialog.setLabelText(text)
+
+class TaskProgressDialog(QProgressDialog):
+    """
+    后台任务的进度对话框
+    
+    任务运行期间，取消按钮、Esc 键和标题栏关闭按钮都只发出 canceled 信号请求任务停止，
+    对话框保持显示直到任务真正结束：对话框一旦隐藏，窗口就恢复可操作，
+    而后台线程可能仍在读取书签数据
+    """
+    
+    def __init__(self, label, cancel_text, maximum, parent):
+        super().__init__(label, cancel_text, 0, maximum, parent)
+        self._running = False
+        # 取消按钮默认会立即重置并隐藏对话框，任务运行期间只转发取消请求
+        self.canceled.disconnect(self.cancel)
+        self.canceled.connect(self._on_canceled)
+    
+    def _on_canceled(self):
+        if not self._running:
+            self.cancel()
+    
+    def reject(self):
+        if self._running:
+            self.canceled.emit()
+        else:
+            super().reject()
+    
+    def closeEvent(self, event):
+        if self._running:
+            event.ignore()
+            self.canceled.emit()
+        else:
+            super().closeEvent(event)
+    
+    def run_worker(self, worker):
+        """
+        在线程池中运行后台任务并等待其结束，期间运行局部事件循环，使对话框保持响应
+        
+        Args:
+            worker: 提供 cancel() 方法和 signals.finished 信号的 QRunnable
+        """
+        loop = QEventLoop(self)
+        worker.signals.finished.connect(loop.quit)
+        self.canceled.connect(worker.cancel)
+        # 进度到达最大值时不自动隐藏，任务结束后由调用方关闭
+        auto_close = self.autoClose()
+        self.setAutoClose(False)
+        self._running = True
+        try:
+            QThreadPool.globalInstance().start(worker)
+            loop.exec_()
+        finally:
+            self._running = False
+            self.setAutoClose(auto_close)
+            self.canceled.disconnect(worker.cancel)
+
+class ExportWorkerSignals(QObject):
+    """导出任务的信号"""
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal()
+
+class ExportWorker(QRunnable):
+    """在后台线程中依次执行导出任务"""
+    
+    def __init__(self, jobs, results):
+        super().__init__()
+        self.jobs = jobs
+        self.results = results
+        self.canceled = False
+        self.signals = ExportWorkerSignals()
+    
+    def cancel(self):
+        """请求取消，当前导出任务完成后跳过其余任务"""
+        self.canceled = True
+    
+    def run(self):
+        for value, text, func, arg in self.jobs:
+            if self.canceled:
+                # 被跳过的任务按失败处理
+                self.results.append(None)
+                continue
+            if text is not None:
+                self.signals.progress.emit(value, text)
+            try:
+                self.results.append(func(arg))
+            except Exception as e:
+                logger.error(f"导出任务失败: {e}")
+                self.results.append(e)
+        self.signals.finished.emit()
+
+class IconRefreshWorkerSignals(QObject):
+    """图标刷新任务的信号"""
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal()
+
+class IconRefreshWorker(QRunnable):
+    """在后台线程中为书签关联本地缓存图标并下载缺失的图标"""
+    
+    # 每个阶段最多发出的进度更新次数
+    PROGRESS_STEPS = 100
+    # 并发下载图标的线程数
+    DOWNLOAD_WORKERS = 16
+    
+    def __init__(self, favicon_service, bookmarks, force_refresh_all, stats, updates):
+        super().__init__()
+        self.favicon_service = favicon_service
+        self.bookmarks = bookmarks
+        self.force_refresh_all = force_refresh_all
+        self.stats = stats
+        # 图标更新结果 [(书签字典, 新图标路径)]，由界面线程在任务结束后统一写回数据
+        self.updates = updates
+        # 第一阶段已关联本地缓存图标的书签（按对象id记录）
+        self._linked = set()
+        self.canceled = False
+        self.signals = IconRefreshWorkerSignals()
+    
+    def cancel(self):
+        """请求取消，处理完当前书签后停止"""
+        self.canceled = True
+    
+    def run(self):
+        try:
+            self._check_local_icons()
+            if not self.canceled:
+                self._download_icons()
+        finally:
+            self.signals.finished.emit()
+    
+    @staticmethod
+    def _has_icon(item):
+        """判断书签当前图标是否存在且不是默认图标（只调用一次 os.stat）"""
+        current_icon = item.get("icon", "")
+        if not current_icon or current_icon.endswith(DEFAULT_ICON_NAME):
+            return False
+        try:
+            return os.stat(current_icon).st_size > 0
+        except OSError:
+            return False
+    
+    def _should_report(self, i):
+        """是否需要发出进度更新（每个阶段最多 PROGRESS_STEPS 次）"""
+        total = len(self.bookmarks)
+        return i % max(1, total // self.PROGRESS_STEPS) == 0 or i == total - 1
+    
+    def _check_local_icons(self):
+        """第一阶段：检查本地缓存并关联"""
+        total = len(self.bookmarks)
+        self.signals.progress.emit(0, "第一阶段：检查本地缓存图标...")
+        for i, (path, name, item) in enumerate(self.bookmarks):
+            if self.canceled:
+                break
+            
+            # 更新进度
+            if self._should_report(i):
+                self.signals.progress.emit(i + 1, f"检查本地缓存 ({i + 1}/{total}): {name}")
+            
+            try:
+                url = item["url"]
+                
+                # 如果选择仅更新缺失图标且当前图标存在，则跳过（强制更新时不检查图标文件）
+                if not self.force_refresh_all and self._has_icon(item):
+                    self.stats["skipped"] += 1
+                    logger.info(f"跳过已有图标: {name}")
+                    continue
+                
+                # 检查本地缓存中是否有该网址的图标
+                local_icon = self.favicon_service.check_local_icon_exists(url)
+                if local_icon:
+                    # 如果本地缓存中有图标，直接关联
+                    self.updates.append((item, local_icon))
+                    self._linked.add(id(item))
+                    self.stats["local_cache"] += 1
+                    logger.info(f"使用本地缓存图标: {name}")
+                    
+            except Exception as e:
+                logger.error(f"检查本地缓存失败 ({name}): {e}")
+    
+    def _download_icons(self):
+        """第二阶段：对没有本地缓存的图标用线程池并发进行网络下载"""
+        total = len(self.bookmarks)
+        self.signals.progress.emit(total, "第二阶段：网络下载缺失图标...")
+        
+        # 先筛选出需要下载的书签
+        pending = []
+        for path, name, item in self.bookmarks:
+            try:
+                url = item["url"]
+                
+                # 已经在第一阶段关联了本地缓存图标
+                if id(item) in self._linked:
+                    continue
+                
+                # 如果选择仅更新缺失图标且当前图标存在，则跳过（强制更新时不检查图标文件）
+                if not self.force_refresh_all and self._has_icon(item):
+                    continue
+                
+                pending.append((name, item, url))
+            except Exception as e:
+                logger.error(f"网络下载图标失败 ({name}): {e}")
+        
+        # 下载以网络等待为主，并发提交到线程池，按完成顺序更新书签和进度
+        skipped = total - len(pending)
+        with ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(self.favicon_service.get_favicon, url, force_refresh=True): (name, item)
+                for name, item, url in pending
+            }
+            for i, future in enumerate(as_completed(futures), skipped):
+                name, item = futures[future]
+                if self.canceled:
+                    # 取消尚未开始的下载，已开始的下载完成后丢弃结果
+                    for f in futures:
+                        f.cancel()
+                    break
+                
+                # 更新进度
+                if self._should_report(i):
+                    self.signals.progress.emit(total + i + 1, f"网络下载图标 ({i + 1}/{total}): {name}")
+                
+                try:
+                    new_icon = future.result()
+                    
+                    # 记录书签的新图标
+                    if new_icon:
+                        self.updates.append((item, new_icon))
+                        self.stats["network_download"] += 1
+                        
+                except Exception as e:
+                    logger.error(f"网络下载图标失败 ({name}): {e}")
+
 class MainWindow(QWidget):
     """主窗口"""
     
     # 定义信号
     closing = pyqtSignal()
     
+    # 工具栏图标缓存，键为图标名称或资源相对路径，所有窗口实例共享
+    _ICONS = {}
+    # 关于对话框中的信息图标，首次使用时创建
+    _about_icon = None
+    
+    @classmethod
+    def _icon(cls, key):
+        """获取缓存的工具栏图标，key 可以是 ICON_PATHS 中的文件名或图标名称"""
+        icon = cls._ICONS.get(key)
+        if icon is None:
+            icon_path = ICON_PATHS.get(key)
+            if icon_path is not None:
+                icon = QIcon(icon_path)
+            else:
+                icon = icon_provider.get_icon(key)
+            cls._ICONS[key] = icon
+        return icon
+    
     def __init__(self, app):
         super().__init__()
         self.app = app
         self.undo_stack = []  # 撤销栈
         self.sort_mode = 'name'  # 默认按名字排序
         self.is_locked = False  # 添加锁定状态变量
+        # 导入、导出和刷新图标过程中的进度对话框（ThrottledProgress 包装）
+        self._import_progress_dialog = None
+        self._export_progress_dialog = None
+        self._icon_refresh_progress_dialog = None
+        self._icon_refresh_running = False  # 图标刷新任务是否正在运行
+        self._msgbox = None  # 共享的消息框，首次使用时创建
+        self._about_dialog = None  # 关于对话框，首次显示时创建
+        # 上次应用到按钮的状态签名，状态未变化时跳过按钮更新
+        self._last_action_state = None
+        self._last_selection_state = None
         self.blind_box_manager = BlindBoxManager(app.data_manager, app.config)  # 网站盲盒管理器
         
         # 连接语言切换信号
@@ -58,25 +419,30 @@ class MainWindow(QWidget):
         toolbar.setIconSize(QtCore.QSize(32, 32))
         toolbar.setStyleSheet("QToolBar { spacing: 1px; }")  # 进一步减小工具栏按钮间距
         
+        # 一次取出主窗口的全部翻译文本
+        texts = language_manager.tr_namespace("main_window")
+        def tr(key):
+            return texts.get(key, f"main_window.{key}")
+        
         # 先创建所有QAction
-        self.add_url_action = QAction(icon_provider.get_icon("globe"), language_manager.tr("main_window.add_url"), self)
-        self.edit_url_action = QAction(QIcon(resource_path("resources/icons/editurl.png")), language_manager.tr("main_window.edit_url"), self)
-        self.add_folder_action = QAction(icon_provider.get_icon("folder"), language_manager.tr("main_window.add_folder"), self)
-        self.rename_action = QAction(icon_provider.get_icon("edit"), language_manager.tr("main_window.rename"), self)
-        self.cut_action = QAction(QIcon(resource_path("resources/icons/cut.ico")), language_manager.tr("main_window.cut"), self)
-        self.copy_action = QAction(icon_provider.get_icon("copy"), language_manager.tr("main_window.copy"), self)
-        self.paste_action = QAction(icon_provider.get_icon("paste"), language_manager.tr("main_window.paste"), self)
-        self.delete_action = QAction(icon_provider.get_icon("delete"), language_manager.tr("main_window.delete"), self)
-        self.import_action = QAction(icon_provider.get_icon("import"), language_manager.tr("main_window.import"), self)
-        self.export_action = QAction(icon_provider.get_icon("export"), language_manager.tr("main_window.export"), self)
-        self.refresh_icons_action = QAction(icon_provider.get_icon("refresh"), language_manager.tr("main_window.refresh"), self)
-        self.search_action = QAction(icon_provider.get_icon("search"), language_manager.tr("main_window.search"), self)
-        self.settings_action = QAction(QIcon(resource_path("resources/icons/setup.ico")), language_manager.tr("main_window.settings"), self)
-        self.lock_action = QAction(QIcon(resource_path("resources/icons/lock.ico")), language_manager.tr("main_window.lock"), self)
-        self.about_action = QAction(QIcon(resource_path("resources/icons/info.ico")), language_manager.tr("main_window.about"), self)
-        self.undo_action = QAction(QIcon(resource_path("resources/icons/undo.ico")), language_manager.tr("main_window.undo"), self)
-        self.sort_action = QAction(QIcon(resource_path("resources/icons/sort.ico")), language_manager.tr("main_window.sort"), self)
-        self.open_url_action = QAction(QIcon(resource_path("resources/icons/open.ico")), language_manager.tr("main_window.open_website"), self)
+        self.add_url_action = QAction(self._icon("globe"), tr("add_url"), self)
+        self.edit_url_action = QAction(self._icon("editurl.png"), tr("edit_url"), self)
+        self.add_folder_action = QAction(self._icon("folder"), tr("add_folder"), self)
+        self.rename_action = QAction(self._icon("edit"), tr("rename"), self)
+        self.cut_action = QAction(self._icon("cut.ico"), tr("cut"), self)
+        self.copy_action = QAction(self._icon("copy"), tr("copy"), self)
+        self.paste_action = QAction(self._icon("paste"), tr("paste"), self)
+        self.delete_action = QAction(self._icon("delete"), tr("delete"), self)
+        self.import_action = QAction(self._icon("import"), tr("import"), self)
+        self.export_action = QAction(self._icon("export"), tr("export"), self)
+        self.refresh_icons_action = QAction(self._icon("refresh"), tr("refresh"), self)
+        self.search_action = QAction(self._icon("search"), tr("search"), self)
+        self.settings_action = QAction(self._icon("setup.ico"), tr("settings"), self)
+        self.lock_action = QAction(self._icon("lock.ico"), tr("lock"), self)
+        self.about_action = QAction(self._icon("info.ico"), tr("about"), self)
+        self.undo_action = QAction(self._icon("undo.ico"), tr("undo"), self)
+        self.sort_action = QAction(self._icon("sort.ico"), tr("sort"), self)
+        self.open_url_action = QAction(self._icon("open.ico"), tr("open_website"), self)
 
         # 连接QAction的triggered信号到对应槽函数
         self.add_url_action.triggered.connect(self._add_url)
@@ -98,30 +464,30 @@ class MainWindow(QWidget):
         self.sort_action.triggered.connect(self._toggle_sort_mode)
         self.open_url_action.triggered.connect(self._open_selected_url)  # 连接打开网站按钮点击事件
         
-        # 工具栏按钮配置（顺序、变量、图标、文字、tooltip、槽函数）
+        # 工具栏按钮配置（顺序、变量、文字、最小宽度；槽函数已在上方连接）
         button_configs = [
-            (self.add_url_action, language_manager.tr("main_window.add_url"), self._add_url),
-            (self.edit_url_action, language_manager.tr("main_window.edit_url"), self._edit_selected_url),
-            (self.add_folder_action, language_manager.tr("main_window.add_folder"), self._add_folder),
-            (self.rename_action, language_manager.tr("main_window.edit_folder"), self._rename_selected),
-            (self.cut_action, language_manager.tr("main_window.cut"), self._cut_selected),
-            (self.copy_action, language_manager.tr("main_window.copy"), self._copy_selected),
-            (self.paste_action, language_manager.tr("main_window.paste"), self._paste_selected),
-            (self.delete_action, language_manager.tr("main_window.delete"), self._delete_selected),
-            (self.undo_action, language_manager.tr("main_window.undo"), self._undo_last_action),
-            (self.import_action, language_manager.tr("main_window.import"), self._import_bookmarks),
-            (self.export_action, language_manager.tr("main_window.export"), self._export_bookmarks),
-            (self.refresh_icons_action, language_manager.tr("main_window.refresh"), self._refresh_all_icons),
-            (self.sort_action, language_manager.tr("main_window.sort"), self._toggle_sort_mode),
-            (self.open_url_action, language_manager.tr("main_window.open_website"), self._open_selected_url),
-            (self.settings_action, language_manager.tr("main_window.settings"), self._show_settings_dialog),
-            (self.lock_action, language_manager.tr("main_window.lock"), self._toggle_lock),
-            (self.about_action, language_manager.tr("main_window.about"), self._show_about_dialog),
+            (self.add_url_action, self.add_url_action.text(), 60),
+            (self.edit_url_action, self.edit_url_action.text(), 50),
+            (self.add_folder_action, self.add_folder_action.text(), 60),
+            (self.rename_action, tr("edit_folder"), 50),
+            (self.cut_action, self.cut_action.text(), 50),
+            (self.copy_action, self.copy_action.text(), 50),
+            (self.paste_action, self.paste_action.text(), 50),
+            (self.delete_action, self.delete_action.text(), 50),
+            (self.undo_action, self.undo_action.text(), 50),
+            (self.import_action, self.import_action.text(), 50),
+            (self.export_action, self.export_action.text(), 50),
+            (self.refresh_icons_action, self.refresh_icons_action.text(), 50),
+            (self.sort_action, self.sort_action.text(), 50),
+            (self.open_url_action, self.open_url_action.text(), 70),
+            (self.settings_action, self.settings_action.text(), 50),
+            (self.lock_action, self.lock_action.text(), 50),
+            (self.about_action, self.about_action.text(), 50),
         ]
         # 清空toolbar原有action
         toolbar.clear()
         # 依次添加自定义按钮
-        for action, text, slot in button_configs:
+        for action, text, min_width in button_configs:
             btn = QToolButton()
             btn.setDefaultAction(action)
             if action == self.paste_action: # 新增判断
@@ -129,18 +495,14 @@ class MainWindow(QWidget):
                 btn.setAutoRaise(False)  # <--- 新增这一行
             btn.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
             btn.setText(text)
-            btn.setMinimumWidth(50)  # 减小按钮最小宽度
-            if text in ["添加网址", "添加目录"]:
-                btn.setMinimumWidth(60)  # 减小特定按钮宽度
-            elif text == "打开网站":
-                btn.setMinimumWidth(70)  # 减小打开网站按钮宽度
+            btn.setMinimumWidth(min_width)
             btn.setSizePolicy(btn.sizePolicy().horizontalPolicy(), btn.sizePolicy().verticalPolicy())
             toolbar.addWidget(btn)
         
         # 添加垂直分隔线
         separator = QWidget()
         separator.setFixedWidth(1)
-        separator.setStyleSheet("background-color: #CCCCCC;")  # 设置分隔线颜色
+        separator.setStyleSheet(_SEPARATOR_QSS)  # 设置分隔线颜色
         separator.setFixedHeight(40)  # 设置分隔线高度
         toolbar.addWidget(separator)
         
@@ -151,7 +513,7 @@ class MainWindow(QWidget):
         
         # 添加搜索输入框
         self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText(language_manager.tr("main_window.search_placeholder"))
+        self.search_edit.setPlaceholderText(tr("search_placeholder"))
         self.search_edit.returnPressed.connect(self._search)
         self.search_edit.setMinimumWidth(50)  # 设置搜索框宽度在100-200之间
         self.search_edit.setMaximumWidth(750)  # 最大宽度限制
@@ -167,7 +529,6 @@ class MainWindow(QWidget):
         search_layout.addWidget(search_btn)
 
         # === 添加语言选择下拉框 ===
-        from PyQt5.QtWidgets import QComboBox
         self.language_combo = QComboBox()
         self.language_combo.setMinimumWidth(90)
         self.language_combo.setMaximumWidth(150)
@@ -177,19 +538,11 @@ class MainWindow(QWidget):
             self.language_combo.addItem(name, code)
             if code == current_language:
                 self.language_combo.setCurrentText(name)
+        # 语言显示名称到代码的映射，切换时直接查找
+        self._lang_name_to_code = {name: code for code, name in available_languages.items()}
         self.language_combo.setToolTip(language_manager.tr("settings.language_label", "语言"))
         # 切换语言时立即生效
-        def on_language_changed(name):
-            for i in range(self.language_combo.count()):
-                if self.language_combo.itemText(i) == name:
-                    code = self.language_combo.itemData(i)
-                    if code != language_manager.get_current_language():
-                        language_manager.set_language(code)
-                        # 保存到设置（与设置界面一致）
-                        if hasattr(self.app, 'settings'):
-                            self.app.settings.setValue("language", code)
-                    break
-        self.language_combo.currentTextChanged.connect(on_language_changed)
+        self.language_combo.currentTextChanged.connect(self._on_language_changed)
         # 设置右侧外边距为10
         search_layout.addWidget(self.language_combo)
         search_layout.setSpacing(5)
@@ -254,99 +607,25 @@ class MainWindow(QWidget):
         self.bookmark_grid.set_breadcrumb_bar(self.breadcrumb_bar)
         middle_layout.addWidget(self.bookmark_grid)
         # --- 新增：连接选中项变化信号 ---
-        self.bookmark_grid.selection_changed.connect(self._update_actions_state)
+        self.bookmark_grid.selection_changed.connect(self._update_actions_state_counts)
         
         splitter.addWidget(middle_widget)
         
         # 创建右侧区域容器（网站盲盒按钮区域）
         self.right_widget = QWidget()
         self.right_widget.setFixedWidth(100)  # 恢复原始宽度
-        right_layout = QVBoxLayout(self.right_widget)
-        right_layout.setContentsMargins(5, 5, 5, 5)
-        right_layout.setSpacing(10)
-        
-        # 创建"Magic Box 开魔盒"文本标签
-        self.magic_box_label = QLabel("MagicBox\n开魔盒")
-        self.magic_box_label.setAlignment(Qt.AlignCenter)
-        self.magic_box_label.setStyleSheet("""
-            QLabel {
-                color: #8B0040;
-                font-size: 18px;
-                font-weight: bold;
-                font-family: "方正古隶简体", "华文隶书", "华文琥珀", "SimSun", serif;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-                background: transparent;
-                margin: 5px;
-                line-height: 1.2;
-            }
-        """)
-        # 初始状态隐藏标签
-        self.magic_box_label.hide()
-        
-        # 创建网站盲盒按钮
-        self.blind_box_button = QPushButton()
-        self.blind_box_button.setFixedSize(90, 90)  # 设置为90x90像素的正方形
-        self.blind_box_button.setToolTip(language_manager.tr("tooltips.blind_box_tooltip", "网站盲盒 - 随机打开网站"))
-        self.blind_box_button.clicked.connect(self._show_blind_box_dialog)
-        
-        # 设置圆形按钮样式
-        manghe_icon_path = resource_path("resources/icons/manghe.png").replace("\\", "/")
-        self.blind_box_button.setStyleSheet(f"""
-            QPushButton {{
-                border-radius: 45px;
-                background-color: #f0ad4e;
-                background-image: url({manghe_icon_path});
-                background-position: center;
-                background-repeat: no-repeat;
-                background-size: 60px 60px;
-                border: 2px solid #ec971f;
-            }}
-            QPushButton:hover {{
-                background-color: #ec971f;
-                border: 2px solid #d58512;
-            }}
-            QPushButton:pressed {{
-                background-color: #d58512;
-                border: 2px solid #b8741f;
-            }}
-        """)
-        
-        # 创建随机网址图标显示区域
-        self.random_urls_scroll = QScrollArea()
-        self.random_urls_scroll.setWidgetResizable(True)
-        self.random_urls_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.random_urls_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.random_urls_scroll.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                background-color: #f9f9f9;
-            }
-        """)
-        
-        # 创建图标容器
-        self.random_urls_container = QWidget()
-        self.random_urls_layout = QVBoxLayout(self.random_urls_container)
-        self.random_urls_layout.setAlignment(Qt.AlignTop)
-        self.random_urls_layout.setContentsMargins(3, 3, 3, 3)
-        self.random_urls_layout.setSpacing(5)
-        self.random_urls_scroll.setWidget(self.random_urls_container)
-        
-        # 添加标签、按钮和图标显示区域到右侧布局
-        # 使"Magic Box 开魔盒"标签上方与左侧网址标签区域边框在同一水平线上
-        right_layout.addWidget(self.magic_box_label, 0, Qt.AlignCenter)
-        # 为两行文字标签和按钮之间增加间距
-        right_layout.addSpacing(10)
-        right_layout.addWidget(self.blind_box_button, 0, Qt.AlignCenter)
-        # 为"网站盲盒"按钮的动画运动预留空间
-        right_layout.addSpacing(20)  # 增加按钮与图标显示框之间的间距
-        right_layout.addWidget(self.random_urls_scroll, 3)  # 增加权重，使其占据更多空间
+        # 面板内容在首次需要显示时再创建
+        self._right_built = False
         
         splitter.addWidget(self.right_widget)
         
         # 设置分割器初始大小（左侧200，中间700，右侧100）
         splitter.setSizes([200, 700, 100])
         
+        # 禁止面板被拖动折叠，由Qt直接限制最小尺寸
+        for i in range(splitter.count()):
+            splitter.setCollapsible(i, False)
+        
         # 保存分割器为类成员变量以便后续访问
         self.splitter = splitter
         
@@ -370,7 +649,6 @@ class MainWindow(QWidget):
                 border: 10px solid #7a8ba7;
                 border-radius: 12px;
                 background: #f8f9fa;
-                box-shadow: 0 0 0 4px #c7d0e0 inset;
             }
         """)
         self.setObjectName("MainWindow")
@@ -388,6 +666,16 @@ class MainWindow(QWidget):
         
         logger.info("主窗口初始化完成")
     
+    @pyqtSlot(str)
+    def _on_language_changed(self, name):
+        """语言下拉框选择变化时切换界面语言"""
+        code = self._lang_name_to_code.get(name)
+        if code and code != language_manager.get_current_language():
+            language_manager.set_language(code)
+            # 保存到设置（与设置界面一致）
+            if hasattr(self.app, 'settings'):
+                self.app.settings.setValue("language", code)
+    
     def _navigate_to(self, path):
         """导航到指定路径"""
         self.folder_tree.select_path(path)
@@ -399,28 +687,66 @@ class MainWindow(QWidget):
         self.bookmark_grid.set_current_path([])
     
     def _on_splitter_moved(self, pos, index):
-        """处理分割器移动事件，确保两侧面板都有最小宽度"""
+        """处理分割器移动事件，确保左侧和中间面板都有最小宽度"""
         MIN_WIDTH = 50  # 最小宽度限制（像素）
         
-        # 获取当前窗口总宽度
-        total_width = self.width()
-        
-        # 获取当前分割位置
+        # 获取当前分割位置（左侧、中间、右侧）
         sizes = self.splitter.sizes()
         
-        # 检查左侧面板宽度是否满足最小要求
+        # 不足最小宽度的面板补足差额，差额从相邻面板扣除，总宽度保持不变
         if sizes[0] < MIN_WIDTH:
-            # 调整分割位置，确保左侧面板有最小宽度
+            delta = MIN_WIDTH - sizes[0]
             sizes[0] = MIN_WIDTH
-            sizes[1] = total_width - MIN_WIDTH - self.splitter.handleWidth()
-            self.splitter.setSizes(sizes)
-        
-        # 检查右侧面板宽度是否满足最小要求
+            sizes[1] = max(MIN_WIDTH, sizes[1] - delta)
         elif sizes[1] < MIN_WIDTH:
-            # 调整分割位置，确保右侧面板有最小宽度
+            delta = MIN_WIDTH - sizes[1]
             sizes[1] = MIN_WIDTH
-            sizes[0] = total_width - MIN_WIDTH - self.splitter.handleWidth()
-            self.splitter.setSizes(sizes)
+            sizes[0] = max(MIN_WIDTH, sizes[0] - delta)
+        else:
+            return
+        
+        # 调整时屏蔽信号，避免再次触发本方法
+        self.splitter.blockSignals(True)
+        self.splitter.setSizes(sizes)
+        self.splitter.blockSignals(False)
+    
+    def _show_message(self, icon, title, text, buttons=QMessageBox.Ok, default_button=QMessageBox.NoButton):
+        """
+        使用主窗口共享的消息框显示消息，避免每次创建新的对话框
+        
+        Returns:
+            用户点击的标准按钮
+        """
+        box = self._msgbox
+        temporary = False
+        if box is None:
+            box = self._msgbox = QMessageBox(self)
+        elif box.isVisible():
+            # 共享消息框正在显示（嵌套调用），临时创建一个，用完后释放
+            box = QMessageBox(self)
+            temporary = True
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.setDefaultButton(default_button)
+        try:
+            return box.exec_()
+        finally:
+            if temporary:
+                box.deleteLater()
+    
+    def _information(self, title, text):
+        """显示提示消息"""
+        return self._show_message(QMessageBox.Information, title, text)
+    
+    def _warning(self, title, text):
+        """显示警告消息"""
+        return self._show_message(QMessageBox.Warning, title, text)
+    
+    def _question(self, title, text, buttons=QMessageBox.Yes | QMessageBox.No, default_button=QMessageBox.NoButton):
+        """显示询问消息，返回用户点击的按钮"""
+        return self._show_message(QMessageBox.Question, title, text, buttons, default_button)
     
     def _rename_selected(self):
         """重命名选中的文件夹"""
@@ -433,7 +759,7 @@ class MainWindow(QWidget):
         # 获取当前选中的路径
         selected_path = self.folder_tree.get_selected_path()
         if not selected_path:
-            QMessageBox.information(self, "提示", "请先选择要重命名的文件夹")
+            self._information("提示", "请先选择要重命名的文件夹")
             return
         
         # 获取文件夹名称和路径
@@ -449,25 +775,34 @@ class MainWindow(QWidget):
         )
         
         if ok and new_name and new_name != folder_name:
-            # 重命名文件夹
-            success = self.app.data_manager.update_item(
-                parent_path,
-                folder_name,
-                new_name,
-                {}
-            )
+            # 当前显示的是该文件夹或其下级时，需要同步更新卡片区路径
+            current_path = self.bookmark_grid.current_path
+            is_current = is_subpath(current_path, selected_path)
+            new_path = parent_path + [new_name] + list(current_path[len(selected_path):])
+            
+            # 批量修改结束时才发出数据变化信号并保存；在此之前先切换卡片区路径，
+            # 使卡片区只按新路径刷新一次
+            with self.app.data_manager.batch():
+                # 重命名文件夹
+                success = self.app.data_manager.update_item(
+                    parent_path,
+                    folder_name,
+                    new_name,
+                    {}
+                )
+                if success and is_current:
+                    self.bookmark_grid.current_path = new_path
+                    self.bookmark_grid.highlighted_item = None
             
             if success:
-                self.app.data_manager.save()
-                QMessageBox.information(self, "编辑目录成功", f"目录已重命名为: {new_name}")
+                self._information("编辑目录成功", f"目录已重命名为: {new_name}")
                 
-                # 如果是当前显示的文件夹，更新路径
-                if self.bookmark_grid.current_path == selected_path:
-                    new_path = parent_path + [new_name]
+                # 如果是当前显示的文件夹，在目录树中选中新路径
+                if is_current:
                     self.folder_tree.select_path(new_path)
-                    self.bookmark_grid.set_current_path(new_path)
+                    self.update_status_bar()
             else:
-                QMessageBox.warning(self, "编辑目录失败", "无法重命名目录，可能是名称已存在")
+                self._warning("编辑目录失败", "无法重命名目录，可能是名称已存在")
     
     def _delete_selected(self):
         """删除选中的项目（优先删除卡片区选中项，弹出自定义确认消息框）"""
@@ -495,32 +830,41 @@ class MainWindow(QWidget):
                 if folder_count:
                     msg_parts.append(f"{folder_count}个文件夹")
                 msg = "你确定要删除" + "、".join(msg_parts) + "吗？"
-            reply = QMessageBox.question(self, "确认删除", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            reply = self._question("确认删除", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
                 self.bookmark_grid._batch_delete(confirm_from_main=True)
             return
         # 否则删除左侧文件夹树选中的文件夹
         selected_path = self.folder_tree.get_selected_path()
         if not selected_path:
-            QMessageBox.information(self, "提示", "请先选择要删除的文件夹或卡片")
+            self._information("提示", "请先选择要删除的文件夹或卡片")
             return
         folder_name = selected_path[-1]
         msg = f'你确定要删除"{folder_name}"文件夹吗？'
-        reply = QMessageBox.question(self, "确认删除", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        reply = self._question("确认删除", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            # 删除文件夹
-            success = self.app.data_manager.delete_item(selected_path[:-1], folder_name)
+            # 当前显示的是该文件夹或其下级时，需要返回上一级
+            parent_path = selected_path[:-1]
+            is_current = is_subpath(self.bookmark_grid.current_path, selected_path)
+            
+            # 批量修改结束时才发出数据变化信号并保存；在此之前先切换卡片区路径，
+            # 使卡片区只按新路径刷新一次
+            with self.app.data_manager.batch():
+                # 删除文件夹
+                success = self.app.data_manager.delete_item(parent_path, folder_name)
+                if success and is_current:
+                    self.bookmark_grid.current_path = parent_path
+                    self.bookmark_grid.highlighted_item = None
             
             if success:
-                self.app.data_manager.save()
-                QMessageBox.information(self, "删除成功", f"文件夹 {folder_name} 已删除")
+                self._information("删除成功", f"文件夹 {folder_name} 已删除")
                 
-                # 如果是当前显示的文件夹，返回上一级
-                if self.bookmark_grid.current_path == selected_path:
-                    self.folder_tree.select_path(selected_path[:-1])
-                    self.bookmark_grid.set_current_path(selected_path[:-1])
+                # 如果是当前显示的文件夹，在目录树中选中上一级
+                if is_current:
+                    self.folder_tree.select_path(parent_path)
+                    self.update_status_bar()
             else:
-                QMessageBox.warning(self, "删除失败", "无法删除文件夹")
+                self._warning("删除失败", "无法删除文件夹")
     
     def _add_url(self):
         """添加URL"""
@@ -553,9 +897,9 @@ class MainWindow(QWidget):
             
             if success:
                 self.app.data_manager.save()
-                QMessageBox.information(self, "添加成功", f"已添加网址: {url_data['name']}")
+                self._information("添加成功", f"已添加网址: {url_data['name']}")
             else:
-                QMessageBox.warning(self, "添加失败", "无法添加网址，可能是名称已存在")
+                self._warning("添加失败", "无法添加网址，可能是名称已存在")
     
     def _add_folder(self):
         """添加文件夹"""
@@ -583,7 +927,7 @@ class MainWindow(QWidget):
             
             if success:
                 self.app.data_manager.save()
-                QMessageBox.information(self, "添加成功", f"已添加文件夹: {folder_name}")
+                self._information("添加成功", f"已添加文件夹: {folder_name}")
                 
                 # 如果是在根目录添加，刷新文件夹树，并选择新文件夹
                 if not current_path:
@@ -591,7 +935,7 @@ class MainWindow(QWidget):
                     self.folder_tree.select_path([folder_name])
                     self.bookmark_grid.set_current_path([folder_name])
             else:
-                QMessageBox.warning(self, "添加失败", "无法添加文件夹，可能是名称已存在")
+                self._warning("添加失败", "无法添加文件夹，可能是名称已存在")
     
     def _import_bookmarks(self):
         """导入书签"""
@@ -613,25 +957,24 @@ class MainWindow(QWidget):
             
         # 文件安全验证和用户通知
         try:
-            # 验证文件是否存在
-            if not os.path.exists(file_path):
-                QMessageBox.warning(self, "导入书签", "选择的文件不存在")
+            # 验证文件是否存在（一次stat同时取得文件大小）
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                self._warning("导入书签", "选择的文件不存在")
                 return
                 
             # 验证文件大小
-            file_size_mb = os.path.getsize(file_path) / (1024*1024)
-            MAX_SIZE_MB = 3
-            if file_size_mb > MAX_SIZE_MB:
-                QMessageBox.warning(
-                    self, 
+            file_size_mb = file_stat.st_size / (1024*1024)
+            if file_size_mb > MAX_IMPORT_SIZE_MB:
+                self._warning(
                     "文件太大", 
-                    f"所选文件大小为 {file_size_mb:.1f} MB，超过了 {MAX_SIZE_MB} MB 的限制。\n请选择更小的文件。"
+                    f"所选文件大小为 {file_size_mb:.1f} MB，超过了 {MAX_IMPORT_SIZE_MB} MB 的限制。\n请选择更小的文件。"
                 )
                 return
                 
             # 用户安全提醒
-            reply = QMessageBox.question(
-                self,
+            reply = self._question(
                 "导入书签",
                 f"您正在导入外部文件: \n{file_path}\n\n导入外部文件可能存在安全风险。确定要继续吗？",
                 QMessageBox.Yes | QMessageBox.No,
@@ -641,7 +984,7 @@ class MainWindow(QWidget):
             if reply != QMessageBox.Yes:
                 return
         except Exception as e:
-            QMessageBox.warning(self, "导入书签", f"文件验证错误: {str(e)}")
+            self._warning("导入书签", f"文件验证错误: {str(e)}")
             return
         
         # 创建进度对话框
@@ -653,29 +996,38 @@ class MainWindow(QWidget):
         progress.show()
         
         # 连接信号
-        self.app.import_export_service.import_progress.connect(
-            lambda value, text: progress.setValue(value) or progress.setLabelText(text)
-        )
+        service = self.app.import_export_service
+        self._import_progress_dialog = ThrottledProgress(progress)
+        service.import_progress.connect(self._on_import_progress)
         
-        # 根据文件类型选择导入方法
-        file_ext = os.path.splitext(file_path)[1].lower()
-        if file_ext in ['.json']:
-            # JSON导入
-            count = self.app.import_export_service.import_json(file_path)
-            import_type = "JSON"
-        else:
-            # HTML导入（默认）
-            count = self.app.import_export_service.import_html(file_path)
-            import_type = "HTML"
-        
-        # 断开信号
-        self.app.import_export_service.import_progress.disconnect()
+        try:
+            # 根据文件类型选择导入方法
+            file_ext = os.path.splitext(file_path)[1].lower()
+            if file_ext in ['.json']:
+                # JSON导入
+                count = service.import_json(file_path)
+                import_type = "JSON"
+            else:
+                # HTML导入（默认）
+                count = service.import_html(file_path)
+                import_type = "HTML"
+        finally:
+            # 只断开本方法连接的槽，不影响其他接收者
+            service.import_progress.disconnect(self._on_import_progress)
+            self._import_progress_dialog = None
         
         if count > 0:
-            QMessageBox.information(self, "导入成功", f"已成功从{import_type}文件导入 {count} 个书签")
+            self._information("导入成功", f"已成功从{import_type}文件导入 {count} 个书签")
         else:
-            QMessageBox.warning(self, "导入失败", f"导入书签失败，请检查{import_type}文件格式")
-            
+            self._warning("导入失败", f"导入书签失败，请检查{import_type}文件格式")
+            
+    @pyqtSlot(int, str)
+    def _on_import_progress(self, value, text):
+        """更新导入进度对话框"""
+        progress = self._import_progress_dialog
+        if progress is not None:
+            progress.update(value, text)
+    
     def _export_bookmarks(self):
         """导出书签"""
         # 如果处于锁定状态，则阻止操作
@@ -707,17 +1059,13 @@ class MainWindow(QWidget):
         """执行导出操作"""
         # 安全验证和用户通知
         try:
-            # 验证文件路径是否安全
-            from utils.file_utils import is_safe_path
-            
             # 获取用户主目录和系统临时目录
             home_dir = os.path.expanduser("~")
             temp_dir = os.path.join(os.path.dirname(os.path.dirname(export_path)), "temp")
             
             # 检查路径是否在用户目录或临时目录中
             if not (is_safe_path(home_dir, export_path) or is_safe_path(temp_dir, export_path)):
-                reply = QMessageBox.question(
-                    self,
+                reply = self._question(
                     "路径安全警告",
                     f"您选择的路径可能不在安全的位置：\n{export_path}\n\n确定要继续吗？",
                     QMessageBox.Yes | QMessageBox.No,
@@ -742,8 +1090,7 @@ class MainWindow(QWidget):
                 folder_name = export_directory[-1] if export_directory else ""
                 operation_name += f"（仅包含「{folder_name}」文件夹）"
                 
-            reply = QMessageBox.question(
-                self,
+            reply = self._question(
                 "导出确认",
                 f"您即将导出{operation_name}到：\n{os.path.dirname(export_path)}\n\n确定要继续吗？",
                 QMessageBox.Yes | QMessageBox.No,
@@ -754,24 +1101,21 @@ class MainWindow(QWidget):
                 return
                 
         except Exception as e:
-            QMessageBox.warning(self, "导出书签", f"文件路径验证错误: {str(e)}")
+            self._warning("导出书签", f"文件路径验证错误: {str(e)}")
             return
         
         # 创建进度对话框
-        progress = QProgressDialog("正在导出...", "取消", 0, 100, self)
+        progress = TaskProgressDialog("正在导出...", "取消", 100, self)
         progress.setWindowTitle("导出中")
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
         progress.setValue(0)
         progress.show()
         
-        # 设置进度条更新函数
-        def update_progress(value, text):
-            progress.setValue(value)
-            progress.setLabelText(text)
-            
-        # 连接信号
-        self.app.import_export_service.export_progress.connect(update_progress)
+        # 导出在后台线程中进行，进度信号经绑定的槽排队回到界面线程
+        service = self.app.import_export_service
+        self._export_progress_dialog = ThrottledProgress(progress)
+        service.export_progress.connect(self._on_export_progress)
         
         success = False
         export_type_name = "未知类型"  # 初始化导出类型名称变量
@@ -781,42 +1125,32 @@ class MainWindow(QWidget):
             if selected_all == 'all':
                 # 准备三种不同类型的文件路径
                 base_dir = os.path.dirname(export_path)
-                # 获取当前日期时间
-                date_str = datetime.datetime.now().strftime('%Y%m%d')
-                time_str = datetime.datetime.now().strftime('%H%M%S')
+                # 获取当前日期时间，三个文件共用同一个时间戳前缀
+                stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+                prefix = os.path.join(base_dir, f"{stamp}_bookmarks")
                 
-                html_path = os.path.join(base_dir, f"{date_str}_{time_str}_bookmarks.html")
-                json_path = os.path.join(base_dir, f"{date_str}_{time_str}_bookmarks.json")
-                log_path = os.path.join(base_dir, f"{date_str}_{time_str}_bookmarks.log")
+                html_path = prefix + ".html"
+                json_path = prefix + ".json"
+                log_path = prefix + ".log"
                 
-                # 导出HTML书签
-                update_progress(0, "正在导出HTML书签...")
-                html_success = self.app.import_export_service.export_html(html_path)
-                
-                # 导出JSON数据
-                update_progress(33, "正在导出JSON数据...")
-                json_success = self.app.import_export_service.export_json(json_path)
-                
-                # 导出日志文件
-                update_progress(66, "正在导出日志文件...")
-                log_success = False
-                try:
-                    if os.path.exists(self.app.log_file):
-                        shutil.copy2(self.app.log_file, log_path)
-                        log_success = True
-                        logger.info(f"日志文件已导出到: {log_path}")
-                except Exception as e:
-                    logger.error(f"导出日志文件失败: {str(e)}")
+                # 依次导出HTML书签、JSON数据和日志文件
+                results = self._run_export_jobs([
+                    (0, "正在导出HTML书签...", service.export_html, html_path),
+                    (33, "正在导出JSON数据...", service.export_json, json_path),
+                    (66, "正在导出日志文件...", self._export_log_file, log_path),
+                ], progress)
+                html_success, json_success, log_success = (
+                    bool(r) and not isinstance(r, Exception) for r in results)
                 
-                update_progress(100, "导出完成")
+                self._on_export_progress(100, "导出完成")
                 
                 # 显示结果
                 success_count = sum([html_success, json_success, log_success])
                 if success_count == 3:
-                    QMessageBox.information(self, "导出成功", f"已成功导出所有3个文件到:\n{os.path.dirname(html_path)}")
+                    self._information("导出成功", f"已成功导出所有3个文件到:\n{os.path.dirname(html_path)}")
                     success = True
                 else:
-                    QMessageBox.warning(self, "导出部分成功", 
+                    self._warning("导出部分成功", 
                         f"成功导出 {success_count}/3 个文件:\n" +
                         f"HTML书签: {'成功' if html_success else '失败'}\n" +
                         f"JSON数据: {'成功' if json_success else '失败'}\n" +
@@ -825,81 +1159,104 @@ class MainWindow(QWidget):
                 
             # 处理单一类型导出
             else:
+                export_func = None
                 # 根据范围选择不同的导出方法
                 if export_scope == 0:  # 全部导出
                     if export_type == 0:  # HTML
-                        success = self.app.import_export_service.export_html(export_path)
+                        export_func = service.export_html
                         export_type_name = "HTML书签"
                     elif export_type == 1:  # JSON
-                        success = self.app.import_export_service.export_json(export_path)
+                        export_func = service.export_json
                         export_type_name = "JSON数据"
                     elif export_type == 2:  # 日志文件
-                        try:
-                            if os.path.exists(self.app.log_file):
-                                shutil.copy2(self.app.log_file, export_path)
-                                success = True
-                                logger.info(f"日志文件已导出到: {export_path}")
-                            else:
-                                QMessageBox.warning(self, "导出失败", f"日志文件不存在: {self.app.log_file}")
-                                success = False
-                        except Exception as e:
-                            logger.error(f"导出日志文件失败: {str(e)}")
-                            QMessageBox.warning(self, "导出失败", f"导出日志文件失败: {str(e)}")
-                            success = False
+                        export_func = self._export_log_file
                         export_type_name = "日志文件"
                 else:  # 导出部分数据
                     if not export_directory:
-                        QMessageBox.warning(self, "导出失败", "未选择要导出的文件夹")
-                        success = False
+                        self._warning("导出失败", "未选择要导出的文件夹")
                     else:
                         folder_name = export_directory[-1]
                         if export_type == 0:  # HTML
-                            success = self.app.import_export_service.export_specific_folder_html(export_path, export_directory)
+                            export_func = functools.partial(service.export_specific_folder_html,
+                                                            folder_path=export_directory)
                             export_type_name = f"HTML书签（{folder_name}文件夹）"
                         elif export_type == 1:  # JSON
-                            success = self.app.import_export_service.export_specific_folder_json(export_path, export_directory)
+                            export_func = functools.partial(service.export_specific_folder_json,
+                                                            folder_path=export_directory)
                             export_type_name = f"JSON数据（{folder_name}文件夹）"
                         elif export_type == 2:  # 日志文件
-                            try:
-                                if os.path.exists(self.app.log_file):
-                                    shutil.copy2(self.app.log_file, export_path)
-                                    success = True
-                                    logger.info(f"日志文件已导出到: {export_path}")
-                                else:
-                                    QMessageBox.warning(self, "导出失败", f"日志文件不存在: {self.app.log_file}")
-                                    success = False
-                            except Exception as e:
-                                logger.error(f"导出日志文件失败: {str(e)}")
-                                QMessageBox.warning(self, "导出失败", f"导出日志文件失败: {str(e)}")
-                                success = False
+                            export_func = self._export_log_file
                             export_type_name = "日志文件"
                 
-                if success:
-                    QMessageBox.information(self, "导出成功", f"已成功导出{export_type_name}到:\n{export_path}")
-                else:
-                    QMessageBox.warning(self, "导出失败", f"导出{export_type_name}失败")
+                if export_func is not None:
+                    result = self._run_export_jobs([(0, None, export_func, export_path)], progress)[0]
+                    if isinstance(result, FileNotFoundError):
+                        self._warning("导出失败", str(result))
+                    elif isinstance(result, Exception):
+                        if export_func != self._export_log_file:
+                            raise result
+                        self._warning("导出失败", f"导出日志文件失败: {str(result)}")
+                    success = bool(result) and not isinstance(result, Exception)
+                    
+                    if success:
+                        self._information("导出成功", f"已成功导出{export_type_name}到:\n{export_path}")
+                    else:
+                        self._warning("导出失败", f"导出{export_type_name}失败")
                 
         except Exception as e:
             logger.error(f"导出失败: {str(e)}")
-            QMessageBox.warning(self, "导出失败", f"导出失败: {str(e)}")
+            self._warning("导出失败", f"导出失败: {str(e)}")
             success = False
         finally:
             # 断开信号
-            self.app.import_export_service.export_progress.disconnect(update_progress)
+            service.export_progress.disconnect(self._on_export_progress)
+            self._export_progress_dialog = None
             progress.close()
     
+    def _run_export_jobs(self, jobs, progress):
+        """
+        在后台线程中依次执行导出任务，期间运行局部事件循环，使进度对话框保持响应
+        
+        Args:
+            jobs: [(进度值, 进度文本, 导出函数, 导出路径)] 列表，进度文本为 None 时不更新进度
+            progress: 进度对话框（TaskProgressDialog），取消时完成当前任务后跳过其余任务
+            
+        Returns:
+            各任务的返回值列表，任务抛出异常时对应位置为该异常，被跳过的任务为 None
+        """
+        results = []
+        worker = ExportWorker(jobs, results)
+        worker.signals.progress.connect(self._on_export_progress)
+        progress.run_worker(worker)
+        return results
+    
+    def _export_log_file(self, export_path):
+        """复制日志文件到导出路径（在导出线程中执行），日志文件不存在时抛出 FileNotFoundError"""
+        if not os.path.exists(self.app.log_file):
+            raise FileNotFoundError(f"日志文件不存在: {self.app.log_file}")
+        fast_copy_file(self.app.log_file, export_path)
+        logger.info(f"日志文件已导出到: {export_path}")
+        return True
+    
+    @pyqtSlot(int, str)
+    def _on_export_progress(self, value, text):
+        """更新导出进度对话框"""
+        progress = self._export_progress_dialog
+        if progress is not None:
+            progress.update(value, text)
+    
     def _search(self):
         """搜索书签"""
         query = self.search_edit.text().strip()
         if not query:
-            QMessageBox.information(self, "搜索", "请输入搜索关键词")
+            self._information("搜索", "请输入搜索关键词")
             return
         
         try:
             results = self.app.data_manager.search(query)
             
             if not results:
-                QMessageBox.information(self, "搜索结果", "没有找到匹配的书签")
+                self._information("搜索结果", "没有找到匹配的书签")
                 return
             
             dialog = SearchDialog(results, self)
@@ -923,28 +1280,29 @@ class MainWindow(QWidget):
                     if self.status_bar:
                         self.status_bar.showMessage(message, 3000)
                     
-                    # 查找并选中该项目
-                    for w, name, typ in getattr(self.bookmark_grid, '_item_widgets', []):
-                        if name == item_name:
-                            # 设置选中状态
-                            self.bookmark_grid.selected_items = [(name, typ)]
-                            self.bookmark_grid.refresh()
+                    # 通过名称索引查找并选中该项目
+                    widgets_by_name = getattr(self.bookmark_grid, '_item_widgets_by_name', {})
+                    w = widgets_by_name.get(item_name)
+                    if w is not None:
+                        typ = w.item["type"]
+                        # 设置选中状态
+                        self.bookmark_grid.selected_items = [(item_name, typ)]
+                        self.bookmark_grid.refresh()
+                        
+                        # 如果是URL类型，可以选择自动打开
+                        if typ == "url":
+                            # 询问用户是否要打开此URL
+                            reply = self._question(
+                                "打开网址",
+                                f"是否要打开选中的网址 '{item_name}'?",
+                                QMessageBox.Yes | QMessageBox.No,
+                                QMessageBox.Yes
+                            )
                             
-                            # 如果是URL类型，可以选择自动打开
-                            if typ == "url":
-                                # 询问用户是否要打开此URL
-                                reply = QMessageBox.question(
-                                    self,
-                                    "打开网址",
-                                    f"是否要打开选中的网址 '{name}'?",
-                                    QMessageBox.Yes | QMessageBox.No,
-                                    QMessageBox.Yes
-                                )
-                                
-                                if reply == QMessageBox.Yes:
-                                    # 调用打开URL方法
-                                    w._open_url()
-                            break
+                            if reply == QMessageBox.Yes:
+                                # 刷新后卡片可能已重建，重新从索引获取后调用打开URL方法
+                                w = self.bookmark_grid._item_widgets_by_name.get(item_name, w)
+                                w._open_url()
             
             # 如果进行了删除操作，刷新UI
             if hasattr(dialog, 'deletion_performed') and dialog.deletion_performed:
@@ -952,10 +1310,14 @@ class MainWindow(QWidget):
                 
         except Exception as e:
             logging.error(f"搜索出错: {str(e)}")
-            QMessageBox.warning(self, "搜索失败", f"搜索过程中发生错误：{str(e)}")
+            self._warning("搜索失败", f"搜索过程中发生错误：{str(e)}")
     
     def _refresh_all_icons(self):
         """批量更新网址的图标"""
+        # 上一次刷新仍在运行时不重复启动（嵌套的事件循环会打乱进度对话框状态）
+        if self._icon_refresh_running:
+            return
+        
         # 如果处于锁定状态，则阻止操作
         if self.is_locked:
             self._show_locked_message()
@@ -972,8 +1334,7 @@ class MainWindow(QWidget):
 
 如返回重新选择请点击"取消（Cancel）"，如确定更新全部图标请点击"确定（OK）"。"""
             
-            reply = QMessageBox.question(
-                self,
+            reply = self._question(
                 "更新范围提示",
                 message,
                 QMessageBox.Ok | QMessageBox.Cancel,
@@ -1034,8 +1395,7 @@ class MainWindow(QWidget):
             confirm_message = f"这将{confirm_text}网址的图标，可能需要较长时间。是否继续？"
             
         # 确认操作
-        reply = QMessageBox.question(
-            self,
+        reply = self._question(
             f"{title_prefix}确认",
             confirm_message,
             QMessageBox.Yes | QMessageBox.No,
@@ -1046,7 +1406,7 @@ class MainWindow(QWidget):
             return
         
         # 创建进度对话框
-        progress = QProgressDialog("正在刷新图标...", "取消", 0, 100, self)
+        progress = TaskProgressDialog("正在刷新图标...", "取消", 100, self)
         progress.setWindowTitle(title_prefix)
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
@@ -1072,7 +1432,7 @@ class MainWindow(QWidget):
             
             total_bookmarks = len(all_bookmarks)
             if total_bookmarks == 0:
-                QMessageBox.information(self, title_prefix, "没有找到需要更新图标的书签")
+                self._information(title_prefix, "没有找到需要更新图标的书签")
                 progress.close()
                 return
             
@@ -1080,82 +1440,32 @@ class MainWindow(QWidget):
             progress.setMaximum(total_bookmarks * 2)  # 两个阶段，所以乘以2
             
             # 统计变量
-            updated_count = 0
-            skipped_count = 0
-            local_cache_count = 0
-            network_download_count = 0
-            
-            # 第一阶段：检查本地缓存并关联
-            progress.setLabelText("第一阶段：检查本地缓存图标...")
-            for i, (path, name, item) in enumerate(all_bookmarks):
-                if progress.wasCanceled():
-                    break
-                
-                # 更新进度
-                progress.setValue(i + 1)
-                progress.setLabelText(f"检查本地缓存 ({i + 1}/{total_bookmarks}): {name}")
-                
-                try:
-                    url = item["url"]
-                    current_icon = item.get("icon", "")
-                    
-                    # 判断当前图标是否存在且不是默认图标
-                    icon_exists = current_icon and os.path.exists(current_icon) and not current_icon.endswith("globe.png")
-                    
-                    # 如果选择仅更新缺失图标且当前图标存在，则跳过
-                    if not force_refresh_all and icon_exists:
-                        skipped_count += 1
-                        logger.info(f"跳过已有图标: {name}")
-                        continue
-                    
-                    # 检查本地缓存中是否有该网址的图标
-                    local_icon = self.app.favicon_service.check_local_icon_exists(url)
-                    if local_icon:
-                        # 如果本地缓存中有图标，直接关联
-                        item["icon"] = local_icon
-                        local_cache_count += 1
-                        logger.info(f"使用本地缓存图标: {name}")
-                        
-                except Exception as e:
-                    logger.error(f"检查本地缓存失败 ({name}): {e}")
-            
-            # 第二阶段：对没有本地缓存的图标进行网络下载
-            progress.setLabelText("第二阶段：网络下载缺失图标...")
-            for i, (path, name, item) in enumerate(all_bookmarks):
-                if progress.wasCanceled():
-                    break
-                
-                # 更新进度
-                progress.setValue(total_bookmarks + i + 1)
-                progress.setLabelText(f"网络下载图标 ({i + 1}/{total_bookmarks}): {name}")
-                
-                try:
-                    url = item["url"]
-                    current_icon = item.get("icon", "")
-                    
-                    # 判断当前图标是否存在且不是默认图标
-                    icon_exists = current_icon and os.path.exists(current_icon) and not current_icon.endswith("globe.png")
-                    
-                    # 如果选择仅更新缺失图标且当前图标存在，则跳过
-                    if not force_refresh_all and icon_exists:
-                        continue
-                    
-                    # 检查是否已经在第一阶段处理过（有本地缓存）
-                    local_icon = self.app.favicon_service.check_local_icon_exists(url)
-                    if local_icon and item.get("icon") == local_icon:
-                        continue  # 已经在第一阶段处理过了
-                    
-                    # 进行网络下载
-                    new_icon = self.app.favicon_service.get_favicon(url, force_refresh=True)
-                    
-                    # 更新书签
-                    if new_icon:
-                        item["icon"] = new_icon
-                        network_download_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"网络下载图标失败 ({name}): {e}")
-            
+            stats = {"local_cache": 0, "network_download": 0, "skipped": 0}
+            icon_updates = []
+            
+            # 在后台线程中检查和下载图标，进度经绑定的槽排队回到界面线程（最多约200次更新），
+            # 取消（含 Esc 键和关闭按钮）后对话框保持显示，直到已开始的下载结束
+            worker = IconRefreshWorker(self.app.favicon_service, all_bookmarks, force_refresh_all, stats, icon_updates)
+            self._icon_refresh_progress_dialog = ThrottledProgress(progress)
+            worker.signals.progress.connect(self._on_icon_refresh_progress)
+            self._icon_refresh_running = True
+            try:
+                progress.run_worker(worker)
+            finally:
+                self._icon_refresh_running = False
+                self._icon_refresh_progress_dialog = None
+            
+            # 后台任务只收集结果，在界面线程中一次性写回书签数据
+            for item, icon in icon_updates:
+                item["icon"] = icon
+            # 图标文件可能是刚下载或覆盖的，清除之前记录的不存在路径和旧的缓存图标
+            icon_provider.invalidate_missing()
+            for icon in {icon for _, icon in icon_updates}:
+                icon_provider.invalidate_icon(icon)
+            
+            local_cache_count = stats["local_cache"]
+            network_download_count = stats["network_download"]
+            skipped_count = stats["skipped"]
             updated_count = local_cache_count + network_download_count
             
             # 保存更改
@@ -1171,48 +1481,57 @@ class MainWindow(QWidget):
             if not force_refresh_all and skipped_count > 0:
                 result_message += f"\n跳过已有图标: {skipped_count} 个"
                 
-            QMessageBox.information(
-                self, 
+            self._information(
                 f"{title_prefix}完成", 
                 result_message
             )
         
         except Exception as e:
             logger.error(f"刷新图标过程中出错: {e}")
-            QMessageBox.warning(self, f"{title_prefix}失败", f"刷新图标过程中出错: {str(e)}")
+            self._warning(f"{title_prefix}失败", f"刷新图标过程中出错: {str(e)}")
         
         finally:
             progress.close()
     
+    @pyqtSlot(int, str)
+    def _on_icon_refresh_progress(self, value, text):
+        """更新图标刷新进度对话框"""
+        progress = self._icon_refresh_progress_dialog
+        if progress is not None:
+            progress.update(value, text)
+    
     def _collect_all_bookmarks(self, items, current_path, result):
-        """递归收集所有书签"""
-        for name, item in items.items():
-            path = current_path.copy()
-            
-            if item["type"] == "folder":
-                # 递归收集子文件夹中的书签
-                self._collect_all_bookmarks(item["children"], path + [name], result)
-            else:
+        """收集所有书签（使用显式栈迭代遍历，顺序与深度优先递归一致）"""
+        # 栈中保存各层文件夹的子项迭代器及其路径，同一文件夹下的书签共用一个路径列表
+        stack = [(iter(items.items()), list(current_path))]
+        push = stack.append
+        pop = stack.pop
+        add = result.append
+        while stack:
+            children, path = stack[-1]
+            for name, item in children:
+                if item["type"] == "folder":
+                    # 进入子文件夹，遍历完后再继续当前文件夹
+                    push((iter(item["children"].items()), path + [name]))
+                    break
                 # 添加书签到结果列表
-                result.append((path, name, item))
+                add((path, name, item))
+            else:
+                pop()
         
         return result
     
     def _show_about_dialog(self):
-        """显示关于对话框"""
-        # message = """<div style="font-size: 10pt;"><b>URL Navigator</b><br>作者：Yifree(开发者昵称)<br>版本：V0.5<br>时间：20250603<br><br>
-        message = """<div style="font-size: 10pt;"><b>名称：URL Navigator（中文名称：飞歌网址导航）</b><h3><pre>作者：Yifree(开发者昵称)               版本：V0.60             时间：20250611</pre></h3>
-    （一）URL Navigator（飞歌网址导航） 是一款功能丰富的网址导航与书签管理工具，支持书签的添加、编辑、剪切、复制、粘贴、删除、回退、移动、导入、导出、排序、锁定、图标更新、分组管理、智能搜索、语种切换、开魔盒、历史查询、自动备份等功能，帮助用户高效管理和访问保存的网址。<br>
-    （二）💖特色功能："开魔盒"功能可随机浏览收藏的书签中的网站。用户先选择目录范围（不选择时为全部），再输入想打开的网址数量，软件会在选定的范围内随机打开指定数量的网址供浏览，每次浏览的网址图标会显示在“开魔盒”按钮下方，再次开魔盒时刷新。此功能方便保存大量书签的朋友查看自己保存的网站历史。<br>    
-    （三）用户可自行设置网址的书签数据、图标文件、历史记录数据、日志文件的文件夹或名称，也可以设置数据自动备份文件夹（书签数据一般在C:\\Users\\用户名\\.url_navigator\\目录下，名称为bookmarks.json，用户可使用设置功能进行更改）。系统有每日自动备份功能，位置可在设置中更改。<br>
-    （四）可导入chrome等浏览器导出的规范HTML格式书签文件（尽量只有一个层级，在一个目录下，否则速度慢且容易出错），也可以使用本软件导出或备份的json格式书签文件（将书签备份文件名称改为bookmarks.json）直接覆盖掉原来的json文件，速度更快）；用户的书签数据可全部或部分导出为json格式和HTML格式。可搜索网址和查看历史记录，在结果中再打开或定位网址位置。<br>
-    （五）可批量全部或部分更新图标（速度较慢），可将网址卡片按照名称和添加时间排序。为防止误操作，可使用'锁定'功能暂时禁用部分功能，再次点击时解锁。<br>
-    （六）软件有语种选择功能，提供部分语言主要操作界面翻译，满足不同语种使用人员的基本使用。<br>
-    （七）本软件为个人开发，产权属于开发者本人（本页所示作者名称为昵称，权利人为昵称对应的实际开发者）。作者许可您一项个人的、可撤销的、不可转让的、非独占地和非商业的合法使用本产品的权利，您不享有本产品的所有权。作者基于本协议对您的授权仅为授权您个人以非商业的目的对于本产品进行使用，任何超出个人使用目的的使用行为都必须另行获得作者本人具体的、单独的、书面的授权，协议未明示授权的其他一切权利仍由我方保留，您在行使该等权利前须另行获得我方的书面许可，同时我方如未行使前述任何权利，并不构成对该权利的放弃。严禁任何单位和个人未经授权将软件（或将项目改头换面）用于营利或非法用途，否则将追究法律责任。<br>
-    （八）本软件为个人开发，开发者不承担任何责任，请用户自行承担使用风险。<br>
-      💖🌹感谢您的使用！欢迎提出宝贵意见！😊 <br>
-      本项目地址：<a href="https://github.com/yihufree/URL-Navigator">https://github.com/yihufree/URL-Navigator</a> <br> </div>"""
-        
+        """显示关于对话框（首次显示时创建，之后复用同一对话框）"""
+        if self._about_dialog is None:
+            self._about_dialog = self._create_about_dialog()
+        else:
+            # 复用时回到内容开头
+            self._about_dialog.text_browser.verticalScrollBar().setValue(0)
+        self._about_dialog.exec_()
+    
+    def _create_about_dialog(self):
+        """创建关于对话框"""
         # 创建自定义对话框以更可靠地控制宽度
         dialog = QDialog(self)
         dialog.setWindowTitle("关于 飞歌网址导航")
@@ -1223,14 +1542,16 @@ class MainWindow(QWidget):
         
         # 添加图标
         icon_label = QLabel()
-        icon_label.setPixmap(QMessageBox.standardIcon(QMessageBox.Information))
+        if MainWindow._about_icon is None:
+            MainWindow._about_icon = QMessageBox.standardIcon(QMessageBox.Information)
+        icon_label.setPixmap(MainWindow._about_icon)
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label)
         
         # 使用QTextBrowser显示HTML内容
         from PyQt5.QtWidgets import QTextBrowser
         text_browser = QTextBrowser()
-        text_browser.setHtml(message)
+        text_browser.setHtml(_ABOUT_HTML)
         text_browser.setOpenExternalLinks(True)
         text_browser.setReadOnly(True)
         
@@ -1249,7 +1570,8 @@ class MainWindow(QWidget):
         buttons.accepted.connect(dialog.accept)
         layout.addWidget(buttons)
         
-        dialog.exec_()
+        dialog.text_browser = text_browser
+        return dialog
     
     def _copy_selected(self):
         """批量复制右侧网格多选的项目"""
@@ -1291,8 +1613,14 @@ class MainWindow(QWidget):
         self.bookmark_grid._cut_selected()
     
     def _save_undo_snapshot(self):
-        # 保存当前数据快照到撤销栈
-        self.undo_stack.append(copy.deepcopy(self.app.data_manager.data))
+        # 保存当前数据快照到撤销栈，快照为压缩后的紧凑JSON，
+        # 序列化和压缩都由C实现完成，占用内存远小于复制出的字典树
+        snapshot = zlib.compress(
+            json.dumps(self.app.data_manager.data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 1)
+        # 数据未变化时与上一个快照共用同一对象，不额外占用内存
+        if self.undo_stack and self.undo_stack[-1] == snapshot:
+            snapshot = self.undo_stack[-1]
+        self.undo_stack.append(snapshot)
         # 限制撤销栈长度，防止内存溢出
         if len(self.undo_stack) > 20:
             self.undo_stack.pop(0)
@@ -1305,14 +1633,13 @@ class MainWindow(QWidget):
             return
             
         if not self.undo_stack:
-            QMessageBox.information(self, "回退", "没有可回退的操作。")
+            self._information("回退", "没有可回退的操作。")
             return
-        reply = QMessageBox.question(self, "回退确认", "确定要撤销上一步操作吗？", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        reply = self._question("回退确认", "确定要撤销上一步操作吗？", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            last_data = self.undo_stack.pop()
-            self.app.data_manager.data = copy.deepcopy(last_data)
+            self.app.data_manager.data = json.loads(zlib.decompress(self.undo_stack.pop()))
             self.app.data_manager.data_changed.emit()
-            QMessageBox.information(self, "回退", "已撤销上一步操作。")
+            self._information("回退", "已撤销上一步操作。")
     
     def _toggle_sort_mode(self):
         """切换排序方式"""
@@ -1327,15 +1654,13 @@ class MainWindow(QWidget):
         """切换锁定状态"""
         self.is_locked = not self.is_locked
         
-        # 更新锁定按钮图标和文字
+        # 更新锁定按钮文字（锁定和解锁使用同一个图标，创建按钮时已设置，无需重复设置）
         if self.is_locked:
-            self.lock_action.setIcon(QIcon(resource_path("resources/icons/lock.ico")))
             self.lock_action.setText("已锁定")
-            QMessageBox.information(self, "锁定状态", "已启用锁定状态，部分编辑功能已禁用。")
+            self._information("锁定状态", "已启用锁定状态，部分编辑功能已禁用。")
         else:
-            self.lock_action.setIcon(QIcon(resource_path("resources/icons/lock.ico")))
             self.lock_action.setText("锁定")
-            QMessageBox.information(self, "锁定状态", "已解除锁定状态，所有功能可正常使用。")
+            self._information("锁定状态", "已解除锁定状态，所有功能可正常使用。")
         
         # 更新按钮启用状态
         self._update_actions_state()
@@ -1351,54 +1676,80 @@ class MainWindow(QWidget):
         if not self.is_locked and hasattr(self, 'bookmark_grid'):
             self.bookmark_grid.refresh()
     
+    @staticmethod
+    def _set_action_enabled(action, enabled):
+        """仅在状态实际变化时设置按钮启用状态，避免多余的变更通知"""
+        if action.isEnabled() != enabled:
+            action.setEnabled(enabled)
+    
     def _update_actions_state(self):
         """根据锁定状态和选择状态更新按钮的启用状态"""
-        # 检查是否有网格选中项
-        has_grid_selection = bool(hasattr(self, 'bookmark_grid') and self.bookmark_grid.selected_items)
-        # 检查是否有文件夹树选中项
-        has_folder_selection = bool(hasattr(self, 'folder_tree') and self.folder_tree.get_selected_path())
-        # 综合判断是否有任何选中项
-        has_selection = has_grid_selection or has_folder_selection
+        # 依赖选择状态的按钮
+        url_count = folder_count = 0
+        if hasattr(self, 'bookmark_grid'):
+            url_count = sum(1 for _, typ in self.bookmark_grid.selected_items if typ == "url")
+            folder_count = len(self.bookmark_grid.selected_items) - url_count
+        self._update_actions_state_counts(url_count, folder_count)
         
-        # 不依赖选择状态的按钮
-        self.add_url_action.setEnabled(not self.is_locked)
-        self.add_folder_action.setEnabled(not self.is_locked)
-        self.import_action.setEnabled(not self.is_locked)
-        self.refresh_icons_action.setEnabled(not self.is_locked)
-        self.undo_action.setEnabled(not self.is_locked)
-        self.export_action.setEnabled(not self.is_locked)
-        self.settings_action.setEnabled(not self.is_locked)
+        # 其余按钮只取决于锁定状态和剪贴板内容，与上次应用的状态相同时无需更新
+        has_clipboard_data = False
+        if hasattr(self, 'bookmark_grid'):
+            has_clipboard_data = bool(getattr(self.bookmark_grid, 'clipboard_data', None)) or \
+                                bool(getattr(self.bookmark_grid, 'cut_data', None))
+        state = (self.is_locked, has_clipboard_data)
+        if state == self._last_action_state:
+            return
+        self._last_action_state = state
         
-        # 依赖选择状态的按钮
-        self.rename_action.setEnabled(has_selection and not self.is_locked)
-        self.delete_action.setEnabled(has_selection and not self.is_locked)
-        self.cut_action.setEnabled(has_selection and not self.is_locked)
-        self.copy_action.setEnabled(has_selection and not self.is_locked)
+        set_enabled = self._set_action_enabled
+        unlocked = not self.is_locked
         
-        # 编辑网址按钮只对单个URL启用
-        is_single_url = (has_grid_selection and len(self.bookmark_grid.selected_items) == 1 
-                         and self.bookmark_grid.selected_items[0][1] == "url")
-        self.edit_url_action.setEnabled(is_single_url and not self.is_locked)
+        # 不依赖选择状态的按钮
+        for action in (self.add_url_action, self.add_folder_action, self.import_action,
+                       self.refresh_icons_action, self.undo_action, self.export_action,
+                       self.settings_action):
+            set_enabled(action, unlocked)
         
         # 打开网站按钮始终可用（锁定和解锁状态下均可用）
-        self.open_url_action.setEnabled(True)
+        set_enabled(self.open_url_action, True)
         
         # 粘贴按钮需要检查剪贴板内容
-        has_clipboard_data = False
-        if hasattr(self, 'bookmark_grid'):
-            has_clipboard_data = (hasattr(self.bookmark_grid, 'clipboard_data') and self.bookmark_grid.clipboard_data is not None and bool(self.bookmark_grid.clipboard_data)) or \
-                                (hasattr(self.bookmark_grid, 'cut_data') and self.bookmark_grid.cut_data is not None and bool(self.bookmark_grid.cut_data))
-        self.paste_action.setEnabled(bool(has_clipboard_data) and not self.is_locked)
+        set_enabled(self.paste_action, has_clipboard_data and unlocked)
         
         # 这些功能在锁定状态下仍可用
-        self.search_action.setEnabled(True)
-        self.sort_action.setEnabled(True)
-        self.about_action.setEnabled(True)
-        self.lock_action.setEnabled(True)
+        for action in (self.search_action, self.sort_action, self.about_action, self.lock_action):
+            set_enabled(action, True)
+    
+    @pyqtSlot(int, int)
+    def _update_actions_state_counts(self, url_count, folder_count):
+        """
+        根据网格选中的网址/文件夹数量更新依赖选择状态的按钮
+        
+        Args:
+            url_count: 选中的网址数量
+            folder_count: 选中的文件夹数量
+        """
+        # 网格无选中项时再检查文件夹树选中项
+        has_selection = bool(url_count or folder_count) or \
+                        bool(hasattr(self, 'folder_tree') and self.folder_tree.get_selected_path())
+        is_single_url = url_count == 1 and folder_count == 0
+        # 与上次应用的选择状态相同时无需更新
+        state = (self.is_locked, has_selection, is_single_url)
+        if state == self._last_selection_state:
+            return
+        self._last_selection_state = state
+        
+        set_enabled = self._set_action_enabled
+        unlocked = not self.is_locked
+        for action in (self.rename_action, self.delete_action, self.cut_action, self.copy_action):
+            set_enabled(action, has_selection and unlocked)
+        
+        # 编辑网址按钮只对单个URL启用
+        set_enabled(self.edit_url_action, is_single_url and unlocked)
     
     def _show_locked_message(self):
         """显示锁定状态提示消息"""
-        QMessageBox.warning(self, "锁定状态", "目前处于编辑锁定状态，如需使用相关功能，请点击锁定按钮进行解锁。")
+        self._warning("锁定状态", "目前处于编辑锁定状态，如需使用相关功能，请点击锁定按钮进行解锁。")
     
     def closeEvent(self, event):
         """处理窗口关闭事件"""
@@ -1407,49 +1758,29 @@ class MainWindow(QWidget):
 
     def update_status_bar(self):
         """更新状态栏信息"""
-        # 统计各级目录数量
-        data = self.app.data_manager.data
-        level_counts = []
-        def count_levels(d, level=1):
-            if len(level_counts) < level:
-                level_counts.append(0)
-            for v in d.values():
-                if v["type"] == "folder":
-                    level_counts[level-1] += 1
-                    count_levels(v["children"], level+1)
-        count_levels(data)
+        data_manager = self.app.data_manager
+        # 统计各级目录数量（数据管理器按数据版本号缓存）
+        level_counts = data_manager.get_level_counts()
         level_info = '，'.join([f'{i+1}级目录{n}个' for i, n in enumerate(level_counts)])
-        # 统计全部网址卡片总数
-        def count_urls(d):
-            cnt = 0
-            for v in d.values():
-                if v["type"] == "url":
-                    cnt += 1
-                elif v["type"] == "folder":
-                    cnt += count_urls(v["children"])
-            return cnt
-        total_urls = count_urls(data)
+        # 统计网址卡片总数（使用文件夹上增量维护的网址数量）
+        total_urls = data_manager.get_total_url_count()
         # 当前文件夹下一级目录和网址卡片数量
         current_path = self.bookmark_grid.current_path if hasattr(self, 'bookmark_grid') else []
-        current_items = self.app.data_manager.get_item_at_path(current_path)
+        current_items = data_manager.get_item_at_path(current_path)
+        # 一次遍历同时统计下一级目录数、网址数和包含所有子目录的网址数
         subdir_count = 0
         url_count = 0
+        nested_url_count = 0
         if current_items:
+            get_folder_counts = data_manager.get_folder_counts
             for v in current_items.values():
-                if v["type"] == "folder":
+                t = v["type"]
+                if t == "folder":
                     subdir_count += 1
-                elif v["type"] == "url":
+                    nested_url_count += get_folder_counts(v)[1]
+                elif t == "url":
                     url_count += 1
-        # 当前文件夹下所有网址卡片数量（递归）
-        def count_urls_in_folder(d):
-            cnt = 0
-            for v in d.values():
-                if v["type"] == "url":
-                    cnt += 1
-                elif v["type"] == "folder":
-                    cnt += count_urls_in_folder(v["children"])
-            return cnt
-        total_urls_in_current = count_urls_in_folder(current_items) if current_items else 0
+        total_urls_in_current = url_count + nested_url_count
         # 状态栏文本
         current_path_str = '/'.join(current_path) if current_path else '根目录'
         text = f'    【 统计信息： 1. {level_info}，全部网址{total_urls}个。    ||  2.当前目录：{current_path_str}，下一级目录{subdir_count}个，网址{url_count}个，包含所有子目录网址{total_urls_in_current}个。】'
@@ -1464,27 +1795,27 @@ class MainWindow(QWidget):
         selected_items = self.bookmark_grid.selected_items
         
         if not selected_items:
-            QMessageBox.information(self, "打开网站", "请先选择要打开的网址")
+            self._information("打开网站", "请先选择要打开的网址")
             return
             
         # 遍历所有选中项目
         opened_count = 0
+        widgets_by_name = getattr(self.bookmark_grid, '_item_widgets_by_name', {})
         for name, item_type in selected_items:
             # 只打开URL类型的项目
             if item_type == "url":
-                # 获取项目数据
-                for w, n, t in self.bookmark_grid._item_widgets:
-                    if n == name and t == item_type:
-                        # 调用项目的_open_url方法
-                        w._open_url()
-                        opened_count += 1
+                # 通过名称索引获取卡片，调用项目的_open_url方法
+                w = widgets_by_name.get(name)
+                if w is not None:
+                    w._open_url()
+                    opened_count += 1
         
         # 显示提示消息
         if opened_count > 0:
             msg = f"已打开 {opened_count} 个网址"
             self.status_bar.showMessage(msg, 3000)
         else:
-            QMessageBox.information(self, "打开网站", "没有选中有效的网址项目")
+            self._information("打开网站", "没有选中有效的网址项目")
 
     def _edit_selected_url(self):
         """编辑选中的网址卡片（仅支持单选且为网址类型）"""
@@ -1492,17 +1823,17 @@ class MainWindow(QWidget):
             self._show_locked_message()
             return
         if not hasattr(self, 'bookmark_grid') or not self.bookmark_grid.selected_items:
-            QMessageBox.information(self, "编辑网址", "请先选择一个网址卡片")
+            self._information("编辑网址", "请先选择一个网址卡片")
             return
         items = self.bookmark_grid.selected_items
         if len(items) != 1 or items[0][1] != 'url':
-            QMessageBox.information(self, "编辑网址", "只能编辑单个网址卡片")
+            self._information("编辑网址", "只能编辑单个网址卡片")
             return
         name, typ = items[0]
         # 获取当前路径下的项目
         current_items = self.app.data_manager.get_item_at_path(self.bookmark_grid.current_path)
         if not current_items or name not in current_items:
-            QMessageBox.warning(self, "编辑网址", "未找到选中的网址")
+            self._warning("编辑网址", "未找到选中的网址")
             return
         item = current_items[name]
         # 复用BookmarkGridWidget._edit_item逻辑
@@ -1649,13 +1980,70 @@ class MainWindow(QWidget):
             # 显示随机选择的网址图标
             self._display_random_url_icons(random_urls)
     
+    def _build_right_panel(self):
+        """创建右侧网站盲盒面板的内容（标签、盲盒按钮和随机网址图标区域）"""
+        self._right_built = True
+        right_layout = QVBoxLayout(self.right_widget)
+        right_layout.setContentsMargins(5, 5, 5, 5)
+        right_layout.setSpacing(10)
+        
+        # 创建"Magic Box 开魔盒"文本标签
+        self.magic_box_label = QLabel("MagicBox\n开魔盒")
+        self.magic_box_label.setAlignment(Qt.AlignCenter)
+        self.magic_box_label.setStyleSheet(_MAGIC_BOX_QSS)
+        # 初始状态隐藏标签
+        self.magic_box_label.hide()
+        
+        # 创建网站盲盒按钮
+        self.blind_box_button = QPushButton()
+        self.blind_box_button.setFixedSize(90, 90)  # 设置为90x90像素的正方形
+        self.blind_box_button.setToolTip(language_manager.tr("tooltips.blind_box_tooltip", "网站盲盒 - 随机打开网站"))
+        self.blind_box_button.clicked.connect(self._show_blind_box_dialog)
+        
+        # 盲盒图片作为按钮图标，缩放后的像素图放入QPixmapCache共享
+        manghe_pixmap = QPixmapCache.find("manghe60")
+        if manghe_pixmap is None:
+            manghe_pixmap = QPixmap(ICON_PATHS["manghe.png"]).scaled(
+                60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert("manghe60", manghe_pixmap)
+        self.blind_box_button.setIcon(QIcon(manghe_pixmap))
+        self.blind_box_button.setIconSize(QtCore.QSize(60, 60))
+        
+        # 设置圆形按钮样式
+        self.blind_box_button.setStyleSheet(_BLIND_BOX_QSS)
+        
+        # 创建随机网址图标显示区域
+        self.random_urls_scroll = QScrollArea()
+        self.random_urls_scroll.setWidgetResizable(True)
+        self.random_urls_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.random_urls_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.random_urls_scroll.setStyleSheet(_RANDOM_URLS_QSS)
+        
+        # 创建图标容器
+        self.random_urls_container = QWidget()
+        self.random_urls_layout = QVBoxLayout(self.random_urls_container)
+        self.random_urls_layout.setAlignment(Qt.AlignTop)
+        self.random_urls_layout.setContentsMargins(3, 3, 3, 3)
+        self.random_urls_layout.setSpacing(5)
+        self.random_urls_scroll.setWidget(self.random_urls_container)
+        
+        # 添加标签、按钮和图标显示区域到右侧布局
+        # 使"Magic Box 开魔盒"标签上方与左侧网址标签区域边框在同一水平线上
+        right_layout.addWidget(self.magic_box_label, 0, Qt.AlignCenter)
+        # 为两行文字标签和按钮之间增加间距
+        right_layout.addSpacing(10)
+        right_layout.addWidget(self.blind_box_button, 0, Qt.AlignCenter)
+        # 为"网站盲盒"按钮的动画运动预留空间
+        right_layout.addSpacing(20)  # 增加按钮与图标显示框之间的间距
+        right_layout.addWidget(self.random_urls_scroll, 3)  # 增加权重，使其占据更多空间
+    
     def _update_blind_box_button_visibility(self):
         """更新网站盲盒按钮和标签的显示状态"""
-        if hasattr(self, 'blind_box_button'):
-            # 始终显示按钮和标签（修改为程序首次打开时即显示）
-            self.blind_box_button.show()
-            if hasattr(self, 'magic_box_label'):
-                self.magic_box_label.show()
+        # 始终显示按钮和标签（修改为程序首次打开时即显示）
+        if not self._right_built:
+            self._build_right_panel()
+        self.blind_box_button.show()
+        self.magic_box_label.show()
     
     def _display_random_url_icons(self, random_urls):
         """显示随机选择的网址图标
@@ -1694,7 +2082,7 @@ class MainWindow(QWidget):
             icon_button.setIconSize(QtCore.QSize(50, 50))
             
             # 先设置加载中的占位符图标
-            loading_icon = QIcon(resource_path("resources/icons/globe.png"))
+            loading_icon = self._icon("globe.png")
             icon_button.setIcon(loading_icon)
             
             # 获取网址图标
@@ -1708,14 +2096,14 @@ class MainWindow(QWidget):
                         icon_button.setIcon(favicon_icon)
                     else:
                         # 图标无效，使用默认图标
-                        icon_button.setIcon(QIcon(resource_path("resources/icons/globe.png")))
+                        icon_button.setIcon(self._icon("globe.png"))
                 except Exception as e:
                     # 图标加载失败，使用默认图标
                     logger.warning(f"图标加载失败: {icon_path}, 错误: {e}")
-                    icon_button.setIcon(QIcon(resource_path("resources/icons/globe.png")))
+                    icon_button.setIcon(self._icon("globe.png"))
             else:
                 # 没有找到图标，使用默认图标
-                icon_button.setIcon(QIcon(resource_path("resources/icons/globe.png")))
+                icon_button.setIcon(self._icon("globe.png"))
             
             # 设置按钮样式（适应60x60大小）
             icon_button.setStyleSheet("""
@@ -1782,13 +2170,13 @@ class MainWindow(QWidget):
         menu = QMenu(self)
         
         # 在浏览器中打开
-        open_action = QAction(QIcon(resource_path("resources/icons/open.png")), 
+        open_action = QAction(self._icon("open.png"), 
                              language_manager.tr("context_menu.open_in_browser", "在浏览器中打开"), self)
         open_action.triggered.connect(lambda: self._open_url(url))
         menu.addAction(open_action)
         
         # 在默认浏览器中打开
-        open_default_action = QAction(QIcon(resource_path("resources/icons/globe.png")), 
+        open_default_action = QAction(self._icon("globe.png"), 
                                      language_manager.tr("context_menu.open_in_default_browser", "在默认浏览器中打开"), self)
         open_default_action.triggered.connect(lambda: self._open_url_in_default_browser(url))
         menu.addAction(open_default_action)
@@ -1797,7 +2185,7 @@ class MainWindow(QWidget):
         menu.addSeparator()
         
         # 定位到网址标签
-        locate_action = QAction(QIcon(resource_path("resources/icons/search.png")), 
+        locate_action = QAction(self._icon("search.png"), 
                                "定位到网址标签", self)
         locate_action.triggered.connect(lambda: self._locate_url_in_grid(url, name))
         menu.addAction(locate_action)
@@ -1930,8 +2318,7 @@ class MainWindow(QWidget):
                 search_in_data(data)
             
             if not found_item or found_path is None:
-                from PyQt5.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "定位失败", f"未找到网址 '{name}' 在数据中的位置")
+                self._warning("定位失败", f"未找到网址 '{name}' 在数据中的位置")
                 return
             
             # 切换目录树和卡片区
@@ -1944,38 +2331,34 @@ class MainWindow(QWidget):
                 self.bookmark_grid.selected_items = [(found_item.get('name', name), 'url')]
                 self.bookmark_grid.refresh()
                 
-                # 滚动到目标卡片
-                for w, n, t in getattr(self.bookmark_grid, '_item_widgets', []):
-                    if n == found_item.get('name', name):
-                        w.set_selected(True)
-                        if hasattr(self.bookmark_grid, 'ensureWidgetVisible'):
-                            self.bookmark_grid.ensureWidgetVisible(w)
-                        else:
-                            # 尝试用scrollArea滚动
-                            try:
-                                grid = self.bookmark_grid
-                                area = grid.viewport().parent()
-                                rect = w.geometry()
-                                area.ensureVisible(rect.x(), rect.y(), rect.width(), rect.height())
-                            except Exception:
-                                pass
-                        break
+                # 通过名称索引找到目标卡片并滚动到该卡片
+                w = getattr(self.bookmark_grid, '_item_widgets_by_name', {}).get(found_item.get('name', name))
+                if w is not None:
+                    w.set_selected(True)
+                    if hasattr(self.bookmark_grid, 'ensureWidgetVisible'):
+                        self.bookmark_grid.ensureWidgetVisible(w)
+                    else:
+                        # 尝试用scrollArea滚动
+                        try:
+                            grid = self.bookmark_grid
+                            area = grid.viewport().parent()
+                            rect = w.geometry()
+                            area.ensureVisible(rect.x(), rect.y(), rect.width(), rect.height())
+                        except Exception:
+                            pass
                 
                 # 使主界面获得焦点
                 self.activateWindow()
                 self.raise_()
                 
                 # 提示成功
-                from PyQt5.QtWidgets import QMessageBox
-                QMessageBox.information(self, "定位成功", f"已定位到：{found_item.get('name', name)}")
+                self._information("定位成功", f"已定位到：{found_item.get('name', name)}")
             else:
-                from PyQt5.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "定位失败", "无法访问主界面组件，定位失败")
+                self._warning("定位失败", "无法访问主界面组件，定位失败")
                 
         except Exception as e:
             logger.error(f"定位网址失败: {e}")
-            from PyQt5.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "定位失败", f"定位过程中发生错误: {str(e)}")
+            self._warning("定位失败", f"定位过程中发生错误: {str(e)}")
     
     def _create_history_button(self, layout):
         """创建历史记录按钮
@@ -2084,8 +2467,7 @@ class MainWindow(QWidget):
             
         except Exception as e:
             logger.error(f"显示历史记录对话框失败: {e}")
-            QMessageBox.warning(
-                self,
+            self._warning(
                 "错误",
                 f"显示历史记录失败: {e}"
             )
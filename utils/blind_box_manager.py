@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import sys
 import logging
 import random
 import json
 import os
 from datetime import datetime
+from collections import Counter
 from PyQt5.QtWidgets import QMessageBox
 from utils.language_manager import language_manager
+from utils.json_utils import strip_private_keys
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,7 @@ class BlindBoxManager:
             self.history_file = "blind_box_history.json"  # 兼容旧版本
             
         self.max_history_count = 100  # 历史记录数量上限
+        self._history_snapshot = None  # 历史记录只读快照，修改后失效
         self._load_history()
     
     def collect_all_urls(self, path=None):
@@ -150,21 +154,39 @@ class BlindBoxManager:
     
     def _load_history(self):
         """加载历史记录"""
+        self._history_snapshot = None
         try:
             if os.path.exists(self.history_file):
                 with open(self.history_file, 'r', encoding='utf-8') as f:
                     self.history = json.load(f)
+                for record in self.history:
+                    self._index_history_record(record)
             else:
                 self.history = []
         except Exception as e:
             logger.error(f"加载历史记录失败: {e}")
             self.history = []
     
+    @staticmethod
+    def _index_history_record(record):
+        """为历史记录生成驻留的路径键（已拼接的位置字符串），并驻留名称
+        
+        以下划线开头的字段只在内存中使用，保存时会去除
+        """
+        path = record.get('path', [])
+        path_key = path if isinstance(path, str) else '/'.join(path)
+        record['_path_key'] = sys.intern(path_key)
+        name = record.get('name')
+        if isinstance(name, str):
+            record['name'] = sys.intern(name)
+    
     def _save_history(self):
         """保存历史记录"""
+        # 历史记录的每次修改都会保存，在此使快照失效
+        self._history_snapshot = None
         try:
             with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, ensure_ascii=False, indent=2)
+                json.dump(strip_private_keys(self.history), f, ensure_ascii=False, indent=2)
         except Exception as e:
             logger.error(f"保存历史记录失败: {e}")
     
@@ -188,6 +210,7 @@ class BlindBoxManager:
                     'icon': icon,
                     'timestamp': timestamp
                 }
+                self._index_history_record(history_item)
                 
                 # 添加到历史记录开头
                 self.history.insert(0, history_item)
@@ -225,9 +248,11 @@ class BlindBoxManager:
         """获取历史记录
         
         Returns:
-            历史记录列表
+            历史记录元组（按时间从新到旧的只读快照，修改前重复获取时直接复用）
         """
-        return self.history.copy()
+        if self._history_snapshot is None:
+            self._history_snapshot = tuple(self.history)
+        return self._history_snapshot
     
     def remove_history_item(self, item):
         """删除单个历史记录项
@@ -257,6 +282,38 @@ class BlindBoxManager:
         
         return False
     
+    def remove_history_items(self, items):
+        """批量删除历史记录项，只遍历和保存一次
+        
+        Args:
+            items: 要删除的历史记录项列表
+            
+        Returns:
+            int: 实际删除的数量
+        """
+        try:
+            # 按关键字段计数匹配，同一记录选中多次时只删除相应次数
+            pending = Counter(
+                (item.get('url'), item.get('name'), item.get('timestamp'))
+                for item in items
+            )
+            kept = []
+            removed = 0
+            for record in self.history:
+                key = (record.get('url'), record.get('name'), record.get('timestamp'))
+                if pending.get(key):
+                    pending[key] -= 1
+                    removed += 1
+                else:
+                    kept.append(record)
+            if removed:
+                self.history = kept
+                self._save_history()
+            return removed
+        except Exception as e:
+            logger.error(f"批量删除历史记录失败: {e}")
+            return 0
+    
     def clear_history(self):
         """清空所有历史记录"""
         try:
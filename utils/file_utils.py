@@ -122,6 +122,48 @@ def copy_file(src, dst, overwrite=False):
         logger.error(f"复制文件失败: {e}")
         return False
 
+def fast_copy_file(src, dst):
+    """
+    使用系统内核的复制接口复制文件，并保留时间戳等元数据（同 shutil.copy2）
+    
+    Windows 下调用 CopyFileW，其他平台使用 sendfile 在内核中复制，
+    不支持时回退为 1MB 缓冲区的普通复制。出错时抛出 OSError。
+    
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+        
+    Returns:
+        目标文件路径
+    """
+    if os.name == 'nt':
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            return dst
+        logger.warning(f"CopyFileW 复制失败，改用普通复制: {src}")
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = False
+        if hasattr(os, 'sendfile'):
+            try:
+                offset = 0
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                copied = True
+            except OSError as e:
+                logger.debug(f"sendfile 复制失败，改用普通复制: {e}")
+                fdst.seek(0)
+                fdst.truncate()
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    shutil.copystat(src, dst)
+    return dst
+
 def move_file(src, dst, overwrite=False):
     """
     移动文件
@@ -102,6 +102,27 @@ def _simple_validate(data):
         logger.error(f"简化验证过程发生错误: {e}")
         return False, f"验证过程发生错误: {str(e)}"
 
+def strip_private_keys(data):
+    """
+    复制书签数据并去除以下划线开头的内部字段（如文件夹统计信息）
+    
+    Args:
+        data: 书签数据字典
+        
+    Returns:
+        不含内部字段的数据副本
+    """
+    if isinstance(data, dict):
+        # 书签/文件夹名称也可能以下划线开头，其值为字典，需保留
+        return {
+            key: strip_private_keys(value)
+            for key, value in data.items()
+            if not (isinstance(key, str) and key.startswith("_") and not isinstance(value, dict))
+        }
+    if isinstance(data, list):
+        return [strip_private_keys(value) for value in data]
+    return data
+
 def safe_json_load(content, default_value=None):
     """
     安全地解析JSON字符串
@@ -18,10 +18,15 @@ class LanguageManager(QObject):
     # 语言切换信号
     language_changed = pyqtSignal(str)
     
+    # 翻译结果缓存的最大条目数
+    TR_CACHE_SIZE = 2048
+    
     def __init__(self):
         super().__init__()
         self.current_language = "zh"  # 默认中文
         self.translations = {}
+        # 翻译结果缓存 {(key, default_text): 文本}，加载语言文件时清空
+        self._tr_cache = {}
         self.available_languages = {
             "zh": "中文",
             "en": "English", 
@@ -43,6 +48,7 @@ class LanguageManager(QObject):
     
     def load_language(self, language_code):
         """加载指定语言文件"""
+        self._tr_cache.clear()
         try:
             # 使用 path_utils 获取正确的语言文件路径
             from .path_utils import get_language_file_path
@@ -73,7 +79,17 @@ class LanguageManager(QObject):
                 logger.info(f"语言已切换: {old_language} -> {language_code}")
     
     def tr(self, key, default_text=None):
-        """翻译文本"""
+        """翻译文本（结果按当前语言缓存）"""
+        cache_key = (key, default_text)
+        text = self._tr_cache.get(cache_key)
+        if text is None:
+            if len(self._tr_cache) >= self.TR_CACHE_SIZE:
+                self._tr_cache.clear()
+            text = self._tr_cache[cache_key] = self._lookup(key, default_text)
+        return text
+    
+    def _lookup(self, key, default_text=None):
+        """在当前语言的翻译中查找文本"""
         # 处理嵌套键（如 "main_window.add_url"）
         if "." in key:
             keys = key.split(".")
@@ -95,6 +111,26 @@ class LanguageManager(QObject):
             # 如果没有找到翻译，返回key本身
             return key
     
+    def tr_namespace(self, namespace):
+        """
+        一次取出某个命名空间下的全部翻译文本
+        
+        Args:
+            namespace: 命名空间（如 "main_window"）
+            
+        Returns:
+            {子键: 翻译文本} 字典，命名空间不存在时返回空字典
+        """
+        current = self.translations
+        for k in namespace.split("."):
+            if isinstance(current, dict) and k in current:
+                current = current[k]
+            else:
+                return {}
+        if not isinstance(current, dict):
+            return {}
+        return {k: v for k, v in current.items() if not isinstance(v, dict)}
+    
     def get_language_name(self, language_code):
         """获取语言显示名称"""
         return self.available_languages.get(language_code, language_code)
@@ -38,4 +38,20 @@ def get_language_file_path(language_code):
     Returns:
         str: 语言文件的绝对路径
     """
-    return get_resource_path(os.path.join("languages", f"{language_code}.json"))
\ No newline at end of file
+    return get_resource_path(os.path.join("languages", f"{language_code}.json"))
+
+
+def is_subpath(path, prefix):
+    """
+    判断书签文件夹路径是否等于指定路径或位于其下级
+    
+    Args:
+        path (list|tuple): 待检查的文件夹路径
+        prefix (list|tuple): 上级文件夹路径
+        
+    Returns:
+        bool: path 以 prefix 开头时返回 True
+    """
+    path = tuple(path)
+    prefix = tuple(prefix)
+    return len(path) >= len(prefix) and path[:len(prefix)] == prefix